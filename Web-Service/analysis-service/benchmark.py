@@ -0,0 +1,388 @@
+"""
+Filter Throughput Benchmark
+Measures frames/sec, peak memory and scaling exponent for every FilterFactory
+entry, the adaptive filters and the standard filter chains on synthetic
+63-channel landmark signals.
+
+Usage:
+    python benchmark.py --output bench.json
+    python benchmark.py --filters butterworth chain:default --fps 30 --compare bench.json
+"""
+
+# Standard library imports
+import argparse
+import inspect
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+import warnings
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Third-party imports
+import numpy as np
+import scipy
+
+# Local imports
+from config import LANDMARK_NAMES, MAX_RECORDING_DURATION, MIN_RECORDING_DURATION
+from data_handling import (
+    AdaptiveButterworthFilter,
+    AdaptiveEMAFilter,
+    AdaptiveFilterChain,
+    AdaptiveGaussianFilter,
+    AdaptiveKalmanFilter,
+    AdaptiveSavitzkyGolayFilter,
+    FilterFactory,
+    WienerFilter,
+)
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+BENCHMARK_DURATIONS = (MIN_RECORDING_DURATION, 30, 60, 120, MAX_RECORDING_DURATION)
+BENCHMARK_FPS = (30, 60, 120)
+BENCHMARK_SEED = 42
+N_CHANNELS = len(LANDMARK_NAMES) * 3  # x, y, z per landmark
+
+ADAPTIVE_FILTERS = {
+    'adaptive_gaussian': AdaptiveGaussianFilter,
+    'adaptive_ema': AdaptiveEMAFilter,
+    'adaptive_savgol': AdaptiveSavitzkyGolayFilter,
+    'adaptive_kalman': AdaptiveKalmanFilter,
+    'adaptive_butterworth': AdaptiveButterworthFilter,
+    'wiener': WienerFilter,
+}
+
+# Constructor overrides so every case does real work at landmark frame rates:
+# the 50 Hz notch default is above Nyquist at 30 fps, and an empty keep_nodes
+# list makes the wavelet packet filter a copy of its input
+FILTER_PARAMS: Dict[str, Dict] = {
+    'notch': {'freq': 10.0},
+    'wavelet_packet': {'keep_nodes': ['aaa', 'aad', 'ada', 'add']},  # Lower half of the band
+}
+
+CHAIN_BUILDERS: Dict[str, Callable[[float], object]] = {
+    'chain:default': lambda fs: FilterFactory.create_default_chain(fs=fs),
+    'chain:default_compiled': lambda fs: FilterFactory.create_default_chain(fs=fs).compile(),
+    'chain:tremor': lambda fs: FilterFactory.create_tremor_chain(fs=fs),
+    'chain:adaptive': lambda fs: AdaptiveFilterChain(fs=fs),
+}
+
+
+# =============================================================================
+# RESULT TYPES
+# =============================================================================
+
+@dataclass
+class BenchmarkCase:
+    """Timing of one filter at one duration and frame rate"""
+    name: str
+    kind: str  # 'filter', 'adaptive' or 'chain'
+    fps: int
+    duration_s: float
+    n_frames: int
+    n_channels: int
+    seconds: Optional[float] = None  # Best of `repeat` runs
+    frames_per_sec: Optional[float] = None
+    peak_memory_bytes: Optional[int] = None
+    skipped: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class ScalingFit:
+    """Power-law fit seconds ~ n_frames ** exponent for one filter and fps"""
+    name: str
+    fps: int
+    exponent: float
+    n_points: int
+
+
+# =============================================================================
+# SYNTHETIC DATA
+# =============================================================================
+
+def make_landmark_signal(
+    duration_s: float,
+    fps: float,
+    n_channels: int = N_CHANNELS,
+    seed: int = BENCHMARK_SEED
+) -> np.ndarray:
+    """
+    Synthetic landmark coordinates (n_frames, n_channels).
+
+    Each channel mixes slow voluntary motion (0.2-2 Hz), a small tremor
+    component (4-8 Hz), measurement noise and sparse tracking spikes, in
+    normalized image coordinates. A fixed seed makes runs comparable.
+    """
+    rng = np.random.default_rng(seed)
+    n_frames = int(round(duration_s * fps))
+    t = np.arange(n_frames)[:, np.newaxis] / fps
+
+    base = rng.uniform(0.3, 0.7, n_channels)
+    motion = sum(
+        rng.uniform(0.01, 0.08, n_channels) * np.sin(
+            2 * np.pi * rng.uniform(0.2, 2.0, n_channels) * t + rng.uniform(0, 2 * np.pi, n_channels)
+        )
+        for _ in range(3)
+    )
+    tremor = rng.uniform(0.0, 0.005, n_channels) * np.sin(
+        2 * np.pi * rng.uniform(4.0, 8.0, n_channels) * t
+    )
+    noise = rng.normal(0.0, 0.002, (n_frames, n_channels))
+
+    data = base + motion + tremor + noise
+    spikes = rng.random((n_frames, n_channels)) < 0.002
+    data[spikes] += rng.normal(0.0, 0.05, spikes.sum())
+    return data
+
+
+# =============================================================================
+# BENCHMARK RUNNER
+# =============================================================================
+
+def available_benchmarks() -> Dict[str, str]:
+    """Benchmark name -> kind, in run order"""
+    names = {name: 'filter' for name in FilterFactory.FILTER_MAP}
+    names.update({name: 'adaptive' for name in ADAPTIVE_FILTERS})
+    names.update({name: 'chain' for name in CHAIN_BUILDERS})
+    return names
+
+
+def _build(name: str, kind: str, fs: float):
+    """Fresh instance of a benchmark target, at the recording's fs"""
+    if kind == 'chain':
+        return CHAIN_BUILDERS[name](fs)
+
+    cls = FilterFactory.FILTER_MAP[name] if kind == 'filter' else ADAPTIVE_FILTERS[name]
+    params = dict(FILTER_PARAMS.get(name, {}))
+    if 'fs' in inspect.signature(cls).parameters:
+        params['fs'] = fs
+    return cls(**params)
+
+
+def _time_apply(name: str, kind: str, fs: float, data: np.ndarray, repeat: int) -> float:
+    """Best wall time of `repeat` apply() calls, each on a fresh instance"""
+    best = float('inf')
+    for _ in range(repeat):
+        target = _build(name, kind, fs)
+        start = time.perf_counter()
+        target.apply(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(name: str, kind: str, fs: float, data: np.ndarray) -> int:
+    """Peak bytes allocated during one apply() (separate, untimed run)"""
+    target = _build(name, kind, fs)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        target.apply(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def fit_scaling(cases: Sequence[BenchmarkCase]) -> List[ScalingFit]:
+    """Least-squares slope of log(seconds) against log(n_frames)"""
+    grouped: Dict[tuple, List[BenchmarkCase]] = {}
+    for case in cases:
+        if case.seconds:
+            grouped.setdefault((case.name, case.fps), []).append(case)
+
+    fits = []
+    for (name, fps), group in grouped.items():
+        frames = np.log([c.n_frames for c in group])
+        seconds = np.log([c.seconds for c in group])
+        if len(group) < 2 or np.ptp(frames) == 0:
+            continue
+        exponent = float(np.polyfit(frames, seconds, 1)[0])
+        fits.append(ScalingFit(name=name, fps=fps, exponent=round(exponent, 3), n_points=len(group)))
+    return fits
+
+
+def run_benchmark(
+    names: Optional[Sequence[str]] = None,
+    durations: Sequence[float] = BENCHMARK_DURATIONS,
+    fps_values: Sequence[int] = BENCHMARK_FPS,
+    repeat: int = 3,
+    time_budget: float = 10.0,
+    measure_memory: bool = True,
+    seed: int = BENCHMARK_SEED
+) -> Dict:
+    """
+    Run the benchmark grid and return a JSON-ready result.
+
+    Args:
+        names: Benchmarks to run (default: every filter, adaptive filter and chain)
+        durations: Recording durations in seconds, clamped to the supported range
+        fps_values: Frame rates
+        repeat: Timed runs per case; the best is reported
+        time_budget: Once a case takes longer than this (seconds), longer
+            durations of the same filter and fps are marked skipped
+        measure_memory: Also record tracemalloc peak per case
+        seed: Synthetic data seed
+
+    Returns:
+        Dict with 'metadata', 'cases' and 'scaling'
+    """
+    catalog = available_benchmarks()
+    names = list(names) if names else list(catalog)
+    unknown = [n for n in names if n not in catalog]
+    if unknown:
+        raise ValueError(f"Unknown benchmark: {unknown}. Choose from {list(catalog)}")
+
+    durations = sorted({
+        float(min(max(d, MIN_RECORDING_DURATION), MAX_RECORDING_DURATION)) for d in durations
+    })
+
+    cases: List[BenchmarkCase] = []
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        for fps in fps_values:
+            signals = {d: make_landmark_signal(d, fps, seed=seed) for d in durations}
+
+            for name in names:
+                kind = catalog[name]
+                over_budget = False
+
+                for duration in durations:
+                    data = signals[duration]
+                    case = BenchmarkCase(
+                        name=name, kind=kind, fps=fps, duration_s=duration,
+                        n_frames=data.shape[0], n_channels=data.shape[1]
+                    )
+                    if over_budget:
+                        case.skipped = True
+                        cases.append(case)
+                        continue
+
+                    try:
+                        case.seconds = _time_apply(name, kind, fps, data, repeat)
+                        case.frames_per_sec = round(case.n_frames / case.seconds, 1)
+                        if measure_memory:
+                            case.peak_memory_bytes = _peak_memory(name, kind, fps, data)
+                    except Exception as e:
+                        case.error = f"{type(e).__name__}: {e}"
+
+                    over_budget = case.error is not None or (case.seconds or 0) > time_budget
+                    cases.append(case)
+
+    return {
+        'metadata': _metadata(repeat, seed),
+        'cases': [asdict(c) for c in cases],
+        'scaling': [asdict(f) for f in fit_scaling(cases)],
+    }
+
+
+def _metadata(repeat: int, seed: int) -> Dict:
+    """Environment details needed to compare runs across commits"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+            cwd=Path(__file__).resolve().parent, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'n_channels': N_CHANNELS,
+        'repeat': repeat,
+        'seed': seed,
+        'filter_params': FILTER_PARAMS,
+    }
+
+
+def compare_results(baseline: Dict, current: Dict) -> List[Dict]:
+    """
+    Per-case speedup of `current` over `baseline` (> 1 = faster).
+
+    Cases are matched on (name, fps, n_frames); unmatched or failed cases
+    are left out.
+    """
+    def index(result):
+        return {
+            (c['name'], c['fps'], c['n_frames']): c
+            for c in result['cases'] if c.get('seconds')
+        }
+
+    base = index(baseline)
+    rows = []
+    for key, case in index(current).items():
+        if key in base:
+            rows.append({
+                'name': key[0],
+                'fps': key[1],
+                'n_frames': key[2],
+                'baseline_seconds': base[key]['seconds'],
+                'seconds': case['seconds'],
+                'speedup': round(base[key]['seconds'] / case['seconds'], 3),
+            })
+    return rows
+
+
+# =============================================================================
+# CLI ENTRY POINT
+# =============================================================================
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description='Filter throughput benchmark')
+    parser.add_argument('--filters', nargs='+', help='Benchmarks to run (default: all)')
+    parser.add_argument('--durations', nargs='+', type=float, default=list(BENCHMARK_DURATIONS),
+                        help='Recording durations in seconds')
+    parser.add_argument('--fps', nargs='+', type=int, default=list(BENCHMARK_FPS), help='Frame rates')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case')
+    parser.add_argument('--time-budget', type=float, default=10.0,
+                        help='Skip longer durations once a case exceeds this many seconds')
+    parser.add_argument('--no-memory', action='store_true', help='Skip peak memory measurement')
+    parser.add_argument('--output', help='Write results JSON to this file')
+    parser.add_argument('--compare', help='Baseline results JSON to compare against')
+    parser.add_argument('--list', action='store_true', help='List benchmark names and exit')
+
+    args = parser.parse_args()
+
+    if args.list:
+        print(json.dumps(available_benchmarks(), indent=2))
+        return
+
+    result = run_benchmark(
+        names=args.filters,
+        durations=args.durations,
+        fps_values=args.fps,
+        repeat=args.repeat,
+        time_budget=args.time_budget,
+        measure_memory=not args.no_memory,
+    )
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            result['comparison'] = compare_results(json.load(f), result)
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,21 +5,33 @@ Consolidated from: filters.py, filters_adaptive.py, normalizer.py, outlier_detec
 """
 
 # Standard library imports
+import hashlib
+import os
+import threading
+import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 # Third-party imports
 import numpy as np
 import pandas as pd
 import pywt
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import ndimage, signal, stats
+from scipy.fft import next_fast_len
+from scipy.interpolate import CubicSpline, PchipInterpolator
 from scipy.ndimage import gaussian_filter1d, median_filter
 from scipy.stats import median_abs_deviation
 from statsmodels.nonparametric.smoothers_lowess import lowess
 
 # Local imports
-from config import FilterConfig, ThresholdConfig, DEFAULT_FPS
+from config import (
+    FilterConfig, ThresholdConfig, DEFAULT_FPS, SEQUENCE_LENGTH,
+    LANDMARK_NAMES, FINGERTIP_INDICES, FINGER_LANDMARKS
+)
+from segments import LabelSegments, run_length_segments
 
 
 # =============================================================================
@@ -52,7 +64,415 @@ class BaseFilter(ABC):
 # FREQUENCY-DOMAIN FILTERS
 # =============================================================================
 
-class ButterworthFilter(BaseFilter):
+class FilterDesignCache:
+    """
+    Process-wide cache of IIR filter designs in second-order-section form.
+
+    Designs are keyed by (family, btype, cutoff, fs, order, ripple) so that
+    every filter instance built per request reuses the same coefficients.
+    Returned arrays are shared between instances and must not be modified.
+    """
+
+    def __init__(self):
+        self._designs: Dict[Tuple, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_sos(
+        self,
+        family: str,
+        cutoff,
+        fs: float,
+        order: int,
+        ripple=None,
+        btype: str = 'low'
+    ) -> np.ndarray:
+        """
+        Get (or design and cache) second-order sections.
+
+        Args:
+            family: 'butter', 'cheby1', 'bessel', 'ellip' or 'notch'
+            cutoff: Cutoff frequency in Hz, or (low, high) for band filters
+            fs: Sampling frequency (Hz)
+            order: Filter order (ignored for 'notch')
+            ripple: 'cheby1': passband ripple (dB); 'ellip': (rp, rs);
+                'notch': quality factor
+            btype: 'low', 'high', 'band' or 'bandstop'
+        """
+        if np.ndim(cutoff) > 0:
+            cutoff = tuple(float(c) for c in cutoff)
+        else:
+            cutoff = float(cutoff)
+        if np.ndim(ripple) > 0:
+            ripple = tuple(float(r) for r in ripple)
+
+        key = (family, btype, cutoff, float(fs), int(order), ripple)
+
+        with self._lock:
+            sos = self._designs.get(key)
+            if sos is not None:
+                self.hits += 1
+                return sos
+            self.misses += 1
+
+        sos = self._design(family, cutoff, fs, order, ripple, btype)
+
+        with self._lock:
+            return self._designs.setdefault(key, sos)
+
+    def _design(self, family, cutoff, fs, order, ripple, btype) -> np.ndarray:
+        """Design second-order sections for one cache key"""
+        if family == 'butter':
+            return signal.butter(order, cutoff, btype=btype, fs=fs, output='sos')
+        if family == 'cheby1':
+            return signal.cheby1(order, ripple, cutoff, btype=btype, fs=fs, output='sos')
+        if family == 'bessel':
+            return signal.bessel(order, cutoff, btype=btype, norm='phase', fs=fs, output='sos')
+        if family == 'ellip':
+            rp, rs = ripple
+            return signal.ellip(order, rp, rs, cutoff, btype=btype, fs=fs, output='sos')
+        if family == 'notch':
+            b, a = signal.iirnotch(cutoff, ripple, fs=fs)
+            return signal.tf2sos(b, a)
+        raise ValueError(f"Unknown filter family: {family}")
+
+    def stats(self) -> Dict:
+        """Get cache size and hit/miss counters"""
+        with self._lock:
+            return {'size': len(self._designs), 'hits': self.hits, 'misses': self.misses}
+
+    def clear(self):
+        """Drop all cached designs and reset counters"""
+        with self._lock:
+            self._designs.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared by every frequency-domain filter in the process
+FILTER_DESIGN_CACHE = FilterDesignCache()
+
+
+def _signal_digest(data: np.ndarray) -> str:
+    """Content digest of an array (dtype, shape and samples)"""
+    data = np.ascontiguousarray(data)
+    digest = hashlib.blake2b(data.view(np.uint8), digest_size=16)
+    digest.update(f"{data.dtype.str}{data.shape}".encode())
+    return digest.hexdigest()
+
+
+class PeriodEstimator:
+    """
+    Process-wide dominant frequency/period estimator with a per-signal cache.
+
+    All channels are transformed in one batched real FFT (O(n log n) per
+    channel):
+    - 'spectral': peak of the power spectrum above a band edge
+    - 'autocorrelation': first autocorrelation peak after the first zero
+      crossing that reaches 90% of the highest one (parabolic sub-sample
+      refinement); the autocorrelation comes from the zero-padded power
+      spectrum (Wiener-Khinchin)
+
+    Estimates are cached per channel, keyed by signal content and the
+    estimation settings, so callers asking about the same signal share
+    one transform.
+    """
+
+    METHODS = ('spectral', 'autocorrelation')
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Args:
+            max_entries: Cached estimates kept (oldest dropped first)
+        """
+        self.max_entries = max_entries
+        self._estimates: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def frequencies(
+        self,
+        data: np.ndarray,
+        fs: float,
+        method: str = 'spectral',
+        min_freq: float = 0.0,
+        min_samples: int = 10
+    ) -> Union[float, np.ndarray]:
+        """
+        Dominant frequency (Hz) of every channel.
+
+        Args:
+            data: (n_samples,) or (n_samples, n_channels)
+            fs: Sampling frequency (Hz)
+            method: 'spectral' or 'autocorrelation'
+            min_freq: Lowest frequency considered. 'spectral' starts the
+                search at bin int(min_freq * n_bins / (fs / 2)), or at bin 1
+                (DC excluded) when 0
+            min_samples: Shorter signals give NaN
+
+        Returns:
+            float for 1D input, (n_channels,) array otherwise; NaN where
+            no dominant frequency is found (e.g. 'autocorrelation' on an
+            aperiodic signal)
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method: {method}. Choose from {list(self.METHODS)}")
+
+        data = np.asarray(data, dtype=float)
+        rows = np.ascontiguousarray(data.reshape(len(data), -1).T)
+        n_channels, n = rows.shape
+        result = np.full(n_channels, np.nan)
+
+        if n >= min_samples and n_channels:
+            settings = (method, float(fs), float(min_freq), n)
+            keys = [settings + (_signal_digest(row),) for row in rows]
+
+            with self._lock:
+                cached = [self._estimates.get(key) for key in keys]
+                missing = [i for i, value in enumerate(cached) if value is None]
+                self.hits += n_channels - len(missing)
+                self.misses += len(missing)
+
+            for i, value in enumerate(cached):
+                if value is not None:
+                    result[i] = value
+            if missing:
+                estimate = self._spectral if method == 'spectral' else self._autocorrelation
+                computed = estimate(rows[missing], fs, min_freq)
+                result[missing] = computed
+                self._store([keys[i] for i in missing], computed)
+
+        return float(result[0]) if data.ndim == 1 else result
+
+    def periods(self, data: np.ndarray, fs: float, default: float = 10.0, **kwargs) -> Union[float, np.ndarray]:
+        """Dominant period in samples (fs / frequency), default where undefined"""
+        freqs = np.atleast_1d(self.frequencies(data, fs, **kwargs))
+        defined = np.isfinite(freqs) & (freqs > 0)
+        periods = np.full(freqs.shape, float(default))
+        periods[defined] = fs / freqs[defined]
+        return float(periods[0]) if np.ndim(data) == 1 else periods
+
+    @staticmethod
+    def _spectral(rows: np.ndarray, fs: float, min_freq: float) -> np.ndarray:
+        n = rows.shape[1]
+        freqs = np.fft.rfftfreq(n, 1 / fs)
+        power = np.abs(np.fft.rfft(rows, axis=1)) ** 2
+        start_idx = int(min_freq * len(freqs) / (fs / 2)) if min_freq > 0 else 1
+        return freqs[start_idx + np.argmax(power[:, start_idx:], axis=1)]
+
+    @staticmethod
+    def _autocorrelation(rows: np.ndarray, fs: float, min_freq: float) -> np.ndarray:
+        n_rows, n = rows.shape
+        centered = rows - rows.mean(axis=1, keepdims=True)
+        nfft = next_fast_len(2 * n - 1, real=True)
+        spectrum = np.fft.rfft(centered, nfft, axis=1)
+        acf = np.fft.irfft(spectrum.real ** 2 + spectrum.imag ** 2, nfft, axis=1)[:, :n]
+
+        max_lag = n - 1 if min_freq <= 0 else min(n - 1, int(fs / min_freq))
+        lags = np.arange(n)
+        below = acf <= 0
+        first_zero = np.argmax(below, axis=1)
+        search = (lags >= first_zero[:, np.newaxis]) & (lags <= max_lag)
+
+        # First local maximum within 90% of the highest one, so a multiple of
+        # the period that happens to land on an integer lag is not preferred
+        peak = np.zeros_like(search)
+        peak[:, 1:-1] = (acf[:, 1:-1] >= acf[:, :-2]) & (acf[:, 1:-1] >= acf[:, 2:])
+        candidates = search & peak
+        highest = np.max(np.where(candidates, acf, -np.inf), axis=1, keepdims=True)
+        lag = np.argmax(candidates & (acf >= 0.9 * highest), axis=1)
+
+        r = np.arange(n_rows)
+        valid = below.any(axis=1) & (first_zero > 0) & candidates[r, lag]
+        y0 = acf[r, np.maximum(lag - 1, 0)]
+        y1 = acf[r, lag]
+        y2 = acf[r, np.minimum(lag + 1, n - 1)]
+        denom = y0 - 2 * y1 + y2
+        inner = (lag > 0) & (lag < n - 1) & (denom != 0)
+        shift = np.where(inner, 0.5 * (y0 - y2) / np.where(inner, denom, 1.0), 0.0)
+        period = lag + shift
+        return np.where(valid & (period > 0), fs / np.where(period > 0, period, 1.0), np.nan)
+
+    def _store(self, keys: List[Tuple], values: np.ndarray):
+        with self._lock:
+            for key, value in zip(keys, values):
+                self._estimates[key] = float(value)
+            while len(self._estimates) > self.max_entries:
+                del self._estimates[next(iter(self._estimates))]
+
+    def stats(self) -> Dict:
+        """Get cache size and hit/miss counters"""
+        with self._lock:
+            return {'size': len(self._estimates), 'hits': self.hits, 'misses': self.misses}
+
+    def clear(self):
+        """Drop all cached estimates and reset counters"""
+        with self._lock:
+            self._estimates.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared by every dominant-frequency/period estimate in the process
+PERIOD_ESTIMATOR = PeriodEstimator()
+
+
+def _sos_padlen(sos: np.ndarray) -> int:
+    """
+    Default sosfiltfilt edge padding: 3 * taps of the cascade.
+
+    Trailing zero b/a coefficients (the last section of an odd-order
+    design) are not counted, so the result equals filtfilt's
+    3 * max(len(a), len(b)) for the same design.
+    """
+    ntaps = 2 * len(sos) + 1
+    ntaps -= min(int(np.sum(sos[:, 2] == 0)), int(np.sum(sos[:, 5] == 0)))
+    return 3 * ntaps
+
+
+@dataclass
+class IIRStreamState:
+    """Carry-over state for chunked IIR filtering"""
+    mode: str = 'causal'  # 'causal' or 'zero_phase'
+    overlap: int = 0  # Context samples kept on each side (zero_phase)
+    zi: Optional[np.ndarray] = None  # sosfilt initial conditions (causal)
+    history: Optional[np.ndarray] = None  # Already emitted left context (zero_phase)
+    pending: Optional[np.ndarray] = None  # Received but not yet emitted (zero_phase)
+
+
+class IIRFilter(BaseFilter):
+    """
+    Base class for IIR filters designed as second-order sections.
+
+    Subclasses set self.sos in _design_filter (None = passthrough), usually
+    from FILTER_DESIGN_CACHE. Whole recordings get zero-phase sosfiltfilt;
+    the stateful chunked mode filters arbitrarily long recordings or live
+    frames in fixed memory:
+    - 'causal': sosfilt with initial conditions carried between chunks
+    - 'zero_phase': sosfiltfilt over overlapping blocks; output lags the
+      input by `overlap` samples and is flushed with final=True
+    """
+
+    sos: Optional[np.ndarray] = None
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        """Apply zero-phase filtering (sosfiltfilt)"""
+        if self._is_passthrough():
+            return data
+        padlen = self._padlen()
+        if len(data) <= padlen:
+            return data
+        return signal.sosfiltfilt(self.sos, data, axis=0, padlen=padlen)
+
+    def init_stream(self, mode: str = 'causal', overlap: Optional[int] = None) -> IIRStreamState:
+        """
+        Create the state for process_chunk.
+
+        Args:
+            mode: 'causal' (live use) or 'zero_phase' (offline use)
+            overlap: Context samples for zero_phase blocks
+                (None = settling time of the filter's slowest pole)
+        """
+        if mode not in ('causal', 'zero_phase'):
+            raise ValueError(f"Unknown stream mode: {mode}")
+        if overlap is None:
+            overlap = self._settling_samples() if mode == 'zero_phase' else 0
+        return IIRStreamState(mode=mode, overlap=int(overlap))
+
+    def process_chunk(
+        self,
+        chunk: Optional[np.ndarray],
+        state: Optional[IIRStreamState] = None,
+        final: bool = False
+    ) -> Tuple[np.ndarray, IIRStreamState]:
+        """
+        Filter one chunk of a longer recording.
+
+        Args:
+            chunk: Next samples (n_samples,) or (n_samples, n_features);
+                None or empty to only flush
+            state: State returned by the previous call (None = new causal stream)
+            final: Last chunk - emit everything still buffered (zero_phase)
+
+        Returns:
+            Filtered samples and the updated state
+        """
+        if state is None:
+            state = self.init_stream()
+
+        if chunk is not None:
+            chunk = np.asarray(chunk, dtype=float)
+
+        if state.mode == 'causal':
+            return self._process_causal(chunk, state), state
+        return self._process_zero_phase(chunk, state, final), state
+
+    def _is_passthrough(self) -> bool:
+        """True when the design degenerated to an identity filter"""
+        return self.sos is None
+
+    def _padlen(self) -> int:
+        """Edge padding for sosfiltfilt (same as filtfilt on the (b, a) design)"""
+        return _sos_padlen(self.sos)
+
+    def _settling_samples(self, tol: float = 1e-6) -> int:
+        """Samples until the slowest pole's impulse response decays below tol"""
+        if self._is_passthrough():
+            return 0
+
+        padlen = self._padlen()
+        _, poles, _ = signal.sos2zpk(self.sos)
+        radius = float(np.max(np.abs(poles))) if len(poles) else 0.0
+
+        if radius <= 0.0 or radius >= 1.0:
+            return padlen
+        return max(padlen, int(np.ceil(np.log(tol) / np.log(radius))))
+
+    def _process_causal(self, chunk: Optional[np.ndarray], state: IIRStreamState) -> np.ndarray:
+        """Causal sosfilt carrying initial conditions between chunks"""
+        if chunk is None or len(chunk) == 0 or self._is_passthrough():
+            return chunk if chunk is not None else np.zeros(0)
+
+        if state.zi is None:
+            # Start in steady state for the first sample to avoid a step transient
+            zi = signal.sosfilt_zi(self.sos)
+            state.zi = zi.reshape(zi.shape + (1,) * (chunk.ndim - 1)) * chunk[0]
+
+        filtered, state.zi = signal.sosfilt(self.sos, chunk, axis=0, zi=state.zi)
+        return filtered
+
+    def _process_zero_phase(
+        self, chunk: Optional[np.ndarray], state: IIRStreamState, final: bool
+    ) -> np.ndarray:
+        """Overlapping-block filtfilt; emits samples once their right context is buffered"""
+        parts = [
+            part for part in (state.history, state.pending, chunk)
+            if part is not None and len(part) > 0
+        ]
+        if not parts:
+            if chunk is not None:
+                return chunk
+            return state.pending if state.pending is not None else np.zeros(0)
+
+        buffer = np.concatenate(parts, axis=0)
+        n_history = len(state.history) if state.history is not None else 0
+        emit_end = len(buffer) if final else len(buffer) - state.overlap
+
+        if emit_end <= n_history:
+            state.pending = buffer[n_history:]
+            return buffer[:0]
+
+        filtered = self.apply(buffer)
+
+        state.history = buffer[max(0, emit_end - state.overlap):emit_end]
+        state.pending = buffer[emit_end:]
+
+        return filtered[n_history:emit_end]
+
+
+class ButterworthFilter(IIRFilter):
     """
     Butterworth low-pass filter for smoothing.
     Maximally flat frequency response in the passband.
@@ -73,20 +493,10 @@ class ButterworthFilter(BaseFilter):
 
     def _design_filter(self):
         """Design the Butterworth filter"""
-        nyq = 0.5 * self.fs
-        normalized_cutoff = self.cutoff / nyq
-        self.b, self.a = signal.butter(
-            self.order,
-            normalized_cutoff,
-            btype=self.filter_type
+        self.sos = FILTER_DESIGN_CACHE.get_sos(
+            'butter', self.cutoff, self.fs, self.order, btype=self.filter_type
         )
 
-    def apply(self, data: np.ndarray) -> np.ndarray:
-        """Apply zero-phase filtering (filtfilt)"""
-        if len(data) < 3 * max(len(self.a), len(self.b)):
-            return data
-        return signal.filtfilt(self.b, self.a, data, axis=0)
-
     def get_params(self) -> Dict:
         return {
             'type': 'butterworth',
@@ -97,7 +507,7 @@ class ButterworthFilter(BaseFilter):
         }
 
 
-class ChebyshevFilter(BaseFilter):
+class ChebyshevFilter(IIRFilter):
     """
     Chebyshev Type I filter.
     Steeper rolloff than Butterworth but with passband ripple.
@@ -117,20 +527,10 @@ class ChebyshevFilter(BaseFilter):
         self._design_filter()
 
     def _design_filter(self):
-        nyq = 0.5 * self.fs
-        normalized_cutoff = self.cutoff / nyq
-        self.b, self.a = signal.cheby1(
-            self.order,
-            self.ripple,
-            normalized_cutoff,
-            btype='low'
+        self.sos = FILTER_DESIGN_CACHE.get_sos(
+            'cheby1', self.cutoff, self.fs, self.order, ripple=self.ripple
         )
 
-    def apply(self, data: np.ndarray) -> np.ndarray:
-        if len(data) < 3 * max(len(self.a), len(self.b)):
-            return data
-        return signal.filtfilt(self.b, self.a, data, axis=0)
-
     def get_params(self) -> Dict:
         return {
             'type': 'chebyshev1',
@@ -140,7 +540,7 @@ class ChebyshevFilter(BaseFilter):
         }
 
 
-class BesselFilter(BaseFilter):
+class BesselFilter(IIRFilter):
     """
     Bessel filter for maximally linear phase response.
     Best for preserving wave shape in the time domain.
@@ -158,25 +558,13 @@ class BesselFilter(BaseFilter):
         self._design_filter()
 
     def _design_filter(self):
-        nyq = 0.5 * self.fs
-        normalized_cutoff = self.cutoff / nyq
-        self.b, self.a = signal.bessel(
-            self.order,
-            normalized_cutoff,
-            btype='low',
-            norm='phase'
-        )
-
-    def apply(self, data: np.ndarray) -> np.ndarray:
-        if len(data) < 3 * max(len(self.a), len(self.b)):
-            return data
-        return signal.filtfilt(self.b, self.a, data, axis=0)
+        self.sos = FILTER_DESIGN_CACHE.get_sos('bessel', self.cutoff, self.fs, self.order)
 
     def get_params(self) -> Dict:
         return {'type': 'bessel', 'cutoff': self.cutoff, 'order': self.order}
 
 
-class EllipticFilter(BaseFilter):
+class EllipticFilter(IIRFilter):
     """
     Elliptic (Cauer) filter.
     Steepest rolloff for given order, but with ripple in both bands.
@@ -198,21 +586,10 @@ class EllipticFilter(BaseFilter):
         self._design_filter()
 
     def _design_filter(self):
-        nyq = 0.5 * self.fs
-        normalized_cutoff = self.cutoff / nyq
-        self.b, self.a = signal.ellip(
-            self.order,
-            self.rp,
-            self.rs,
-            normalized_cutoff,
-            btype='low'
+        self.sos = FILTER_DESIGN_CACHE.get_sos(
+            'ellip', self.cutoff, self.fs, self.order, ripple=(self.rp, self.rs)
         )
 
-    def apply(self, data: np.ndarray) -> np.ndarray:
-        if len(data) < 3 * max(len(self.a), len(self.b)):
-            return data
-        return signal.filtfilt(self.b, self.a, data, axis=0)
-
     def get_params(self) -> Dict:
         return {
             'type': 'elliptic',
@@ -223,7 +600,7 @@ class EllipticFilter(BaseFilter):
         }
 
 
-class NotchFilter(BaseFilter):
+class NotchFilter(IIRFilter):
     """
     Notch (band-stop) filter to remove specific frequency.
     Useful for removing power line interference (50/60 Hz).
@@ -244,20 +621,17 @@ class NotchFilter(BaseFilter):
         nyq = 0.5 * self.fs
         if self.freq >= nyq:
             # Frequency too high for sampling rate
-            self.b, self.a = [1], [1]
+            self.sos = None
             return
-        self.b, self.a = signal.iirnotch(self.freq / nyq, self.quality)
-
-    def apply(self, data: np.ndarray) -> np.ndarray:
-        if self.b == [1]:
-            return data
-        return signal.filtfilt(self.b, self.a, data, axis=0)
+        self.sos = FILTER_DESIGN_CACHE.get_sos(
+            'notch', self.freq, self.fs, 2, ripple=self.quality, btype='bandstop'
+        )
 
     def get_params(self) -> Dict:
         return {'type': 'notch', 'freq': self.freq, 'quality': self.quality}
 
 
-class BandpassFilter(BaseFilter):
+class BandpassFilter(IIRFilter):
     """
     Bandpass filter for isolating specific frequency range.
     Useful for tremor analysis (4-12 Hz typically).
@@ -278,14 +652,10 @@ class BandpassFilter(BaseFilter):
 
     def _design_filter(self):
         nyq = 0.5 * self.fs
-        low = self.low_cutoff / nyq
-        high = min(self.high_cutoff / nyq, 0.99)
-        self.b, self.a = signal.butter(self.order, [low, high], btype='band')
-
-    def apply(self, data: np.ndarray) -> np.ndarray:
-        if len(data) < 3 * max(len(self.a), len(self.b)):
-            return data
-        return signal.filtfilt(self.b, self.a, data, axis=0)
+        high = min(self.high_cutoff, 0.99 * nyq)
+        self.sos = FILTER_DESIGN_CACHE.get_sos(
+            'butter', (self.low_cutoff, high), self.fs, self.order, btype='band'
+        )
 
     def get_params(self) -> Dict:
         return {
@@ -324,10 +694,20 @@ class ExponentialSmoothingFilter(BaseFilter):
     More recent values have more weight.
     """
 
-    def __init__(self, alpha: float = 0.3):
+    def __init__(self, alpha: float = 0.3, vectorized: bool = True):
+        """
+        Args:
+            alpha: Smoothing factor (weight of the newest sample)
+            vectorized: Run the recurrence for all columns at once as a
+                first-order IIR filter (False = per-sample Python loop)
+        """
         self.alpha = alpha
+        self.vectorized = vectorized
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            return self._smooth_batched(data)
+
         if data.ndim == 1:
             return self._smooth_1d(data)
 
@@ -336,6 +716,23 @@ class ExponentialSmoothingFilter(BaseFilter):
             result[:, col] = self._smooth_1d(data[:, col])
         return result
 
+    def _smooth_batched(self, data: np.ndarray) -> np.ndarray:
+        """
+        Smooth every column with one recursive filtering call.
+
+        s[i] = alpha * x[i] + (1 - alpha) * s[i-1] is the IIR filter
+        b = [alpha], a = [1, alpha - 1], started from s[0] = x[0].
+        """
+        if len(data) == 0:
+            return np.zeros_like(data)
+
+        # Initial condition chosen so that s[0] = x[0]
+        zi = (1 - self.alpha) * np.asarray(data[0], dtype=float)[np.newaxis, ...]
+        result, _ = signal.lfilter(
+            [self.alpha], [1.0, self.alpha - 1.0], data, axis=0, zi=zi
+        )
+        return result.astype(data.dtype, copy=False)
+
     def _smooth_1d(self, data: np.ndarray) -> np.ndarray:
         result = np.zeros_like(data)
         result[0] = data[0]
@@ -353,11 +750,22 @@ class DoubleExponentialFilter(BaseFilter):
     Accounts for trends in the data.
     """
 
-    def __init__(self, alpha: float = 0.3, beta: float = 0.1):
+    def __init__(self, alpha: float = 0.3, beta: float = 0.1, vectorized: bool = True):
+        """
+        Args:
+            alpha: Level smoothing factor
+            beta: Trend smoothing factor
+            vectorized: Run the level/trend system for all columns at once
+                as a second-order IIR filter (False = per-sample Python loop)
+        """
         self.alpha = alpha
         self.beta = beta
+        self.vectorized = vectorized
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            return self._smooth_batched(data)
+
         if data.ndim == 1:
             return self._smooth_1d(data)
 
@@ -366,6 +774,36 @@ class DoubleExponentialFilter(BaseFilter):
             result[:, col] = self._smooth_1d(data[:, col])
         return result
 
+    def _smooth_batched(self, data: np.ndarray) -> np.ndarray:
+        """
+        Smooth every column with one recursive filtering call.
+
+        Eliminating the trend state from Holt's level/trend system gives
+        the level as a second-order IIR filter of the input:
+            b = [alpha, -alpha * (1 - beta)]
+            a = [1, -(2 - alpha - alpha * beta), 1 - alpha]
+        The filter state is initialised so that level[0] = x[0] and
+        trend[0] = x[1] - x[0], matching the per-sample recursion.
+        """
+        n = len(data)
+        if n == 0:
+            return np.zeros_like(data) if data.ndim > 1 else np.zeros(0)
+
+        a_, b_ = self.alpha, self.beta
+        level0 = np.asarray(data[0], dtype=float)
+        trend0 = data[1] - data[0] if n > 1 else np.zeros_like(level0)
+
+        zi = (1 - a_) * np.stack([level0, trend0 - level0])
+        result, _ = signal.lfilter(
+            [a_, -a_ * (1 - b_)],
+            [1.0, -(2 - a_ - a_ * b_), 1 - a_],
+            data, axis=0, zi=zi
+        )
+
+        if data.ndim > 1:
+            return result.astype(data.dtype, copy=False)
+        return result
+
     def _smooth_1d(self, data: np.ndarray) -> np.ndarray:
         n = len(data)
         level = np.zeros(n)
@@ -457,12 +895,28 @@ class KalmanFilter(BaseFilter):
     def __init__(
         self,
         process_noise: float = 0.01,
-        measurement_noise: float = 0.1
+        measurement_noise: float = 0.1,
+        vectorized: bool = True,
+        steady_state_tol: float = 1e-12
     ):
+        """
+        Args:
+            process_noise: Process noise variance (Q)
+            measurement_noise: Measurement noise variance (R)
+            vectorized: Precompute the gain sequence once and filter all
+                columns together (False = original per-column loop)
+            steady_state_tol: Relative gain change between samples treated
+                as converged; the constant-gain fast path then takes over
+        """
         self.process_noise = process_noise
         self.measurement_noise = measurement_noise
+        self.vectorized = vectorized
+        self.steady_state_tol = steady_state_tol
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            return self._filter_batched(data)
+
         if data.ndim == 1:
             return self._filter_1d(data)
 
@@ -471,6 +925,70 @@ class KalmanFilter(BaseFilter):
             result[:, col] = self._filter_1d(data[:, col])
         return result
 
+    def _gain_sequence(self, n: int) -> Tuple[np.ndarray, int]:
+        """
+        Compute the Kalman gain sequence for n samples.
+
+        Gain and covariance do not depend on the measurements, so the
+        sequence is shared by every column. Iteration stops once the gain
+        changes by less than steady_state_tol (relative) between samples,
+        a test that does not depend on last-bit rounding.
+
+        Returns:
+            Tuple of (gains, steady_idx) where gains[i] is the gain used at
+            sample i and gains[steady_idx:] are all equal
+        """
+        Q = self.process_noise
+        R = self.measurement_noise
+
+        gains = np.zeros(n)
+        P = 1.0
+        steady_idx = n
+
+        for i in range(1, n):
+            P_pred = P + Q
+            K = P_pred / (P_pred + R)
+            P = (1 - K) * P_pred
+            gains[i] = K
+
+            if i > 1 and np.isclose(K, gains[i - 1], rtol=self.steady_state_tol, atol=0.0):
+                gains[i:] = K
+                steady_idx = i
+                break
+
+        return gains, steady_idx
+
+    def _filter_batched(self, data: np.ndarray) -> np.ndarray:
+        """Filter all columns at once using the shared gain sequence"""
+        is_1d = data.ndim == 1
+        sig = np.asarray(data, dtype=float).reshape(len(data), -1)
+        n = len(sig)
+
+        result = np.zeros_like(sig)
+        if n == 0:
+            return result[:, 0] if is_1d else result.astype(data.dtype)
+
+        gains, steady_idx = self._gain_sequence(n)
+
+        # Transient: time-varying gain, one vector update per sample
+        x_est = sig[0].copy()
+        result[0] = x_est
+        for i in range(1, steady_idx):
+            x_est = x_est + gains[i] * (sig[i] - x_est)
+            result[i] = x_est
+
+        # Steady state: constant gain reduces to a first-order recurrence
+        if steady_idx < n:
+            K = gains[steady_idx]
+            zi = (1 - K) * result[steady_idx - 1][np.newaxis, :]
+            result[steady_idx:], _ = signal.lfilter(
+                [K], [1.0, K - 1.0], sig[steady_idx:], axis=0, zi=zi
+            )
+
+        if is_1d:
+            return result[:, 0]
+        return result.astype(data.dtype, copy=False)
+
     def _filter_1d(self, data: np.ndarray) -> np.ndarray:
         n = len(data)
         Q = self.process_noise
@@ -511,11 +1029,22 @@ class LMSAdaptiveFilter(BaseFilter):
     Self-adjusting filter that learns from the signal.
     """
 
-    def __init__(self, mu: float = 0.01, filter_order: int = 16):
+    def __init__(self, mu: float = 0.01, filter_order: int = 16, vectorized: bool = True):
+        """
+        Args:
+            mu: Step size
+            filter_order: Number of taps (M)
+            vectorized: Keep a (n_channels, M) weight matrix and update all
+                columns per sample (False = per-column loop)
+        """
         self.mu = mu
         self.filter_order = filter_order
+        self.vectorized = vectorized
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            return self._filter_batched(data)
+
         if data.ndim == 1:
             return self._filter_1d(data)
 
@@ -524,6 +1053,38 @@ class LMSAdaptiveFilter(BaseFilter):
             result[:, col] = self._filter_1d(data[:, col])
         return result
 
+    def _filter_batched(self, data: np.ndarray) -> np.ndarray:
+        """Run LMS for all columns with a channel axis on the weights"""
+        n = len(data)
+        M = self.filter_order
+
+        if n < M:
+            return data
+
+        sig = np.asarray(data, dtype=float).reshape(n, -1)
+        # Tap-delay inputs for every sample: x[i - M] = sig[i-M:i][::-1]
+        taps = sliding_window_view(sig, M, axis=0)[..., ::-1]
+
+        w = np.zeros((sig.shape[1], M))
+        result = np.zeros_like(sig)
+
+        for i in range(M, n):
+            x = taps[i - M]
+            y = np.einsum('cm,cm->c', w, x)  # Filter output
+            e = sig[i] - y  # Error signal
+
+            # Update weights
+            w += self.mu * e[:, np.newaxis] * x
+
+            result[i] = y
+
+        # Fill initial values
+        result[:M] = sig[:M]
+
+        if data.ndim == 1:
+            return result[:, 0]
+        return result.astype(data.dtype, copy=False)
+
     def _filter_1d(self, data: np.ndarray) -> np.ndarray:
         n = len(data)
         M = self.filter_order
@@ -564,13 +1125,27 @@ class RLSAdaptiveFilter(BaseFilter):
         self,
         lambda_: float = 0.99,
         delta: float = 1.0,
-        filter_order: int = 16
+        filter_order: int = 16,
+        vectorized: bool = True
     ):
+        """
+        Args:
+            lambda_: Forgetting factor
+            delta: Initial inverse-correlation scale (P = delta * I)
+            filter_order: Number of taps (M)
+            vectorized: Keep (n_channels, M) weights and (n_channels, M, M)
+                inverse-correlation matrices and update all columns per
+                sample with batched products (False = per-column loop)
+        """
         self.lambda_ = lambda_
         self.delta = delta
         self.filter_order = filter_order
+        self.vectorized = vectorized
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            return self._filter_batched(data)
+
         if data.ndim == 1:
             return self._filter_1d(data)
 
@@ -579,6 +1154,48 @@ class RLSAdaptiveFilter(BaseFilter):
             result[:, col] = self._filter_1d(data[:, col])
         return result
 
+    def _filter_batched(self, data: np.ndarray) -> np.ndarray:
+        """Run RLS for all columns with a channel axis on weights and P"""
+        n = len(data)
+        M = self.filter_order
+
+        if n < M:
+            return data
+
+        sig = np.asarray(data, dtype=float).reshape(n, -1)
+        n_channels = sig.shape[1]
+        # Tap-delay inputs for every sample: x[i - M] = sig[i-M:i][::-1]
+        taps = sliding_window_view(sig, M, axis=0)[..., ::-1]
+
+        # Initialize
+        w = np.zeros((n_channels, M))
+        P = np.broadcast_to(np.eye(M) * self.delta, (n_channels, M, M)).copy()
+        outer = np.empty_like(P)
+        inv_lambda = 1.0 / self.lambda_
+        result = np.zeros_like(sig)
+
+        for i in range(M, n):
+            x = taps[i - M]
+            y = np.einsum('cm,cm->c', w, x)
+            e = sig[i] - y
+
+            # RLS update, batched over channels
+            Px = np.matmul(P, x[:, :, np.newaxis])[:, :, 0]
+            xP = np.matmul(x[:, np.newaxis, :], P)[:, 0, :]
+            k = Px / (self.lambda_ + np.einsum('cm,cm->c', x, Px))[:, np.newaxis]
+            w += k * e[:, np.newaxis]
+            np.multiply(k[:, :, np.newaxis], xP[:, np.newaxis, :], out=outer)
+            P -= outer
+            P *= inv_lambda
+
+            result[i] = y
+
+        result[:M] = sig[:M]
+
+        if data.ndim == 1:
+            return result[:, 0]
+        return result.astype(data.dtype, copy=False)
+
     def _filter_1d(self, data: np.ndarray) -> np.ndarray:
         n = len(data)
         M = self.filter_order
@@ -597,7 +1214,7 @@ class RLSAdaptiveFilter(BaseFilter):
             e = data[i] - y
 
             # RLS update
-            k = P @ x / (self.lambda_ + float(x.T @ P @ x))
+            k = P @ x / (self.lambda_ + (x.T @ P @ x).item())
             w = w + (k.flatten() * e)
             P = (P - k @ x.T @ P) / self.lambda_
 
@@ -623,36 +1240,57 @@ class WaveletDenoiseFilter(BaseFilter):
     """
     Wavelet-based denoising using thresholding.
     Effective for non-stationary signals.
+
+    Features:
+    - Decomposes all channels along the frame axis in a single wavedec call
+    - Per-channel noise level and universal threshold in one vectorized step
     """
 
     def __init__(
         self,
         wavelet: str = 'db4',
         level: int = 4,
-        threshold_type: str = 'soft'
+        threshold_type: str = 'soft',
+        vectorized: bool = True
     ):
+        """
+        Args:
+            wavelet: Wavelet name
+            level: Decomposition level
+            threshold_type: 'soft' or 'hard'
+            vectorized: Transform all columns in one call
+                (False = per-column loop)
+        """
         self.wavelet = wavelet
         self.level = level
         self.threshold_type = threshold_type
+        self.vectorized = vectorized
 
     def apply(self, data: np.ndarray) -> np.ndarray:
         if data.ndim == 1:
             return self._denoise_1d(data)
 
+        if self.vectorized:
+            # Channels as contiguous rows: the transform runs along the last axis
+            return self._denoise_1d(np.ascontiguousarray(data.T)).T
+
         result = np.zeros_like(data)
         for col in range(data.shape[1]):
             result[:, col] = self._denoise_1d(data[:, col])
         return result
 
     def _denoise_1d(self, data: np.ndarray) -> np.ndarray:
+        """Denoise along the last axis; stacked rows get one threshold each"""
+        n = data.shape[-1]
+
         # Decompose
-        coeffs = pywt.wavedec(data, self.wavelet, level=self.level)
+        coeffs = pywt.wavedec(data, self.wavelet, level=self.level, axis=-1)
 
         # Estimate noise level from finest detail coefficients
-        sigma = median_abs_deviation(coeffs[-1]) / 0.6745
+        sigma = median_abs_deviation(coeffs[-1], axis=-1)[..., np.newaxis] / 0.6745
 
         # Universal threshold
-        threshold = sigma * np.sqrt(2 * np.log(len(data)))
+        threshold = sigma * np.sqrt(2 * np.log(n))
 
         # Apply thresholding to detail coefficients
         denoised_coeffs = [coeffs[0]]  # Keep approximation
@@ -663,7 +1301,7 @@ class WaveletDenoiseFilter(BaseFilter):
                 denoised_coeffs.append(pywt.threshold(c, threshold, mode='hard'))
 
         # Reconstruct
-        return pywt.waverec(denoised_coeffs, self.wavelet)[:len(data)]
+        return pywt.waverec(denoised_coeffs, self.wavelet, axis=-1)[..., :n]
 
     def get_params(self) -> Dict:
         return {
@@ -678,19 +1316,45 @@ class WaveletPacketFilter(BaseFilter):
     """
     Wavelet packet decomposition for fine frequency control.
     More flexible than standard wavelet decomposition.
+
+    Features:
+    - Level-order packet transform: all nodes of a level (and all channels)
+      are split with one dwt call, so a level-L transform is L calls
+    - keep_nodes is resolved once into a mask over the 2^L terminal nodes
+      in natural ('a' before 'd') order
     """
 
     def __init__(
         self,
         wavelet: str = 'db4',
         level: int = 3,
-        keep_nodes: Optional[List[str]] = None
+        keep_nodes: Optional[List[str]] = None,
+        vectorized: bool = True
     ):
+        """
+        Args:
+            wavelet: Wavelet name
+            level: Packet decomposition level
+            keep_nodes: Terminal node paths to keep (e.g. ['aaa', 'aad']);
+                empty keeps everything
+            vectorized: Use the level-order transform on all columns
+                (False = pywt.WaveletPacket tree per column)
+        """
         self.wavelet = wavelet
         self.level = level
         self.keep_nodes = keep_nodes or []
+        self.vectorized = vectorized
+
+        # Terminal nodes in natural order: path i has bit (level-1-j) set
+        # when its j-th letter is 'd'
+        paths = [''.join('d' if (i >> (level - 1 - j)) & 1 else 'a' for j in range(level))
+                 for i in range(2 ** level)]
+        self._keep_mask = np.array([p in self.keep_nodes for p in paths], dtype=float)
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            return self._filter_batched(data)
+
         if data.ndim == 1:
             return self._filter_1d(data)
 
@@ -699,6 +1363,39 @@ class WaveletPacketFilter(BaseFilter):
             result[:, col] = self._filter_1d(data[:, col])
         return result
 
+    def _filter_batched(self, data: np.ndarray) -> np.ndarray:
+        """Packet transform of all columns at once, masked at the leaves"""
+        if not self.keep_nodes:
+            # Nothing masked: the packet tree reconstructs the input as-is
+            return data.copy()
+
+        # Nodes stacked on a leading axis, channels as contiguous rows:
+        # (n_nodes, n_channels, length)
+        sig = np.asarray(data, dtype=float).reshape(len(data), -1)
+        nodes = np.ascontiguousarray(sig.T)[np.newaxis]
+
+        # Decompose
+        lengths = []
+        for _ in range(self.level):
+            lengths.append(nodes.shape[-1])
+            approx, detail = pywt.dwt(nodes, self.wavelet, axis=-1)
+            # Children of node p are (p + 'a', p + 'd'), adjacent in natural order
+            nodes = np.stack([approx, detail], axis=1).reshape(
+                (2 * nodes.shape[0],) + approx.shape[1:]
+            )
+
+        nodes *= self._keep_mask[:, np.newaxis, np.newaxis]
+
+        # Reconstruct, trimming each level to its original length
+        for length in reversed(lengths):
+            nodes = pywt.idwt(nodes[0::2], nodes[1::2], self.wavelet, axis=-1)
+            nodes = nodes[..., :length]
+
+        result = nodes[0].T
+        if data.ndim == 1:
+            return result[:, 0]
+        return result
+
     def _filter_1d(self, data: np.ndarray) -> np.ndarray:
         wp = pywt.WaveletPacket(data, self.wavelet, maxlevel=self.level)
 
@@ -782,32 +1479,140 @@ class TotalVariationFilter(BaseFilter):
     Smooths noise while preserving sharp edges/transitions.
     Uses Chambolle's algorithm for 1D TV denoising.
 
+    Features:
+    - 'chambolle': iterative dual algorithm, all channels iterated together
+      with each column frozen once it meets the tolerance
+    - 'direct': exact 1D ROF solution in O(n) per channel (Condat's
+      taut-string algorithm), no iterations or tolerance involved
+
     Reference: Chambolle, A. (2004). An algorithm for total variation minimization.
+    Reference: Condat, L. (2013). A direct algorithm for 1D total variation denoising.
     """
 
+    METHODS = ('chambolle', 'direct')
+
     def __init__(
         self,
         lambda_tv: float = 0.1,
         max_iter: int = 100,
-        tolerance: float = 1e-4
+        tolerance: float = 1e-4,
+        method: str = 'chambolle',
+        vectorized: bool = True
     ):
         """
         Args:
             lambda_tv: Regularization strength (higher = smoother)
             max_iter: Maximum iterations for optimization
             tolerance: Convergence tolerance
+            method: 'chambolle' (iterative) or 'direct' (exact, linear time)
+            vectorized: Iterate all Chambolle columns together
+                (False = per-column loop)
         """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method: {method}. Choose from {list(self.METHODS)}")
+
         self.lambda_tv = lambda_tv
         self.max_iter = max_iter
         self.tolerance = tolerance
+        self.method = method
+        self.vectorized = vectorized
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.method == 'direct':
+            denoise_1d = self._denoise_direct_1d
+        elif self.vectorized:
+            return self._denoise_batched(data)
+        else:
+            denoise_1d = self._denoise_1d
+
         if data.ndim == 1:
-            return self._denoise_1d(data)
+            return denoise_1d(data)
 
         result = np.zeros_like(data)
         for col in range(data.shape[1]):
-            result[:, col] = self._denoise_1d(data[:, col])
+            result[:, col] = denoise_1d(data[:, col])
+        return result
+
+    # Samples per Chambolle block; keeps the working arrays cache resident
+    BLOCK_SAMPLES = 32768
+
+    def _denoise_batched(self, data: np.ndarray) -> np.ndarray:
+        """
+        Chambolle iterations over blocks of columns at once.
+
+        Columns are laid out as contiguous rows and grouped so each block
+        stays cache resident (long recordings degrade to one or two
+        columns per block; short windows run all channels together).
+        Each column keeps its own convergence test and is frozen and
+        dropped from the working set as soon as it meets the tolerance.
+        """
+        n = len(data)
+        if n < 2:
+            return data.copy()
+
+        f = np.ascontiguousarray(np.asarray(data, dtype=float).reshape(n, -1).T)
+        result = np.empty_like(f)
+        block = max(1, self.BLOCK_SAMPLES // n)
+
+        for start in range(0, f.shape[0], block):
+            stop = start + block
+            result[start:stop] = self._chambolle_block(f[start:stop])
+
+        if data.ndim == 1:
+            return result[0]
+        return result.T.astype(data.dtype)
+
+    def _chambolle_block(self, f: np.ndarray) -> np.ndarray:
+        """Chambolle iterations for a (n_columns, n) block with per-row freezing"""
+        result = np.empty_like(f)
+        active = np.arange(f.shape[0])
+
+        u = f.copy()
+        u_new = np.empty_like(f)
+        div_p = np.empty_like(f)
+        p = np.zeros((f.shape[0], f.shape[1] - 1))
+        grad_u = np.empty_like(p)
+        denom = np.empty_like(p)
+
+        # grad(div p - f/lambda) = -grad(u) / lambda, step tau = 1/4
+        step = 0.25 / self.lambda_tv
+
+        for _ in range(self.max_iter):
+            # Dual update: p = (p - step*grad u) / (1 + step*|grad u|)
+            np.subtract(u[:, 1:], u[:, :-1], out=grad_u)
+            np.abs(grad_u, out=denom)
+            denom *= step
+            denom += 1
+            grad_u *= -step
+            p += grad_u
+            p /= denom
+
+            # Divergence of p
+            div_p[:, 0] = p[:, 0]
+            np.subtract(p[:, 1:], p[:, :-1], out=div_p[:, 1:-1])
+            div_p[:, -1] = -p[:, -1]
+
+            # Primal update: u_new = f - lambda * div_p
+            np.multiply(div_p, -self.lambda_tv, out=u_new)
+            u_new += f
+
+            # Per-row convergence, then swap buffers
+            np.subtract(u_new, u, out=div_p)
+            rel = (np.sqrt(np.einsum('ij,ij->i', div_p, div_p))
+                   / (np.sqrt(np.einsum('ij,ij->i', u, u)) + 1e-10))
+            u, u_new = u_new, u
+
+            done = rel < self.tolerance
+            if done.any():
+                result[active[done]] = u[done]
+                keep = ~done
+                if not keep.any():
+                    return result
+                active = active[keep]
+                f, u, u_new, div_p = f[keep], u[keep], u_new[keep], div_p[keep]
+                p, grad_u, denom = p[keep], grad_u[keep], denom[keep]
+
+        result[active] = u
         return result
 
     def _denoise_1d(self, data: np.ndarray) -> np.ndarray:
@@ -816,7 +1621,8 @@ class TotalVariationFilter(BaseFilter):
         u = data.copy()
         p = np.zeros(n - 1)
 
-        tau = 1.0 / (4.0 * self.lambda_tv)
+        # grad(div p - f/lambda) = -grad(u) / lambda, step tau = 1/4
+        step = 0.25 / self.lambda_tv
 
         for _ in range(self.max_iter):
             u_old = u.copy()
@@ -824,9 +1630,8 @@ class TotalVariationFilter(BaseFilter):
             # Gradient of u
             grad_u = np.diff(u)
 
-            # Update dual variable p
-            p = (p + tau * grad_u) / (1 + tau * np.abs(grad_u))
-            p = np.clip(p, -1, 1)
+            # Update dual variable p (Chambolle's projection step)
+            p = (p - step * grad_u) / (1 + step * np.abs(grad_u))
 
             # Divergence of p
             div_p = np.zeros(n)
@@ -843,12 +1648,86 @@ class TotalVariationFilter(BaseFilter):
 
         return u
 
+    def _denoise_direct_1d(self, data: np.ndarray) -> np.ndarray:
+        """
+        Exact 1D TV denoising (Condat's direct algorithm).
+
+        Solves min_u 0.5 * ||u - data||^2 + lambda_tv * sum|u[i+1] - u[i]|
+        by growing one segment at a time while tracking the lower/upper
+        bounds of its value; every sample is emitted exactly once.
+        """
+        n = len(data)
+        if n < 2 or self.lambda_tv <= 0:
+            return np.array(data, dtype=float)
+
+        y = np.asarray(data, dtype=float).tolist()
+        out = [0.0] * n
+        lam = float(self.lambda_tv)
+        two_lam = 2.0 * lam
+        last = n - 1
+
+        k = k0 = k_minus = k_plus = 0
+        u_min, u_max = lam, -lam
+        v_min, v_max = y[0] - lam, y[0] + lam
+
+        while True:
+            # Reached the end: settle the remaining segment(s)
+            while k == last:
+                if u_min < 0.0:
+                    out[k0:k_minus + 1] = [v_min] * (k_minus + 1 - k0)
+                    k = k_minus = k0 = k_minus + 1
+                    v_min = y[k0]
+                    u_min = lam
+                    u_max = v_min + u_min - v_max
+                elif u_max > 0.0:
+                    out[k0:k_plus + 1] = [v_max] * (k_plus + 1 - k0)
+                    k = k_plus = k0 = k_plus + 1
+                    v_max = y[k0]
+                    u_max = -lam
+                    u_min = v_max + u_max - v_min
+                else:
+                    v_min += u_min / (k - k0 + 1)
+                    out[k0:] = [v_min] * (n - k0)
+                    return np.array(out)
+
+            u_min += y[k + 1] - v_min
+            if u_min < -lam:
+                # Negative jump: close the segment at v_min
+                out[k0:k_minus + 1] = [v_min] * (k_minus + 1 - k0)
+                k = k_minus = k_plus = k0 = k_minus + 1
+                v_min = y[k0]
+                v_max = v_min + two_lam
+                u_min, u_max = lam, -lam
+                continue
+
+            u_max += y[k + 1] - v_max
+            if u_max > lam:
+                # Positive jump: close the segment at v_max
+                out[k0:k_plus + 1] = [v_max] * (k_plus + 1 - k0)
+                k = k_minus = k_plus = k0 = k_plus + 1
+                v_max = y[k0]
+                v_min = v_max - two_lam
+                u_min, u_max = lam, -lam
+                continue
+
+            # No jump yet: extend the segment and tighten the bounds
+            k += 1
+            if u_min >= lam:
+                k_minus = k
+                v_min += (u_min - lam) / (k - k0 + 1)
+                u_min = lam
+            if u_max <= -lam:
+                k_plus = k
+                v_max += (u_max + lam) / (k - k0 + 1)
+                u_max = -lam
+
     def get_params(self) -> Dict:
         return {
             'type': 'total_variation',
             'lambda_tv': self.lambda_tv,
             'max_iter': self.max_iter,
-            'tolerance': self.tolerance
+            'tolerance': self.tolerance,
+            'method': self.method
         }
 
 
@@ -858,26 +1737,48 @@ class LOESSFilter(BaseFilter):
     Non-parametric local regression for adaptive smoothing.
     Also known as LOWESS (Locally Weighted Scatterplot Smoothing).
 
+    Features:
+    - Uniform-grid engine: frames are evenly spaced, so away from the edges
+      every fit uses the same tricube window and the local-linear moments
+      are FFT correlations computed for all columns at once
+    - Edge fits use per-point windows, evaluated as batched matrix products
+    - Robustness iterations reweight all columns together
+    - delta='auto' fits every ~1% of the signal on long recordings and
+      linearly interpolates in between
+
     Reference: Cleveland, W. S. (1979). Robust locally weighted regression.
     """
 
+    # Signals longer than this get delta = 1% of the range with delta='auto'
+    AUTO_DELTA_MIN_SAMPLES = 5000
+
+    # Element budget for the (rows, columns, window) blocks of explicit fits
+    ROW_BLOCK_ELEMENTS = 1 << 22
+
     def __init__(
         self,
         frac: float = 0.1,
         it: int = 3,
-        delta: float = 0.0
+        delta: Union[float, str] = 0.0,
+        vectorized: bool = True
     ):
         """
         Args:
             frac: Fraction of data to use for local regression (0-1)
             it: Number of robustness iterations
-            delta: Distance threshold for interpolation speedup
+            delta: Distance threshold for interpolation speedup, or 'auto'
+            vectorized: Use the uniform-grid engine on all columns
+                (False = statsmodels lowess per column)
         """
         self.frac = frac
         self.it = it
         self.delta = delta
+        self.vectorized = vectorized
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            return self._smooth_batched(data)
+
         if data.ndim == 1:
             return self._smooth_1d(data)
 
@@ -886,11 +1787,205 @@ class LOESSFilter(BaseFilter):
             result[:, col] = self._smooth_1d(data[:, col])
         return result
 
+    def _resolve_delta(self, n: int) -> float:
+        """Interpolation distance in samples for a signal of length n"""
+        if self.delta == 'auto':
+            return 0.01 * (n - 1) if n > self.AUTO_DELTA_MIN_SAMPLES else 0.0
+        return float(self.delta)
+
+    # -------------------------------------------------------------------------
+    # Uniform-grid engine
+    # -------------------------------------------------------------------------
+
+    def _smooth_batched(self, data: np.ndarray) -> np.ndarray:
+        """LOWESS on the grid x = 0..n-1 for every column at once"""
+        n = len(data)
+        if n < 2:
+            return np.array(data, dtype=float)
+
+        y = np.asarray(data, dtype=float).reshape(n, -1)
+
+        # Neighbourhood size, clamped like statsmodels
+        k = min(max(int(self.frac * n + 1e-10), 2), n)
+        fit_idx = self._fit_indices(n, self._resolve_delta(n))
+
+        r = None  # Robustness weights (None = all ones)
+        for iteration in range(self.it + 1):
+            if len(fit_idx) == n:
+                y_fit = self._fit_dense(y, r, k)
+            else:
+                y_fit = self._interpolate_fits(
+                    self._fit_rows(y, r, k, fit_idx), fit_idx, n
+                )
+            if iteration < self.it:
+                r = self._residual_weights(y, y_fit)
+
+        if data.ndim == 1:
+            return y_fit[:, 0]
+        return y_fit
+
+    @staticmethod
+    def _fit_indices(n: int, delta: float) -> np.ndarray:
+        """Grid points that get a regression (statsmodels' delta skipping)"""
+        if delta < 1.0:
+            return np.arange(n)
+
+        fit = [0]
+        last = 0
+        while last < n - 1:
+            nxt = int(np.floor(last + delta)) + 1
+            last = max(nxt - 1, last + 1) if nxt <= n - 1 else max(n - 2, last + 1)
+            fit.append(last)
+        return np.asarray(fit)
+
+    @staticmethod
+    def _tricube(u: np.ndarray) -> np.ndarray:
+        """(1 - |u|^3)^3 on [0, 1], zero outside"""
+        t = 1.0 - np.minimum(np.abs(u), 1.0) ** 3
+        return t * t * t
+
+    @staticmethod
+    def _solve_local_linear(
+        s0, s1, s2, sy, sxy, count, y_at: np.ndarray
+    ) -> np.ndarray:
+        """
+        Local-linear estimate at d = 0 from weighted moments.
+
+        Mirrors statsmodels' projection form: weighted variance floored at
+        1e-12, and the raw value kept where fewer than two weights are
+        non-zero.
+        """
+        ok = (count >= 2) & (s0 > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_bar = s1 / s0
+            y_bar = sy / s0
+            var = np.maximum(s2 / s0 - x_bar * x_bar, 1e-12)
+            cov = sxy / s0 - x_bar * y_bar
+            y_fit = y_bar - x_bar * cov / var
+        return np.where(ok, y_fit, y_at)
+
+    def _fit_dense(self, y: np.ndarray, r: Optional[np.ndarray], k: int) -> np.ndarray:
+        """Fit every grid point: FFT correlations inside, explicit edges"""
+        n = len(y)
+        offset = k // 2  # i - window start for unclipped windows
+        y_fit = np.empty_like(y)
+
+        # Interior: one shared window d = -offset..k-1-offset
+        d = np.arange(k, dtype=float) - offset
+        radius = float(max(offset, k - 1 - offset))
+        kern = self._tricube(d / radius)
+        kernels = np.stack([kern, kern * d, kern * d * d])
+
+        n_fft = next_fast_len(n + k - 1)
+        kern_f = np.fft.rfft(kernels[:, ::-1], n_fft, axis=1)[:, :, np.newaxis]
+
+        def correlate(z_f, kern_row):
+            out = np.fft.irfft(z_f * kern_f[kern_row], n_fft, axis=0)
+            return out[k - 1:n]
+
+        ry = y if r is None else r * y
+        ry_f = np.fft.rfft(ry, n_fft, axis=0)
+        if r is None:
+            ones_f = np.fft.rfft(np.ones((n, 1)), n_fft, axis=0)
+            s0, s1, s2 = (correlate(ones_f, j) for j in range(3))
+            count = np.full_like(s0, np.count_nonzero(kern > 1e-12))
+        else:
+            r_f = np.fft.rfft(r, n_fft, axis=0)
+            s0, s1, s2 = (correlate(r_f, j) for j in range(3))
+            active_f = np.fft.rfft((r > 1e-12).astype(float), n_fft, axis=0)
+            count = np.rint(np.fft.irfft(
+                active_f * np.fft.rfft((kern > 1e-12)[::-1].astype(float), n_fft)[:, np.newaxis],
+                n_fft, axis=0
+            )[k - 1:n])
+        sy = correlate(ry_f, 0)
+        sxy = correlate(ry_f, 1)
+
+        interior = slice(offset, n - k + offset + 1)
+        y_fit[interior] = self._solve_local_linear(
+            s0, s1, s2, sy, sxy, count, y[interior]
+        )
+
+        # Edges: windows pinned to [0, k) and [n - k, n), one matmul per side
+        r_full = np.ones((n, 1)) if r is None else r
+        for idx, left in ((np.arange(0, offset), 0),
+                          (np.arange(n - k + offset + 1, n), n - k)):
+            if not len(idx):
+                continue
+            d = left + np.arange(k) - idx[:, np.newaxis]
+            radius = np.maximum(idx - left, left + k - 1 - idx)[:, np.newaxis]
+            kern = self._tricube(d / radius)
+            kd = kern * d
+            win_r = r_full[left:left + k]
+            win_ry = ry[left:left + k]
+            y_fit[idx] = self._solve_local_linear(
+                kern @ win_r, kd @ win_r, (kd * d) @ win_r,
+                kern @ win_ry, kd @ win_ry,
+                (kern > 1e-12).astype(float) @ (win_r > 1e-12),
+                y[idx]
+            )
+        return y_fit
+
+    def _fit_rows(
+        self, y: np.ndarray, r: Optional[np.ndarray], k: int, rows: np.ndarray
+    ) -> np.ndarray:
+        """Fit selected grid points with explicit windows, in row blocks"""
+        n, n_cols = y.shape
+        out = np.empty((len(rows), n_cols))
+
+        ry = y if r is None else r * y
+        r_full = np.ones((n, 1)) if r is None else r
+        windows_r = sliding_window_view(r_full, k, axis=0)
+        windows_ry = sliding_window_view(ry, k, axis=0)
+        windows_act = sliding_window_view(r_full > 1e-12, k, axis=0)
+
+        block = max(1, self.ROW_BLOCK_ELEMENTS // (k * n_cols))
+        for start in range(0, len(rows), block):
+            idx = rows[start:start + block]
+
+            # Window start per point (statsmodels' neighbourhood sliding rule)
+            left = np.clip(np.ceil(idx - k / 2.0).astype(int), 0, n - k)
+            d = left[:, np.newaxis] + np.arange(k) - idx[:, np.newaxis]
+            radius = np.maximum(idx - left, left + k - 1 - idx)[:, np.newaxis]
+            kern = self._tricube(d / radius)
+
+            w_r = windows_r[left]
+            w_ry = windows_ry[left]
+            s0 = np.einsum('rk,rck->rc', kern, w_r)
+            s1 = np.einsum('rk,rck->rc', kern * d, w_r)
+            s2 = np.einsum('rk,rck->rc', kern * d * d, w_r)
+            sy = np.einsum('rk,rck->rc', kern, w_ry)
+            sxy = np.einsum('rk,rck->rc', kern * d, w_ry)
+            count = np.einsum('rk,rck->rc', (kern > 1e-12).astype(float), windows_act[left])
+
+            out[start:start + block] = self._solve_local_linear(
+                s0, s1, s2, sy, sxy, count, y[idx]
+            )
+        return out
+
+    @staticmethod
+    def _interpolate_fits(fits: np.ndarray, fit_idx: np.ndarray, n: int) -> np.ndarray:
+        """Linear interpolation of the fitted rows onto the full grid"""
+        grid = np.arange(n)
+        hi = np.clip(np.searchsorted(fit_idx, grid), 1, len(fit_idx) - 1)
+        lo = hi - 1
+        a = ((grid - fit_idx[lo]) / (fit_idx[hi] - fit_idx[lo]))[:, np.newaxis]
+        return (1.0 - a) * fits[lo] + a * fits[hi]
+
+    @staticmethod
+    def _residual_weights(y: np.ndarray, y_fit: np.ndarray) -> np.ndarray:
+        """Bisquare robustness weights from 6x the per-column median residual"""
+        resid = np.abs(y - y_fit)
+        median = np.median(resid, axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = np.where(median > 0, resid / (6.0 * median), (resid > 0).astype(float))
+        u = np.minimum(u, 1.0)
+        return (1.0 - u * u) ** 2
+
     def _smooth_1d(self, data: np.ndarray) -> np.ndarray:
         """Apply LOWESS smoothing to 1D signal"""
         try:
             x = np.arange(len(data))
-            smoothed = lowess(data, x, frac=self.frac, it=self.it, delta=self.delta)
+            smoothed = lowess(data, x, frac=self.frac, it=self.it, delta=self._resolve_delta(len(data)))
             return smoothed[:, 1]
         except ImportError:
             # Fallback to simple moving average if statsmodels not available
@@ -986,19 +2081,34 @@ class RTSSmoother(BaseFilter):
         self,
         process_noise: float = 0.01,
         measurement_noise: float = 0.1,
-        state_dim: int = 2
+        state_dim: int = 2,
+        vectorized: bool = True,
+        steady_state: bool = False,
+        steady_state_tol: float = 1e-12
     ):
         """
         Args:
             process_noise: Process noise variance (Q)
             measurement_noise: Measurement noise variance (R)
             state_dim: State dimension (2 = position+velocity, 3 = +acceleration)
+            vectorized: Compute gain matrices once and smooth all columns
+                together (False = original per-column loop)
+            steady_state: Stop the Riccati recursion once the covariance
+                converges and reuse the converged gains for the remaining
+                samples (constant memory for long recordings)
+            steady_state_tol: Relative covariance change treated as converged
         """
         self.process_noise = process_noise
         self.measurement_noise = measurement_noise
         self.state_dim = state_dim
+        self.vectorized = vectorized
+        self.steady_state = steady_state
+        self.steady_state_tol = steady_state_tol
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            return self._smooth_batched(data)
+
         if data.ndim == 1:
             return self._smooth_1d(data)
 
@@ -1007,9 +2117,8 @@ class RTSSmoother(BaseFilter):
             result[:, col] = self._smooth_1d(data[:, col])
         return result
 
-    def _smooth_1d(self, data: np.ndarray) -> np.ndarray:
-        """Apply RTS smoothing to 1D signal"""
-        n = len(data)
+    def _model_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Build F, H, Q, R for the constant velocity/acceleration model"""
         dim = self.state_dim
 
         # State transition matrix (constant velocity/acceleration model)
@@ -1024,6 +2133,111 @@ class RTSSmoother(BaseFilter):
         Q = self.process_noise * np.eye(dim)
         R = np.array([[self.measurement_noise]])
 
+        return F, H, Q, R
+
+    def _compute_gains(self, n: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Compute forward Kalman gains and backward smoother gains.
+
+        F, H, Q and R are shared by every channel and the covariance
+        recursion does not depend on the measurements, so the gains are
+        computed once per call instead of once per column.
+
+        Returns:
+            Tuple of (K, G, n_computed): K is (n_computed, dim) forward
+            gains, G is (n_computed, dim, dim) smoother gains. In
+            steady-state mode n_computed may be smaller than n, and the
+            last row holds the converged gains for all later samples.
+        """
+        F, H, Q, R = self._model_matrices()
+        dim = self.state_dim
+        eye = np.eye(dim)
+
+        # Steady-state mode only stores gains up to convergence
+        capacity = min(n, 64) if self.steady_state else n
+        K_seq = np.zeros((capacity, dim))
+        P_seq = np.zeros((capacity, dim, dim))
+
+        P = np.eye(dim)
+        n_computed = n
+
+        for i in range(n):
+            P_pred = F @ P @ F.T + Q
+            S = H @ P_pred @ H.T + R
+            K = P_pred @ H.T @ np.linalg.inv(S)
+            P_new = (eye - K @ H) @ P_pred
+
+            if i == len(K_seq):
+                capacity = min(n, 2 * capacity)
+                K_seq = np.resize(K_seq, (capacity, dim))
+                P_seq = np.resize(P_seq, (capacity, dim, dim))
+
+            K_seq[i] = K[:, 0]
+            P_seq[i] = P_new
+
+            if self.steady_state and i > 0:
+                change = np.max(np.abs(P_new - P)) / (np.max(np.abs(P)) + 1e-300)
+                if change < self.steady_state_tol:
+                    n_computed = i + 1
+                    break
+
+            P = P_new
+
+        K_seq = K_seq[:n_computed]
+        P_seq = P_seq[:n_computed]
+
+        # Smoother gains for every stored covariance in one batched inverse
+        P_pred_seq = F @ P_seq @ F.T + Q
+        G_seq = P_seq @ F.T @ np.linalg.inv(P_pred_seq)
+
+        return K_seq, G_seq, n_computed
+
+    def _smooth_batched(self, data: np.ndarray) -> np.ndarray:
+        """Apply RTS smoothing to all columns over a (frames, channels, state_dim) tensor"""
+        is_1d = data.ndim == 1
+        sig = np.asarray(data, dtype=float).reshape(len(data), -1)
+        n, n_channels = sig.shape
+        dim = self.state_dim
+
+        if n == 0:
+            return sig[:, 0] if is_1d else sig.astype(data.dtype)
+
+        F, _, _, _ = self._model_matrices()
+        K_seq, G_seq, n_computed = self._compute_gains(n)
+        last = n_computed - 1
+
+        # Forward pass (Kalman filter) for all channels
+        x_forward = np.zeros((n, n_channels, dim))
+        x = np.zeros((n_channels, dim))
+        x[:, 0] = sig[0]
+
+        for i in range(n):
+            K = K_seq[min(i, last)]
+            x_pred = x @ F.T
+            innovation = sig[i] - x_pred[:, 0]
+            x = x_pred + innovation[:, np.newaxis] * K
+            x_forward[i] = x
+
+        # Backward pass (RTS smoother) for all channels
+        x_smooth = np.zeros((n, n_channels, dim))
+        x_smooth[-1] = x_forward[-1]
+
+        for i in range(n - 2, -1, -1):
+            G = G_seq[min(i, last)]
+            x_smooth[i] = x_forward[i] + (x_smooth[i + 1] - x_forward[i] @ F.T) @ G.T
+
+        result = x_smooth[:, :, 0]
+        if is_1d:
+            return result[:, 0]
+        return result.astype(data.dtype, copy=False)
+
+    def _smooth_1d(self, data: np.ndarray) -> np.ndarray:
+        """Apply RTS smoothing to 1D signal"""
+        n = len(data)
+        dim = self.state_dim
+
+        F, H, Q, R = self._model_matrices()
+
         # Forward pass (Kalman filter)
         x_forward = np.zeros((n, dim))
         P_forward = np.zeros((n, dim, dim))
@@ -1081,7 +2295,9 @@ class ParticleFilter(BaseFilter):
         n_particles: int = 100,
         process_noise: float = 0.1,
         measurement_noise: float = 0.05,
-        resampling_threshold: float = 0.5
+        resampling_threshold: float = 0.5,
+        seed: Optional[int] = 0,
+        vectorized: bool = True
     ):
         """
         Args:
@@ -1089,27 +2305,93 @@ class ParticleFilter(BaseFilter):
             process_noise: Process noise std deviation
             measurement_noise: Measurement noise std deviation
             resampling_threshold: Effective sample size ratio for resampling
+            seed: Seed for the numpy Generator created on every apply call,
+                so repeated runs are bit-identical (None = fresh entropy)
+            vectorized: Hold particles as a (n_particles, n_channels) matrix
+                and filter all columns together (False = per-column loop)
         """
         self.n_particles = n_particles
         self.process_noise = process_noise
         self.measurement_noise = measurement_noise
         self.resampling_threshold = resampling_threshold
+        self.seed = seed
+        self.vectorized = vectorized
 
     def apply(self, data: np.ndarray) -> np.ndarray:
+        rng = np.random.default_rng(self.seed)
+
+        if self.vectorized:
+            return self._filter_batched(data, rng)
+
         if data.ndim == 1:
-            return self._filter_1d(data)
+            return self._filter_1d(data, rng)
 
         result = np.zeros_like(data)
         for col in range(data.shape[1]):
-            result[:, col] = self._filter_1d(data[:, col])
+            result[:, col] = self._filter_1d(data[:, col], rng)
         return result
 
-    def _filter_1d(self, data: np.ndarray) -> np.ndarray:
+    def _filter_batched(self, data: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Apply particle filter to all columns with a (n_particles, n_channels) particle matrix"""
+        is_1d = data.ndim == 1
+        sig = np.asarray(data, dtype=float).reshape(len(data), -1)
+        n, n_channels = sig.shape
+        n_p = self.n_particles
+
+        estimates = np.zeros((n, n_channels))
+        if n == 0:
+            return estimates[:, 0] if is_1d else estimates.astype(data.dtype)
+
+        # Initialize particles around first observation
+        particles = sig[0] + rng.standard_normal((n_p, n_channels)) * self.measurement_noise
+        estimates[0] = sig[0]
+
+        for t in range(1, n):
+            # Predict (state transition with noise)
+            particles += rng.standard_normal((n_p, n_channels)) * self.process_noise
+
+            # Update weights (likelihood) per channel
+            diff = sig[t] - particles
+            weights = np.exp(-0.5 * (diff / self.measurement_noise) ** 2)
+            weights += 1e-300  # Avoid zero weights
+            weights /= weights.sum(axis=0)
+
+            # Estimate (weighted mean)
+            estimates[t] = np.sum(weights * particles, axis=0)
+
+            # Resample channels whose effective sample size is low
+            n_eff = 1.0 / np.sum(weights ** 2, axis=0)
+            resample = n_eff < self.resampling_threshold * n_p
+            if np.any(resample):
+                cols = np.flatnonzero(resample)
+                indices = self._systematic_resample_batched(weights[:, cols], rng)
+                particles[:, cols] = np.take_along_axis(particles[:, cols], indices, axis=0)
+
+        if is_1d:
+            return estimates[:, 0]
+        return estimates.astype(data.dtype, copy=False)
+
+    def _systematic_resample_batched(
+        self, weights: np.ndarray, rng: np.random.Generator
+    ) -> np.ndarray:
+        """Systematic resampling of every column of a (n_particles, n_channels) weight matrix"""
+        n, n_channels = weights.shape
+        positions = (np.arange(n)[:, np.newaxis] + rng.random(n_channels)) / n
+
+        # Offset each column by its index so one searchsorted covers all columns
+        offsets = np.arange(n_channels)
+        cumsum = np.cumsum(weights, axis=0) + offsets
+        flat_idx = np.searchsorted(cumsum.ravel(order='F'), (positions + offsets).ravel(order='F'))
+        indices = flat_idx.reshape(n_channels, n).T - offsets * n
+
+        return np.clip(indices, 0, n - 1)
+
+    def _filter_1d(self, data: np.ndarray, rng: np.random.Generator) -> np.ndarray:
         """Apply particle filter to 1D signal"""
         n = len(data)
 
         # Initialize particles around first observation
-        particles = data[0] + np.random.randn(self.n_particles) * self.measurement_noise
+        particles = data[0] + rng.standard_normal(self.n_particles) * self.measurement_noise
         weights = np.ones(self.n_particles) / self.n_particles
 
         estimates = np.zeros(n)
@@ -1117,7 +2399,7 @@ class ParticleFilter(BaseFilter):
 
         for t in range(1, n):
             # Predict (state transition with noise)
-            particles = particles + np.random.randn(self.n_particles) * self.process_noise
+            particles = particles + rng.standard_normal(self.n_particles) * self.process_noise
 
             # Update weights (likelihood)
             diff = data[t] - particles
@@ -1131,16 +2413,16 @@ class ParticleFilter(BaseFilter):
             # Resample if effective sample size is low
             n_eff = 1.0 / np.sum(weights ** 2)
             if n_eff < self.resampling_threshold * self.n_particles:
-                indices = self._systematic_resample(weights)
+                indices = self._systematic_resample(weights, rng)
                 particles = particles[indices]
                 weights = np.ones(self.n_particles) / self.n_particles
 
         return estimates
 
-    def _systematic_resample(self, weights: np.ndarray) -> np.ndarray:
+    def _systematic_resample(self, weights: np.ndarray, rng: np.random.Generator) -> np.ndarray:
         """Systematic resampling algorithm"""
         n = len(weights)
-        positions = (np.arange(n) + np.random.random()) / n
+        positions = (np.arange(n) + rng.random()) / n
 
         cumsum = np.cumsum(weights)
         indices = np.searchsorted(cumsum, positions)
@@ -1154,7 +2436,8 @@ class ParticleFilter(BaseFilter):
             'n_particles': self.n_particles,
             'process_noise': self.process_noise,
             'measurement_noise': self.measurement_noise,
-            'resampling_threshold': self.resampling_threshold
+            'resampling_threshold': self.resampling_threshold,
+            'seed': self.seed
         }
 
 
@@ -1162,29 +2445,240 @@ class ParticleFilter(BaseFilter):
 # FILTER CHAIN
 # =============================================================================
 
-class FilterChain:
-    """
-    Chain multiple filters together for sequential application.
-    """
+def _apply_channel_parallel(
+    fn: Callable[[np.ndarray], np.ndarray],
+    data: np.ndarray,
+    workers: Optional[int]
+) -> np.ndarray:
+    """
+    Apply a column-independent function over channel blocks in a thread pool.
+
+    numpy/scipy/pywt kernels release the GIL, so contiguous blocks of
+    columns are filtered concurrently and concatenated back in order.
+
+    Args:
+        fn: Function mapping (n_samples, n_block_channels) to the same shape
+        data: Input signal (n_samples, n_channels) or (n_samples,)
+        workers: Number of threads (None = os.cpu_count(), <= 1 = serial)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or data.ndim != 2 or data.shape[1] < 2:
+        return fn(data)
+
+    blocks = np.array_split(np.arange(data.shape[1]), min(workers, data.shape[1]))
+
+    with ThreadPoolExecutor(max_workers=len(blocks)) as pool:
+        results = list(pool.map(lambda cols: fn(data[:, cols]), blocks))
+
+    return np.concatenate(results, axis=1)
+
+
+class FilterChain:
+    """
+    Chain multiple filters together for sequential application.
+    """
+
+    def __init__(self, filters: Optional[List[BaseFilter]] = None):
+        self.filters = filters or []
+
+    def add(self, filter_: BaseFilter) -> 'FilterChain':
+        """Add a filter to the chain"""
+        self.filters.append(filter_)
+        return self
+
+    def apply(self, data: np.ndarray, workers: Optional[int] = 1) -> np.ndarray:
+        """
+        Apply all filters in sequence.
+
+        Args:
+            data: Input signal (n_samples, n_channels) or (n_samples,)
+            workers: Threads to split channels across (None = all cores)
+        """
+        return _apply_channel_parallel(self._apply_serial, data, workers)
+
+    def _apply_serial(self, data: np.ndarray) -> np.ndarray:
+        """Apply all filters in sequence on the calling thread"""
+        result = data.copy()
+        for f in self.filters:
+            result = f.apply(result)
+        return result
+
+    def get_params(self) -> List[Dict]:
+        """Get parameters of all filters"""
+        return [f.get_params() for f in self.filters]
+
+    def compile(self, dtype=np.float64, fuse_linear: bool = True) -> 'FilterPlan':
+        """
+        Compile the chain into a reusable execution plan.
+
+        Args:
+            dtype: Working precision (np.float32 halves memory traffic)
+            fuse_linear: Merge adjacent linear time-invariant stages
+                (IIR sections, FIR kernels) into a single cascade
+
+        Returns:
+            FilterPlan with the same apply() interface
+        """
+        return FilterPlan(self.filters, dtype=dtype, fuse_linear=fuse_linear)
+
+
+@dataclass
+class PlanStage:
+    """One step of a compiled FilterPlan"""
+    kind: str  # 'iir', 'fir', 'median' or 'filter'
+    sources: List[BaseFilter]
+    sos: Optional[np.ndarray] = None
+    kernel: Optional[np.ndarray] = None
+    min_length: int = 0
+    size: int = 0
+
+
+class FilterPlan:
+    """
+    Compiled execution plan for a FilterChain.
+
+    Features:
+    - Adjacent LTI stages merged into one cascade (zero-phase IIR sections
+      are concatenated, FIR kernels are convolved); results match the
+      sequential chain away from the recording edges
+    - Unfused plans reproduce FilterChain.apply exactly; 1-D input keeps
+      each filter's own 1-D boundary handling (medfilt/np.convolve)
+    - Ping-pong work buffers preallocated per input shape and thread and
+      reused across calls, so one plan can be shared by worker threads
+    - Optional float32 execution
+    """
+
+    def __init__(
+        self,
+        filters: List[BaseFilter],
+        dtype=np.float64,
+        fuse_linear: bool = True
+    ):
+        self.dtype = np.dtype(dtype)
+        self.fuse_linear = fuse_linear
+        self.stages = self._build_stages(filters)
+        self._local = threading.local()
+
+    def _build_stages(self, filters: List[BaseFilter]) -> List[PlanStage]:
+        """Map filters to plan stages, fusing adjacent linear ones"""
+        stages: List[PlanStage] = []
+
+        for f in filters:
+            stage = self._stage_for(f)
+            if stage is None:
+                continue
+
+            prev = stages[-1] if stages else None
+            if self.fuse_linear and prev is not None and prev.kind == stage.kind:
+                if stage.kind == 'iir':
+                    prev.sos = np.vstack([prev.sos, stage.sos])
+                    prev.sources.extend(stage.sources)
+                    continue
+                if stage.kind == 'fir':
+                    prev.kernel = np.convolve(prev.kernel, stage.kernel)
+                    prev.min_length = max(prev.min_length, stage.min_length)
+                    prev.sources.extend(stage.sources)
+                    continue
+
+            stages.append(stage)
+
+        return stages
+
+    def _stage_for(self, f: BaseFilter) -> Optional[PlanStage]:
+        """Build the plan stage for a single filter (None = no-op)"""
+        if isinstance(f, IIRFilter):
+            if f._is_passthrough():
+                return None
+            return PlanStage(kind='iir', sources=[f], sos=np.array(f.sos, dtype=self.dtype))
+
+        if isinstance(f, MovingAverageFilter):
+            kernel = np.ones(f.window, dtype=self.dtype) / f.window
+            return PlanStage(kind='fir', sources=[f], kernel=kernel, min_length=f.window)
+
+        if isinstance(f, GaussianFilter):
+            radius = int(4.0 * f.sigma + 0.5)
+            x = np.arange(-radius, radius + 1)
+            kernel = np.exp(-0.5 * (x / f.sigma) ** 2)
+            kernel = (kernel / kernel.sum()).astype(self.dtype)
+            return PlanStage(kind='fir', sources=[f], kernel=kernel)
+
+        if isinstance(f, MedianFilter):
+            return PlanStage(kind='median', sources=[f], size=f.kernel_size)
+
+        return PlanStage(kind='filter', sources=[f])
+
+    def _get_buffers(self, shape: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """Calling thread's work buffers for this input shape (reallocated only when it changes)"""
+        buffers = getattr(self._local, 'buffers', None)
+        if buffers is None or buffers[0].shape != shape:
+            buffers = self._local.buffers = (
+                np.empty(shape, dtype=self.dtype),
+                np.empty(shape, dtype=self.dtype)
+            )
+        return buffers
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        """Run the plan; returns a new array that does not alias the work buffers"""
+        is_1d = data.ndim == 1
+        current = np.asarray(data).reshape(len(data), -1)
+        buffers = self._get_buffers(current.shape)
+
+        # Cast into a work buffer instead of copying the input
+        np.copyto(buffers[0], current, casting='unsafe')
+        current = buffers[0]
+
+        for stage in self.stages:
+            out = buffers[1] if current is buffers[0] else buffers[0]
+            if is_1d and stage.kind != 'iir':
+                # Filters' 1-D paths (medfilt/np.convolve zero padding) differ from 2-D
+                current = self._run_sources(stage, current, is_1d)
+            else:
+                current = self._run_stage(stage, current, out)
+
+        result = np.array(current, dtype=self.dtype)
+        return result[:, 0] if is_1d else result
+
+    def _run_stage(self, stage: PlanStage, data: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Run one stage, writing into `out` when the stage supports it"""
+        if stage.kind == 'iir':
+            padlen = _sos_padlen(stage.sos)
+            if len(data) <= padlen:
+                # Too short for the fused cascade; each filter pads on its own
+                return self._run_sources(stage, data)
+            return signal.sosfiltfilt(stage.sos, data, axis=0, padlen=padlen).astype(
+                self.dtype, copy=False
+            )
+
+        if stage.kind == 'fir':
+            if len(data) < stage.min_length:
+                return data
+            ndimage.convolve1d(data, stage.kernel, axis=0, output=out, mode='reflect')
+            return out
 
-    def __init__(self, filters: Optional[List[BaseFilter]] = None):
-        self.filters = filters or []
+        if stage.kind == 'median':
+            ndimage.median_filter(data, size=(stage.size, 1), output=out)
+            return out
 
-    def add(self, filter_: BaseFilter) -> 'FilterChain':
-        """Add a filter to the chain"""
-        self.filters.append(filter_)
-        return self
+        return self._run_sources(stage, data)
 
-    def apply(self, data: np.ndarray) -> np.ndarray:
-        """Apply all filters in sequence"""
-        result = data.copy()
-        for f in self.filters:
+    def _run_sources(self, stage: PlanStage, data: np.ndarray, is_1d: bool = False) -> np.ndarray:
+        """Apply the stage's filters one by one (1-D input gets a 1-D column)"""
+        result = data[:, 0] if is_1d else data
+        for f in stage.sources:
             result = f.apply(result)
-        return result
-
-    def get_params(self) -> List[Dict]:
-        """Get parameters of all filters"""
-        return [f.get_params() for f in self.filters]
+        return np.asarray(result, dtype=self.dtype).reshape(len(data), -1)
+
+    def describe(self) -> List[Dict]:
+        """Describe the compiled stages and which filters each one covers"""
+        return [
+            {
+                'kind': stage.kind,
+                'filters': [f.get_params().get('type', type(f).__name__) for f in stage.sources],
+            }
+            for stage in self.stages
+        ]
 
 
 # =============================================================================
@@ -1340,15 +2834,8 @@ class FilterCalibrator:
         return np.std(noise)
 
     def _estimate_motion_frequency(self, sig: np.ndarray) -> float:
-        """Estimate dominant motion frequency using FFT"""
-        # Compute power spectrum
-        freqs = np.fft.rfftfreq(len(sig), 1/self.fs)
-        fft = np.fft.rfft(sig)
-        power = np.abs(fft) ** 2
-
-        # Find dominant frequency (exclude DC component)
-        dominant_idx = np.argmax(power[1:]) + 1
-        return freqs[dominant_idx]
+        """Estimate dominant motion frequency using FFT (DC excluded)"""
+        return PERIOD_ESTIMATOR.frequencies(sig, self.fs, min_samples=2)
 
     def _estimate_motion_speed(self, sig: np.ndarray) -> float:
         """Estimate motion speed (average velocity magnitude)"""
@@ -1388,24 +2875,46 @@ class AdaptiveGaussianFilter(BaseFilter):
     Features:
     - Wider kernel in noisy regions (more smoothing)
     - Narrower kernel in high-motion regions (preserve dynamics)
+    - Per-sample sigma: a bank of Gaussian kernels at quantized sigma levels
+      is built once and every output sample uses its own kernel
+    - Rolling noise and speed computed for all channels in one pass
     """
 
+    # Rows per block when gathering per-sample kernels (bounds temporaries)
+    ROW_BLOCK = 1024
+
     def __init__(
         self,
         min_sigma: float = 0.5,
         max_sigma: float = 3.0,
-        window_size: int = 30
+        window_size: int = 30,
+        n_sigma_levels: int = 32,
+        vectorized: bool = True
     ):
+        """
+        Args:
+            min_sigma: Sigma in clean or fast-moving regions
+            max_sigma: Sigma in noisy, slow regions
+            window_size: Rolling window for the local noise estimate
+            n_sigma_levels: Quantization levels of the kernel bank
+            vectorized: Per-sample kernel bank over all channels
+                (False = per-column loop with 10 constant-sigma segments)
+        """
         self.min_sigma = min_sigma
         self.max_sigma = max_sigma
         self.window_size = window_size
+        self.n_sigma_levels = max(1, n_sigma_levels)
+        self.vectorized = vectorized
+
+        self._sigma_levels, self._kernel_bank = self._build_kernel_bank()
 
     def get_params(self) -> dict:
         """Return filter parameters"""
         return {
             'min_sigma': self.min_sigma,
             'max_sigma': self.max_sigma,
-            'window_size': self.window_size
+            'window_size': self.window_size,
+            'n_sigma_levels': self.n_sigma_levels
         }
 
     def apply(self, data: np.ndarray) -> np.ndarray:
@@ -1413,6 +2922,9 @@ class AdaptiveGaussianFilter(BaseFilter):
         if data.ndim == 1:
             data = data.reshape(-1, 1)
 
+        if self.vectorized:
+            return self._apply_batched(data)
+
         n_samples, n_features = data.shape
         filtered = np.zeros_like(data)
 
@@ -1436,6 +2948,98 @@ class AdaptiveGaussianFilter(BaseFilter):
 
         return filtered
 
+    def _apply_batched(self, data: np.ndarray) -> np.ndarray:
+        """Same sigma model as the per-column loop, all channels at once"""
+        sig = np.asarray(data, dtype=float)
+
+        local_noise = self._rolling_noise(sig)
+        velocity = np.abs(np.diff(sig, axis=0, prepend=sig[:1]))
+        local_speed = gaussian_filter1d(velocity, sigma=2.0, axis=0) if len(sig) > 5 else velocity
+
+        def normalize(x):
+            lo = x.min(axis=0)
+            return (x - lo) / (x.max(axis=0) - lo + 1e-10)
+
+        # Combine: more smoothing where noisy AND slow
+        adaptive_factor = normalize(local_noise) * (1 - normalize(local_speed))
+        sigma = self.min_sigma + adaptive_factor * (self.max_sigma - self.min_sigma)
+
+        return self._apply_kernel_bank(sig, sigma).astype(data.dtype, copy=False)
+
+    def _build_kernel_bank(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gaussian kernels (gaussian_filter1d's, truncate=4) at evenly spaced
+        sigma levels, zero-padded to the widest radius: (n_levels, 2R+1).
+        """
+        n_levels = self.n_sigma_levels if self.max_sigma > self.min_sigma else 1
+        levels = np.linspace(self.min_sigma, self.max_sigma, n_levels)
+        radius = int(4.0 * max(levels.max(), 0.0) + 0.5)
+        x = np.arange(-radius, radius + 1, dtype=float)
+
+        bank = np.zeros((len(levels), len(x)))
+        for row, sd in zip(bank, levels):
+            if sd <= 0:
+                row[radius] = 1.0
+                continue
+            r = int(4.0 * sd + 0.5)
+            phi = np.exp(-0.5 / (sd * sd) * x[radius - r:radius + r + 1] ** 2)
+            row[radius - r:radius + r + 1] = phi / phi.sum()
+        return levels, bank
+
+    def _apply_kernel_bank(self, sig: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+        """Convolve every sample with the bank kernel nearest its sigma"""
+        levels = self._sigma_levels
+        if len(levels) > 1:
+            step = (levels[-1] - levels[0]) / (len(levels) - 1)
+            level_idx = np.clip(np.rint((sigma - levels[0]) / step), 0, len(levels) - 1).astype(np.intp)
+        else:
+            level_idx = np.zeros(sigma.shape, dtype=np.intp)
+
+        # Reflect boundary like gaussian_filter1d ('reflect' == np 'symmetric')
+        radius = self._kernel_bank.shape[1] // 2
+        padded = np.pad(sig, ((radius, radius), (0, 0)), mode='symmetric')
+        windows = sliding_window_view(padded, 2 * radius + 1, axis=0)
+
+        filtered = np.empty_like(sig)
+        for start in range(0, len(sig), self.ROW_BLOCK):
+            stop = start + self.ROW_BLOCK
+            kernels = self._kernel_bank[level_idx[start:stop]]
+            filtered[start:stop] = np.einsum('nck,nck->nc', kernels, windows[start:stop])
+        return filtered
+
+    def _rolling_noise(self, sig: np.ndarray) -> np.ndarray:
+        """
+        Rolling noise over [i - half, i + half) for all columns.
+
+        The window median the per-sample version subtracts does not change
+        the std, so this is a plain rolling std (0 for windows of <= 4).
+        """
+        n = len(sig)
+        half_window = self.window_size // 2
+        width = 2 * half_window
+        local_noise = np.zeros_like(sig)
+
+        if width <= 4:
+            return local_noise
+
+        # Full-width windows, in row blocks
+        if n >= width:
+            windows = sliding_window_view(sig, width, axis=0)
+            for start in range(0, len(windows), self.ROW_BLOCK):
+                block = windows[start:start + self.ROW_BLOCK]
+                local_noise[half_window + start:half_window + start + len(block)] = block.std(axis=-1)
+            edges = list(range(half_window)) + list(range(n - half_window + 1, n))
+        else:
+            edges = range(n)
+
+        # Truncated windows at the edges
+        for i in edges:
+            start = max(0, i - half_window)
+            end = min(n, i + half_window)
+            if end - start > 4:
+                local_noise[i] = sig[start:end].std(axis=0)
+        return local_noise
+
     def _compute_local_noise(self, sig: np.ndarray) -> np.ndarray:
         """Compute local noise level using rolling window"""
         local_noise = np.zeros(len(sig))
@@ -1579,46 +3183,46 @@ class AdaptiveSavitzkyGolayFilter(BaseFilter):
         n_samples, n_features = data.shape
         filtered = np.zeros_like(data)
 
-        for i in range(n_features):
-            sig = data[:, i]
-
-            # Estimate dominant frequency
-            dominant_freq = self._estimate_frequency(sig)
-
-            # Adaptive window: high frequency → small window
-            # Target ~1-2 cycles in window
-            cycles_per_window = 1.5
-            optimal_window = int(cycles_per_window * self.fs / (dominant_freq + 0.1))
-            window_length = np.clip(optimal_window, self.min_window, self.max_window)
+        # Estimate dominant frequency of every channel (one batched FFT)
+        dominant_freqs = self._estimate_frequencies(data)
 
-            # Ensure odd window length
-            if window_length % 2 == 0:
-                window_length += 1
+        # Adaptive window: high frequency → small window
+        # Target ~1-2 cycles in window
+        cycles_per_window = 1.5
+        windows = [self._window_length(cycles_per_window * self.fs / (f + 0.1)) for f in dominant_freqs]
 
-            # Ensure window length > polyorder
-            window_length = max(window_length, self.polyorder + 2)
-
-            # Apply Savitzky-Golay
+        # Channels sharing a window length are filtered together
+        for window_length in sorted(set(windows)):
+            cols = [i for i, w in enumerate(windows) if w == window_length]
             try:
-                filtered[:, i] = signal.savgol_filter(sig, window_length, self.polyorder)
+                filtered[:, cols] = signal.savgol_filter(data[:, cols].T, window_length, self.polyorder).T
             except:
                 # Fallback to simple moving average
-                filtered[:, i] = np.convolve(sig, np.ones(window_length)/window_length, mode='same')
+                kernel = np.ones(window_length) / window_length
+                for i in cols:
+                    filtered[:, i] = np.convolve(data[:, i], kernel, mode='same')
 
         return filtered
 
-    def _estimate_frequency(self, sig: np.ndarray) -> float:
-        """Estimate dominant frequency"""
-        if len(sig) < 10:
-            return 1.0
+    def _window_length(self, optimal_window: float) -> int:
+        """Clip to [min_window, max_window], make odd and > polyorder"""
+        window_length = int(np.clip(int(optimal_window), self.min_window, self.max_window))
 
-        freqs = np.fft.rfftfreq(len(sig), 1/self.fs)
-        fft = np.fft.rfft(sig)
-        power = np.abs(fft) ** 2
+        # Ensure odd window length
+        if window_length % 2 == 0:
+            window_length += 1
 
-        # Find peak in power spectrum (exclude DC)
-        dominant_idx = np.argmax(power[1:]) + 1
-        return freqs[dominant_idx]
+        # Ensure window length > polyorder
+        return max(window_length, self.polyorder + 2)
+
+    def _estimate_frequencies(self, data: np.ndarray) -> np.ndarray:
+        """Dominant frequency per channel (DC excluded; 1.0 for short signals)"""
+        freqs = PERIOD_ESTIMATOR.frequencies(data.reshape(len(data), -1), self.fs)
+        return np.where(np.isnan(freqs), 1.0, freqs)
+
+    def _estimate_frequency(self, sig: np.ndarray) -> float:
+        """Estimate dominant frequency"""
+        return float(self._estimate_frequencies(sig)[0])
 
 
 class AdaptiveKalmanFilter(BaseFilter):
@@ -1766,7 +3370,7 @@ class AdaptiveButterworthFilter(BaseFilter):
 
             # Apply Butterworth
             if cutoff < self.fs / 2:
-                sos = signal.butter(self.order, cutoff, 'low', fs=self.fs, output='sos')
+                sos = FILTER_DESIGN_CACHE.get_sos('butter', cutoff, self.fs, self.order)
                 filtered[:, i] = signal.sosfiltfilt(sos, sig)
             else:
                 # Cutoff too high, don't filter
@@ -1885,8 +3489,15 @@ class AdaptiveFilterChain:
         # Build filter chain based on recommendations
         self.filters = self._build_filter_chain(self.calibration)
 
-    def apply(self, data: np.ndarray) -> np.ndarray:
-        """Apply adaptive filter chain"""
+    def apply(self, data: np.ndarray, workers: Optional[int] = 1) -> np.ndarray:
+        """
+        Apply adaptive filter chain.
+
+        Args:
+            data: Input signal (n_samples, n_channels) or (n_samples,)
+            workers: Threads to split channels across (None = all cores);
+                calibration always runs once on the full input first
+        """
         # Auto-calibrate if enabled and not yet calibrated
         if self.auto_calibrate and self.calibration is None:
             self.calibrate(data)
@@ -1895,7 +3506,10 @@ class AdaptiveFilterChain:
         if len(self.filters) == 0:
             return data
 
-        # Apply filters sequentially
+        return _apply_channel_parallel(self._apply_serial, data, workers)
+
+    def _apply_serial(self, data: np.ndarray) -> np.ndarray:
+        """Apply the calibrated filters in sequence on the calling thread"""
         filtered = data.copy()
         for f in self.filters:
             filtered = f.apply(filtered)
@@ -1958,6 +3572,136 @@ class NormalizationStats:
     frames_dropped: int
 
 
+class LandmarkSchema:
+    """
+    Column layout of a landmark DataFrame.
+
+    Maps every (landmark, axis) slot of the (frames, 21, 3) landmark array to
+    a column position, so extraction is one bulk read instead of per-column
+    lookups. Resolve schemas through LANDMARK_SCHEMA_CACHE rather than
+    constructing them directly.
+
+    Features:
+    - Per-slot format priority: named (WRIST_X), L-prefixed (L0_X),
+      Android (landmark_0_x)
+    - Missing slots read as zero
+    - Write-back of a landmark array into the resolved columns
+    """
+
+    FORMATS = ('named', 'indexed', 'android')
+    AXES = ('X', 'Y', 'Z')
+
+    def __init__(self, columns: Sequence[str]):
+        """
+        Args:
+            columns: DataFrame column labels, in order
+        """
+        positions: Dict[str, int] = {}
+        for pos, col in enumerate(columns):
+            positions.setdefault(col, pos)
+
+        n_landmarks = len(LANDMARK_NAMES)
+        self.positions = np.full((n_landmarks, 3), -1, dtype=np.intp)
+        self.column_map: Dict[str, Tuple[int, int]] = {}
+
+        for i, name in enumerate(LANDMARK_NAMES):
+            for j, axis in enumerate(self.AXES):
+                for col in (f"{name}_{axis}", f"L{i}_{axis}", f"landmark_{i}_{axis.lower()}"):
+                    if col in positions:
+                        self.positions[i, j] = positions[col]
+                        self.column_map[col] = (i, j)
+                        break
+
+        flat = self.positions.ravel()
+        self._slots = np.flatnonzero(flat >= 0)
+        self._columns = flat[self._slots]
+        self.complete = np.all(self.positions >= 0, axis=1)
+
+    @property
+    def n_resolved(self) -> int:
+        """Number of (landmark, axis) slots backed by a column"""
+        return len(self._slots)
+
+    def extract(self, df: pd.DataFrame) -> np.ndarray:
+        """Read all landmark columns into a (frames, 21, 3) float array"""
+        frames = len(df)
+        landmarks = np.zeros((frames, self.positions.size))
+        if len(self._slots) == self.positions.size:
+            landmarks[:] = df.iloc[:, self._columns].to_numpy(dtype=np.float64)
+        elif len(self._slots):
+            landmarks[:, self._slots] = df.iloc[:, self._columns].to_numpy(dtype=np.float64)
+        return landmarks.reshape(frames, *self.positions.shape)
+
+    def landmark(self, landmarks: np.ndarray, landmark_idx: int) -> np.ndarray:
+        """(frames, 3) positions of one landmark, or an empty array if any axis is missing"""
+        if not 0 <= landmark_idx < len(self.complete) or not self.complete[landmark_idx]:
+            return np.array([])
+        return landmarks[:, landmark_idx, :]
+
+    def assign(self, df: pd.DataFrame, landmarks: np.ndarray) -> pd.DataFrame:
+        """Write a (frames, 21, 3) array back into the resolved columns of df (in place)"""
+        if len(self._slots):
+            values = landmarks.reshape(len(landmarks), -1)[:, self._slots]
+            df[list(df.columns[self._columns])] = values
+        return df
+
+
+class LandmarkSchemaCache:
+    """
+    Process-wide cache of landmark column schemas.
+
+    Schemas are keyed by the tuple of column labels, so the column-format
+    detection runs once per distinct layout instead of on every extraction.
+    Returned schemas are shared and must not be modified.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        """
+        Args:
+            max_entries: Maximum cached layouts (oldest evicted first)
+        """
+        self.max_entries = max_entries
+        self._schemas: Dict[Tuple, LandmarkSchema] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, df: Union[pd.DataFrame, Sequence[str]]) -> LandmarkSchema:
+        """Get (or detect and cache) the schema for a DataFrame or column list"""
+        columns = df.columns if isinstance(df, pd.DataFrame) else df
+        key = tuple(columns)
+
+        with self._lock:
+            schema = self._schemas.get(key)
+            if schema is not None:
+                self.hits += 1
+                return schema
+            self.misses += 1
+
+        schema = LandmarkSchema(key)
+
+        with self._lock:
+            while len(self._schemas) >= self.max_entries:
+                self._schemas.pop(next(iter(self._schemas)))
+            return self._schemas.setdefault(key, schema)
+
+    def stats(self) -> Dict:
+        """Get cache size and hit/miss counters"""
+        with self._lock:
+            return {'size': len(self._schemas), 'hits': self.hits, 'misses': self.misses}
+
+    def clear(self):
+        """Drop all cached schemas and reset counters"""
+        with self._lock:
+            self._schemas.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared by every normalizer and analyzer in the process
+LANDMARK_SCHEMA_CACHE = LandmarkSchemaCache()
+
+
 class DataNormalizer:
     """
     Normalizes hand landmark data for LSTM processing.
@@ -2051,26 +3795,7 @@ class DataNormalizer:
         2. L-prefixed: L0_X, L1_X, etc.
         3. Android format: landmark_0_x, landmark_0_y, landmark_0_z
         """
-        frames = len(df)
-        landmarks = np.zeros((frames, 21, 3))
-
-        for i, name in enumerate(LANDMARK_NAMES):
-            for j, axis in enumerate(['X', 'Y', 'Z']):
-                col = f"{name}_{axis}"
-                if col in df.columns:
-                    landmarks[:, i, j] = df[col].values
-                else:
-                    # Try L-prefixed format: L0_X, L1_X, etc.
-                    alt_col = f"L{i}_{axis}"
-                    if alt_col in df.columns:
-                        landmarks[:, i, j] = df[alt_col].values
-                    else:
-                        # Try Android format: landmark_0_x, landmark_0_y, landmark_0_z
-                        android_col = f"landmark_{i}_{axis.lower()}"
-                        if android_col in df.columns:
-                            landmarks[:, i, j] = df[android_col].values
-
-        return landmarks
+        return LANDMARK_SCHEMA_CACHE.resolve(df).extract(df)
 
     def _center_on_wrist(self, landmarks: np.ndarray) -> np.ndarray:
         """Center all landmarks relative to wrist position"""
@@ -2490,11 +4215,8 @@ class DataNormalizer:
         n_frames = len(df)
 
         # Step 1: Extract raw landmarks (21 landmarks x 3 coords)
-        landmarks = np.zeros((n_frames, 21, 3))
-        for i in range(21):
-            landmarks[:, i, 0] = df[f'landmark_{i}_x'].values
-            landmarks[:, i, 1] = df[f'landmark_{i}_y'].values
-            landmarks[:, i, 2] = df[f'landmark_{i}_z'].values
+        android_cols = [f'landmark_{i}_{axis}' for i in range(21) for axis in 'xyz']
+        landmarks = df[android_cols].to_numpy(dtype=np.float64).reshape(n_frames, 21, 3)
 
         # Step 2: WRIST-CENTER the landmarks (wrist becomes origin)
         wrist = landmarks[:, 0:1, :]  # Shape: (n_frames, 1, 3)
@@ -2649,6 +4371,159 @@ class DataNormalizer:
         return sequences
 
 
+@dataclass
+class GapReport:
+    """Runs of outlier/dropout frames found before gap filling"""
+    n_frames: int
+    gap_starts: np.ndarray  # First frame of each run
+    gap_lengths: np.ndarray  # Frames in each run
+    n_gap_frames: int
+    gap_fraction: float
+    max_gap_length: int
+
+    @property
+    def n_gaps(self) -> int:
+        return len(self.gap_starts)
+
+    def to_dict(self) -> Dict:
+        """JSON-ready summary"""
+        return {
+            'n_frames': self.n_frames,
+            'n_gaps': self.n_gaps,
+            'n_gap_frames': self.n_gap_frames,
+            'gap_fraction': self.gap_fraction,
+            'max_gap_length': self.max_gap_length,
+            'gap_lengths': self.gap_lengths.tolist(),
+        }
+
+
+class GapFiller:
+    """
+    Interpolates runs of bad frames across every channel in one call.
+
+    Features:
+    - 'linear', 'cubic' (cubic spline) or 'pchip' (shape-preserving) modes
+    - All channels of all gaps filled at once from the surrounding valid frames
+    - Per-channel masks (each channel with its own bad samples) filled
+      column-wise in one vectorized pass
+    - Gaps touching the start or end hold the nearest valid frame
+    - Gap run lengths reported up front, so recordings with too many
+      dropouts can be rejected before any interpolation
+    """
+
+    METHODS = ('linear', 'cubic', 'pchip')
+
+    def __init__(self, method: str = 'linear'):
+        """
+        Args:
+            method: 'linear', 'cubic' or 'pchip'
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method: {method}. Choose from {list(self.METHODS)}")
+        self.method = method
+
+    @staticmethod
+    def report(frame_mask: np.ndarray) -> GapReport:
+        """Gap runs of a per-frame bad-frame mask"""
+        frame_mask = np.asarray(frame_mask, dtype=bool)
+        runs = run_length_segments(frame_mask, valid=frame_mask)
+        lengths = runs.ends - runs.starts + 1
+        n_frames = len(frame_mask)
+        n_gap_frames = int(frame_mask.sum())
+        return GapReport(
+            n_frames=n_frames,
+            gap_starts=runs.starts,
+            gap_lengths=lengths,
+            n_gap_frames=n_gap_frames,
+            gap_fraction=n_gap_frames / max(n_frames, 1),
+            max_gap_length=int(lengths.max()) if lengths.size else 0
+        )
+
+    def fill(self, data: np.ndarray, frame_mask: np.ndarray) -> np.ndarray:
+        """
+        Replace the masked frames of data.
+
+        Args:
+            data: (n_frames, ...) e.g. (n_frames, 21, 3) landmarks
+            frame_mask: (n_frames,) True for frames to replace, or a mask
+                of data's shape to replace samples per channel
+
+        Returns:
+            Copy of data with masked frames interpolated (a channel is
+            unchanged if none of its frames is valid)
+        """
+        frame_mask = np.asarray(frame_mask, dtype=bool)
+        if frame_mask.ndim > 1:
+            return self._fill_channels(data, frame_mask)
+
+        n = len(data)
+        flat = data.reshape(n, int(np.prod(data.shape[1:])))
+        result = flat.copy()
+
+        valid = np.flatnonzero(~frame_mask)
+        gaps = np.flatnonzero(frame_mask)
+        if valid.size == 0 or gaps.size == 0:
+            return result.reshape(data.shape)
+
+        # Edge gaps: hold the nearest valid frame
+        first, last = valid[0], valid[-1]
+        result[gaps[gaps < first]] = flat[first]
+        result[gaps[gaps > last]] = flat[last]
+
+        inner = gaps[(gaps > first) & (gaps < last)]
+        if inner.size:
+            result[inner] = self._interpolate(flat, valid, inner)
+
+        return result.reshape(data.shape)
+
+    def _fill_channels(self, data: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Fill a per-channel mask; each channel uses its own valid frames"""
+        n = len(data)
+        flat = data.reshape(n, int(np.prod(data.shape[1:])))
+        mask = mask.reshape(flat.shape)
+
+        if self.method != 'linear':
+            result = flat.copy()
+            for col in np.flatnonzero(mask.any(axis=0)):
+                result[:, col] = self.fill(flat[:, col], mask[:, col])
+            return result.reshape(data.shape)
+
+        # Nearest valid frame at or before / at or after every sample
+        idx = np.arange(n)[:, np.newaxis]
+        before = np.maximum.accumulate(np.where(mask, -1, idx), axis=0)
+        after = np.minimum.accumulate(np.where(mask, n, idx)[::-1], axis=0)[::-1]
+        has_before = before >= 0
+        has_after = after < n
+
+        value_before = np.take_along_axis(flat, np.clip(before, 0, n - 1), axis=0)
+        value_after = np.take_along_axis(flat, np.clip(after, 0, n - 1), axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight = (idx - before) / (after - before)
+        between = (1 - weight) * value_before + weight * value_after
+
+        # Edge runs hold the nearest valid frame
+        replacement = np.where(
+            has_before & has_after, between,
+            np.where(has_before, value_before, np.where(has_after, value_after, flat))
+        )
+        return np.where(mask, replacement, flat).reshape(data.shape)
+
+    def _interpolate(self, flat: np.ndarray, valid: np.ndarray, frames: np.ndarray) -> np.ndarray:
+        """Values at interior gap frames from the valid frames, all channels at once"""
+        if self.method == 'linear':
+            pos = np.searchsorted(valid, frames)
+            before, after = valid[pos - 1], valid[pos]
+            weight = ((frames - before) / (after - before))[:, np.newaxis]
+            return (1 - weight) * flat[before] + weight * flat[after]
+
+        # Spline knots: valid frames with finite values only
+        knots = valid[np.isfinite(flat[valid]).all(axis=1)]
+        if knots.size < 2:
+            return GapFiller('linear')._interpolate(flat, valid, frames)
+        interpolator = CubicSpline if self.method == 'cubic' else PchipInterpolator
+        return interpolator(knots, flat[knots], axis=0)(frames)
+
+
 class AdaptiveNormalizer(DataNormalizer):
     """
     Advanced normalizer with adaptive techniques.
@@ -2663,6 +4538,7 @@ class AdaptiveNormalizer(DataNormalizer):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.calibration_stats: Optional[Dict] = None
+        self.gap_report: Optional[GapReport] = None
 
     def calibrate(self, reference_df: pd.DataFrame):
         """
@@ -2690,7 +4566,10 @@ class AdaptiveNormalizer(DataNormalizer):
     def normalize_with_outlier_handling(
         self,
         df: pd.DataFrame,
-        outlier_method: str = "mad"
+        outlier_method: str = "mad",
+        interpolation: str = "linear",
+        max_gap_fraction: Optional[float] = None,
+        max_gap_frames: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Normalize with outlier detection and interpolation.
@@ -2698,9 +4577,18 @@ class AdaptiveNormalizer(DataNormalizer):
         Args:
             df: Input DataFrame
             outlier_method: "mad", "iqr", or "zscore"
+            interpolation: "linear", "cubic" or "pchip" gap filling
+            max_gap_fraction: Reject the recording if more than this
+                fraction of frames are outliers (None = no limit)
+            max_gap_frames: Reject the recording if any outlier run is
+                longer than this many frames (None = no limit)
 
         Returns:
             Normalized DataFrame with outliers handled
+
+        Raises:
+            ValueError: If the recording exceeds a dropout limit; the gap
+                report is still available as self.gap_report
         """
         landmarks = self._extract_landmarks(df)
 
@@ -2712,8 +4600,19 @@ class AdaptiveNormalizer(DataNormalizer):
         else:
             outlier_mask = self._detect_outliers_zscore(landmarks)
 
+        # Reject recordings with too many dropouts before interpolating
+        self.gap_report = GapFiller.report(outlier_mask)
+        if max_gap_fraction is not None and self.gap_report.gap_fraction > max_gap_fraction:
+            raise ValueError(
+                f"Outlier frames {self.gap_report.gap_fraction:.1%} exceed limit {max_gap_fraction:.1%}"
+            )
+        if max_gap_frames is not None and self.gap_report.max_gap_length > max_gap_frames:
+            raise ValueError(
+                f"Outlier run of {self.gap_report.max_gap_length} frames exceeds limit {max_gap_frames}"
+            )
+
         # Interpolate outliers
-        landmarks = self._interpolate_outliers(landmarks, outlier_mask)
+        landmarks = self._interpolate_outliers(landmarks, outlier_mask, method=interpolation)
 
         # Continue with standard normalization
         df_clean = self._landmarks_to_df(df, landmarks)
@@ -2765,34 +4664,11 @@ class AdaptiveNormalizer(DataNormalizer):
     def _interpolate_outliers(
         self,
         landmarks: np.ndarray,
-        outlier_mask: np.ndarray
+        outlier_mask: np.ndarray,
+        method: str = "linear"
     ) -> np.ndarray:
-        """Interpolate outlier frames using neighboring frames"""
-        result = landmarks.copy()
-        outlier_indices = np.where(outlier_mask)[0]
-
-        for idx in outlier_indices:
-            # Find nearest valid neighbors
-            before = idx - 1
-            after = idx + 1
-
-            while before >= 0 and outlier_mask[before]:
-                before -= 1
-            while after < len(landmarks) and outlier_mask[after]:
-                after += 1
-
-            # Interpolate
-            if before >= 0 and after < len(landmarks):
-                # Linear interpolation
-                weight = (idx - before) / (after - before)
-                result[idx] = (1 - weight) * landmarks[before] + weight * landmarks[after]
-            elif before >= 0:
-                result[idx] = landmarks[before]
-            elif after < len(landmarks):
-                result[idx] = landmarks[after]
-            # else: keep original (no valid neighbors)
-
-        return result
+        """Interpolate outlier frames using neighboring frames (all channels at once)"""
+        return GapFiller(method).fill(landmarks, outlier_mask)
 
     def _landmarks_to_df(
         self,
@@ -2801,14 +4677,7 @@ class AdaptiveNormalizer(DataNormalizer):
     ) -> pd.DataFrame:
         """Convert landmarks array back to DataFrame format"""
         df = original_df.copy()
-
-        for i, name in enumerate(LANDMARK_NAMES):
-            for j, axis in enumerate(['X', 'Y', 'Z']):
-                col = f"{name}_{axis}"
-                if col in df.columns:
-                    df[col] = landmarks[:, i, j]
-
-        return df
+        return LANDMARK_SCHEMA_CACHE.resolve(df).assign(df, landmarks)
 
 
 # =============================================================================
@@ -2826,6 +4695,7 @@ class OutlierReport:
     outlier_indices: np.ndarray
     outlier_percentage: float
     detection_method: str
+    outlier_mask: Optional[np.ndarray] = None
 
 
 class HampelFilter(BaseFilter):
@@ -2842,11 +4712,21 @@ class HampelFilter(BaseFilter):
         self,
         window_size: int = 7,
         n_sigma: float = 3.0,
-        replace_with_median: bool = True
+        replace_with_median: bool = True,
+        vectorized: bool = True
     ):
+        """
+        Args:
+            window_size: Rolling window length (centered, truncated at edges)
+            n_sigma: Outlier threshold in scaled MADs
+            replace_with_median: Replace outliers with the window median
+            vectorized: Compute rolling medians/MADs for all columns at once
+                (False = original per-sample loop)
+        """
         self.window_size = window_size
         self.n_sigma = n_sigma
         self.replace_with_median = replace_with_median
+        self.vectorized = vectorized
 
     def get_params(self) -> dict:
         """Return filter parameters"""
@@ -2858,17 +4738,106 @@ class HampelFilter(BaseFilter):
 
     def apply(self, data: np.ndarray) -> np.ndarray:
         """Apply Hampel filter"""
+        filtered, _ = self.apply_with_report(data)
+        return filtered
+
+    def apply_with_report(self, data: np.ndarray) -> Tuple[np.ndarray, List[OutlierReport]]:
+        """
+        Apply Hampel filter and keep the per-channel outlier reports.
+
+        Returns:
+            Filtered data (n_samples, n_features) and one OutlierReport per
+            column, each carrying its boolean outlier mask
+        """
         if data.ndim == 1:
             data = data.reshape(-1, 1)
 
+        if self.vectorized:
+            median, mad = self._rolling_median_mad(data)
+            outlier_mask = np.abs(data - median) > self.n_sigma * mad
+
+            filtered = data.copy()
+            if self.replace_with_median:
+                filtered[outlier_mask] = median[outlier_mask]
+
+            reports = [
+                self._build_report(outlier_mask[:, i])
+                for i in range(data.shape[1])
+            ]
+            return filtered, reports
+
         n_samples, n_features = data.shape
         filtered = data.copy()
+        reports = []
 
         for i in range(n_features):
             sig = data[:, i]
-            filtered[:, i], _ = self._apply_1d(sig)
+            filtered[:, i], report = self._apply_1d(sig)
+            reports.append(report)
 
-        return filtered
+        return filtered, reports
+
+    def _rolling_median_mad(self, data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rolling median and normal-scaled MAD for every column.
+
+        Full windows are evaluated over a strided (channels, frames, window)
+        view in one call, using partial sorts for finite data; the truncated
+        windows at each edge are evaluated per edge sample across all
+        channels.
+        """
+        n = len(data)
+        half_window = self.window_size // 2
+        width = 2 * half_window + 1
+
+        median = np.zeros(data.shape)
+        mad = np.zeros(data.shape)
+
+        if n >= width and np.isfinite(data).all():
+            # Odd-width windows: the median is the middle order statistic,
+            # so a partial sort (on contiguous per-channel rows) is enough
+            rows = np.ascontiguousarray(data.reshape(n, -1).T)
+            windows = sliding_window_view(rows, width, axis=-1)
+            window_median = np.partition(windows, half_window, axis=-1)[..., half_window]
+            deviation = np.abs(windows - window_median[..., np.newaxis])
+            window_mad = np.partition(deviation, half_window, axis=-1)[..., half_window]
+            window_mad /= 0.6744897501960817  # scale='normal', as scipy
+
+            median[half_window:n - half_window] = window_median.T.reshape((-1,) + data.shape[1:])
+            mad[half_window:n - half_window] = window_mad.T.reshape((-1,) + data.shape[1:])
+            edge_indices = [
+                *range(min(half_window, n)),
+                *range(max(n - half_window, half_window), n)
+            ]
+        elif n >= width:
+            windows = sliding_window_view(data, width, axis=0)
+            median[half_window:n - half_window] = np.median(windows, axis=-1)
+            mad[half_window:n - half_window] = stats.median_abs_deviation(
+                windows, axis=-1, scale='normal'
+            )
+            edge_indices = [
+                *range(min(half_window, n)),
+                *range(max(n - half_window, half_window), n)
+            ]
+        else:
+            edge_indices = range(n)
+
+        for i in edge_indices:
+            window = data[max(0, i - half_window):min(n, i + half_window + 1)]
+            median[i] = np.median(window, axis=0)
+            mad[i] = stats.median_abs_deviation(window, axis=0, scale='normal')
+
+        return median, mad
+
+    def _build_report(self, outlier_mask: np.ndarray) -> OutlierReport:
+        """Build an OutlierReport from a boolean outlier mask"""
+        return OutlierReport(
+            n_outliers=int(np.sum(outlier_mask)),
+            outlier_indices=np.where(outlier_mask)[0],
+            outlier_percentage=float(np.mean(outlier_mask) * 100),
+            detection_method='hampel',
+            outlier_mask=outlier_mask
+        )
 
     def _apply_1d(self, sig: np.ndarray) -> Tuple[np.ndarray, OutlierReport]:
         """Apply Hampel filter to 1D signal"""
@@ -2896,12 +4865,7 @@ class HampelFilter(BaseFilter):
                 if self.replace_with_median:
                     filtered[i] = median
 
-        report = OutlierReport(
-            n_outliers=int(np.sum(outlier_mask)),
-            outlier_indices=np.where(outlier_mask)[0],
-            outlier_percentage=float(np.mean(outlier_mask) * 100),
-            detection_method='hampel'
-        )
+        report = self._build_report(outlier_mask)
 
         return filtered, report
 
@@ -2933,57 +4897,37 @@ class MADGatingFilter(BaseFilter):
 
     def apply(self, data: np.ndarray) -> np.ndarray:
         """Apply MAD gating"""
+        return self.apply_with_mask(data)[0]
+
+    def mask(self, data: np.ndarray) -> np.ndarray:
+        """Outlier mask from each column's median and MAD (same shape as 2D data)"""
         if data.ndim == 1:
             data = data.reshape(-1, 1)
 
-        n_samples, n_features = data.shape
-        filtered = data.copy()
-
-        for i in range(n_features):
-            sig = data[:, i]
-            filtered[:, i] = self._apply_1d(sig)
-
-        return filtered
-
-    def _apply_1d(self, sig: np.ndarray) -> np.ndarray:
-        """Apply MAD gating to 1D signal"""
-        # Compute median and MAD
-        median = np.median(sig)
-        mad = stats.median_abs_deviation(sig, scale='normal')
-
-        # Compute robust z-scores
-        robust_z = np.abs(sig - median) / (mad + 1e-10)
+        median = np.median(data, axis=0)
+        mad = stats.median_abs_deviation(data, axis=0, scale='normal')
 
-        # Detect outliers
-        outlier_mask = robust_z > self.threshold
+        # Robust z-scores
+        return np.abs(data - median) / (mad + 1e-10) > self.threshold
 
-        # Interpolate outliers
-        if self.interpolate and np.any(outlier_mask):
-            filtered = sig.copy()
-            outlier_indices = np.where(outlier_mask)[0]
+    def apply_with_mask(self, data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply MAD gating to all columns at once.
 
-            for idx in outlier_indices:
-                # Find nearest valid neighbors
-                before = idx - 1
-                after = idx + 1
+        Returns:
+            Filtered data (n_samples, n_features) and the outlier mask
+        """
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
 
-                while before >= 0 and outlier_mask[before]:
-                    before -= 1
-                while after < len(sig) and outlier_mask[after]:
-                    after += 1
+        outlier_mask = self.mask(data)
+        filtered = data.copy()
 
-                # Interpolate
-                if before >= 0 and after < len(sig):
-                    weight = (idx - before) / (after - before)
-                    filtered[idx] = (1 - weight) * sig[before] + weight * sig[after]
-                elif before >= 0:
-                    filtered[idx] = sig[before]
-                elif after < len(sig):
-                    filtered[idx] = sig[after]
+        # Interpolate outliers from the nearest valid samples of each column
+        if self.interpolate and outlier_mask.any():
+            filtered[:] = GapFiller('linear').fill(data, outlier_mask)
 
-            return filtered
-        else:
-            return sig
+        return filtered, outlier_mask
 
 
 class IQRGatingFilter(BaseFilter):
@@ -3166,33 +5110,42 @@ class VelocityClampFilter(BaseFilter):
 
     def apply(self, data: np.ndarray) -> np.ndarray:
         """Apply velocity clamping"""
-        if data.ndim == 1:
-            data = data.reshape(-1, 1)
-
-        n_samples, n_features = data.shape
-        filtered = data.copy()
+        return self.apply_with_mask(data)[0]
 
-        for i in range(n_features):
-            sig = data[:, i]
-            filtered[:, i] = self._apply_1d(sig)
+    def mask(self, data: np.ndarray) -> np.ndarray:
+        """Samples whose velocity exceeds the learned bound (same shape as 2D data)"""
+        velocity, velocity_bound = self._velocity_bound(data)
+        return np.abs(velocity) > velocity_bound
 
-        return filtered
+    def apply_with_mask(self, data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply velocity clamping to all columns at once.
 
-    def _apply_1d(self, sig: np.ndarray) -> np.ndarray:
-        """Apply velocity clamping to 1D signal"""
-        # Compute velocity
-        velocity = np.diff(sig, prepend=sig[0])
+        Returns:
+            Filtered data (n_samples, n_features) and the clamped-sample mask
+        """
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
 
-        # Learn velocity bound from percentile
-        velocity_bound = np.percentile(np.abs(velocity), self.percentile) * self.margin
+        velocity, velocity_bound = self._velocity_bound(data)
 
         # Clamp velocities
         velocity_clamped = np.clip(velocity, -velocity_bound, velocity_bound)
 
-        # Reconstruct signal by integrating clamped velocity
-        filtered = np.cumsum(velocity_clamped) + sig[0] - velocity_clamped[0]
+        # Reconstruct signal by integrating clamped velocity
+        filtered = data.copy()
+        filtered[:] = np.cumsum(velocity_clamped, axis=0) + data[0] - velocity_clamped[0]
+
+        return filtered, np.abs(velocity) > velocity_bound
+
+    def _velocity_bound(self, data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Frame-to-frame velocity and each column's bound from its percentile"""
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
 
-        return filtered
+        velocity = np.diff(data, axis=0, prepend=data[:1])
+        velocity_bound = np.percentile(np.abs(velocity), self.percentile, axis=0) * self.margin
+        return velocity, velocity_bound
 
 
 class AccelerationClampFilter(BaseFilter):
@@ -3348,12 +5301,21 @@ class OutlierDetectionPipeline:
     1. Hampel filter (spike removal)
     2. MAD gating (robust z-score)
     3. Velocity clamping (physically plausible motion)
+
+    Features:
+    - Fused engine: every stage runs on all channels at once (rolling
+      median/MAD, column MAD, velocity percentiles) with no per-column loops
+    - Per-stage boolean outlier masks and per-channel counts
     """
 
-    def __init__(self, aggressive: bool = False):
+    STAGES = ('hampel', 'mad_gating', 'velocity_clamp')
+
+    def __init__(self, aggressive: bool = False, fused: bool = True):
         """
         Args:
             aggressive: If True, use stricter thresholds
+            fused: Run the vectorized all-channel engine
+                (False = call the three filters one after another)
         """
         if aggressive:
             self.hampel = HampelFilter(window_size=5, n_sigma=2.5)
@@ -3363,14 +5325,24 @@ class OutlierDetectionPipeline:
             self.hampel = HampelFilter(window_size=7, n_sigma=3.0)
             self.mad_gating = MADGatingFilter(threshold=3.5)
             self.velocity_clamp = VelocityClampFilter(percentile=95, margin=1.5)
+        self.fused = fused
 
     def apply(self, data: np.ndarray) -> Tuple[np.ndarray, Dict]:
         """
         Apply outlier detection pipeline.
 
         Returns:
-            Filtered data and report dictionary
+            Filtered data and report dictionary (JSON-serializable; per-stage
+            and combined per-channel counts when fused)
         """
+        if not self.fused:
+            return self._apply_sequential(data)
+
+        filtered, masks = self.detect(data)
+        return filtered, self._build_report(masks)
+
+    def _apply_sequential(self, data: np.ndarray) -> Tuple[np.ndarray, Dict]:
+        """Original stage-by-stage pipeline"""
         report = {}
 
         # Stage 1: Hampel filter
@@ -3387,6 +5359,58 @@ class OutlierDetectionPipeline:
 
         return filtered, report
 
+    def detect(self, data: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Run all three gates over every channel.
+
+        Each stage sees the previous stage's output, exactly as in the
+        sequential pipeline.
+
+        Returns:
+            Filtered data (n_samples, n_features) and a boolean
+            (n_samples, n_features) mask per stage name
+        """
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        masks = {}
+
+        # Stage 1: Hampel (rolling median / MAD)
+        median, mad = self.hampel._rolling_median_mad(data)
+        masks['hampel'] = np.abs(data - median) > self.hampel.n_sigma * mad
+        filtered = data.copy()
+        if self.hampel.replace_with_median:
+            filtered[masks['hampel']] = median[masks['hampel']]
+
+        # Stage 2: MAD gating (column median / MAD)
+        filtered, masks['mad_gating'] = self.mad_gating.apply_with_mask(filtered)
+
+        # Stage 3: Velocity clamping (per-column velocity percentile)
+        filtered, masks['velocity_clamp'] = self.velocity_clamp.apply_with_mask(filtered)
+
+        return filtered, masks
+
+    def _build_report(self, masks: Dict[str, np.ndarray]) -> Dict:
+        """Per-stage and combined per-channel counts"""
+        combined = np.logical_or.reduce([masks[stage] for stage in self.STAGES])
+        n_samples, n_channels = combined.shape
+        n_values = max(combined.size, 1)
+
+        report = {f'{stage}_applied': True for stage in self.STAGES}
+        report['n_samples'] = int(n_samples)
+        report['n_channels'] = int(n_channels)
+        report['stages'] = {
+            stage: {
+                'counts': masks[stage].sum(axis=0).tolist(),
+                'total': int(masks[stage].sum()),
+                'percentage': float(masks[stage].sum() / n_values * 100),
+            }
+            for stage in self.STAGES
+        }
+        report['outlier_counts'] = combined.sum(axis=0).tolist()
+        report['n_outliers'] = int(combined.sum())
+        report['outlier_percentage'] = float(combined.sum() / n_values * 100)
+        return report
+
 
 # =============================================================================
 # THRESHOLDS.PY
@@ -3404,6 +5428,496 @@ class ThresholdResult:
     metadata: dict = None
 
 
+@dataclass
+class CUSUMBatchResult:
+    """
+    Change points of many signals in compact (CSR-style) form.
+
+    Change points of signal s are
+    change_points[offsets[s]:offsets[s + 1]], in increasing frame order.
+    """
+    change_points: np.ndarray  # Frame indices, grouped by signal
+    signal_index: np.ndarray  # Signal of each change point
+    offsets: np.ndarray  # (n_signals + 1,) start of each signal's run
+    cusum: np.ndarray  # (n_frames, n_signals) upper + lower statistic
+
+    def split(self) -> List[np.ndarray]:
+        """Per-signal change point arrays"""
+        return np.split(self.change_points, self.offsets[1:-1])
+
+
+def _cusum_engine(
+    x: np.ndarray,
+    drift: float,
+    threshold: float,
+    reset_after_detection: bool,
+    block_elements: int = 1 << 18
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Two-sided CUSUM over every column of x at once.
+
+    Tracks s+[i] = max(0, s+[i-1] + x[i] - drift) and
+    s-[i] = max(0, s-[i-1] - x[i] - drift) from s[0] = 0, flagging i >= 1
+    where either exceeds threshold (both reset to 0 there if requested).
+
+    With partial sums C, a run started at frame f has the closed form
+    s[i] = C[i] - min(C[f..i]), so without resets the statistics are a
+    cumsum plus a running minimum. With resets, the next detection after
+    a restart at f is T[f] = min over j >= f of g[j], where g[j] is the
+    first i > j with C[i] > C[j] + threshold (either sign). g is found
+    for every frame at once by binary lifting over a sparse table of
+    range maxima, T is a suffix minimum, and the detections are the
+    chain 0 -> T[0] -> T[T[0]] -> ..., followed for all columns together.
+
+    Args:
+        x: Centered/normalized signals (n_frames, n_signals)
+        drift: Allowance subtracted every step
+        threshold: Decision threshold
+        reset_after_detection: Zero both statistics at each detection
+        block_elements: Element budget per column block for the sparse table
+
+    Returns:
+        Upper statistic, lower statistic and boolean detection mask,
+        each (n_frames, n_signals)
+    """
+    n, n_signals = x.shape
+    s_pos = np.zeros((n, n_signals))
+    s_neg = np.zeros((n, n_signals))
+    detected = np.zeros((n, n_signals), dtype=bool)
+    if n < 2:
+        return s_pos, s_neg, detected
+
+    # Partial sums with C[0] = 0, C[i] = sum of increments 1..i
+    c_pos = np.zeros((n, n_signals))
+    c_neg = np.zeros((n, n_signals))
+    np.cumsum(x[1:] - drift, axis=0, out=c_pos[1:])
+    np.cumsum(-x[1:] - drift, axis=0, out=c_neg[1:])
+
+    if not reset_after_detection:
+        s_pos[:] = c_pos - np.minimum.accumulate(c_pos, axis=0)
+        s_neg[:] = c_neg - np.minimum.accumulate(c_neg, axis=0)
+        detected[1:] = (s_pos[1:] > threshold) | (s_neg[1:] > threshold)
+        return s_pos, s_neg, detected
+
+    # Next detection after a restart at each frame: T[f] (n = none)
+    levels = max(1, int(np.log2(n)) + 1)
+    block = max(1, block_elements // (n * levels))
+    next_hit = np.empty((n, n_signals), dtype=np.intp)
+    for lo in range(0, n_signals, block):
+        cols = slice(lo, lo + block)
+        g = np.minimum(
+            _first_exceedance(c_pos[:, cols], threshold, levels),
+            _first_exceedance(c_neg[:, cols], threshold, levels)
+        )
+        next_hit[:, cols] = np.minimum.accumulate(g[::-1], axis=0)[::-1]
+
+    # Follow the restart chain 0 -> T[0] -> ... for all columns at once
+    cols = np.arange(n_signals)
+    frame = np.zeros(n_signals, dtype=np.intp)
+    while cols.size:
+        frame = next_hit[frame, cols]
+        found = frame < n
+        cols, frame = cols[found], frame[found]
+        detected[frame, cols] = True
+
+    # Statistics restart at every detection: segmented running minimum
+    segment = np.cumsum(detected, axis=0)
+    for s_out, c in ((s_pos, c_pos), (s_neg, c_neg)):
+        running_min = c.copy()
+        step = 1
+        while step < n:
+            same = segment[step:] == segment[:-step]
+            np.minimum(running_min[step:], np.where(same, running_min[:-step], np.inf),
+                       out=running_min[step:])
+            step *= 2
+        s_out[:] = c - running_min
+
+    return s_pos, s_neg, detected
+
+
+def _first_exceedance(c: np.ndarray, threshold: float, levels: int) -> np.ndarray:
+    """
+    For every frame j (per column), the first i > j with
+    c[i] > c[j] + threshold, or len(c) if there is none.
+
+    Binary lifting over a sparse table of range maxima,
+    table[k][p] = max(c[p : p + 2**k]), kept as contiguous per-column rows
+    so every lookup is a flat take.
+    """
+    n, n_cols = c.shape
+    rows = np.ascontiguousarray(c.T)
+    row_base = (np.arange(n_cols) * n)[:, np.newaxis]
+
+    # All levels padded to length n (the padding is never selected)
+    table = [rows]
+    for k in range(1, levels):
+        half = 1 << (k - 1)
+        if half >= n:
+            break
+        level = np.empty_like(rows)
+        level[:, n - half:] = np.inf
+        np.maximum(table[-1][:, :n - half], table[-1][:, half:], out=level[:, :n - half])
+        table.append(level)
+
+    target = rows + threshold
+    pos = np.broadcast_to(np.arange(1, n + 1), rows.shape).copy()
+    for k in range(len(table) - 1, -1, -1):
+        # Skip 2**k frames when they all stay at or below the target
+        step = 1 << k
+        can_skip = pos <= n - step
+        range_max = np.take(table[k], np.minimum(pos, n - 1) + row_base)
+        pos += step * (can_skip & (range_max <= target))
+    return pos.T
+
+
+@dataclass
+class HysteresisSegments:
+    """
+    ON segments of many signals after hysteresis thresholding.
+
+    Segment k spans frames starts[k]..ends[k] (inclusive) of signal
+    channel[k]; segments are ordered by channel, then by frame.
+    """
+    state: np.ndarray  # ON/OFF state, same shape as the input
+    starts: np.ndarray
+    ends: np.ndarray
+    channel: np.ndarray
+
+    def segments(self, channel: int = 0) -> List[Tuple[int, int]]:
+        """(start, end) tuples of one signal"""
+        keep = self.channel == channel
+        return list(zip(self.starts[keep].tolist(), self.ends[keep].tolist()))
+
+
+def _hysteresis_state(
+    data: np.ndarray,
+    high: Union[float, np.ndarray],
+    low: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Hysteresis state of every column of data without a per-sample loop.
+
+    Equivalent to the state machine that switches ON when a sample
+    exceeds high and OFF when it drops below low, starting OFF. Each
+    frame takes the state set by the most recent frame that decides it
+    (above high -> ON, below low -> OFF), found with a running maximum
+    over frame indices; when low > high a sample can satisfy both and
+    flips the state, handled by the parity of such flips since then.
+
+    Args:
+        data: Signal (n_frames,) or (n_frames, n_channels)
+        high: Threshold to switch ON (scalar or per channel)
+        low: Threshold to switch OFF (scalar or per channel)
+
+    Returns:
+        Boolean state, same shape as data
+    """
+    x = data.reshape(data.shape[0], -1) if data.ndim > 1 else data[:, np.newaxis]
+    n, n_channels = x.shape
+    above = x > high
+    below = x < low
+    decides = above ^ below
+
+    frames = np.arange(n)[:, np.newaxis]
+    last = np.maximum.accumulate(np.where(decides, frames, -1), axis=0)
+    has_last = last >= 0
+    last = np.maximum(last, 0)
+    cols = np.arange(n_channels)
+    state = above[last, cols] & has_last
+
+    flips = above & below
+    if flips.any():
+        n_flips = np.cumsum(flips, axis=0)
+        since = n_flips - np.where(has_last, n_flips[last, cols], 0)
+        state ^= (since & 1).astype(bool)
+
+    return state.reshape(data.shape)
+
+
+def _state_segments(state: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Runs of True in every column of a boolean state array.
+
+    Returns:
+        starts, inclusive ends and channel of each run, ordered by
+        channel, then by frame
+    """
+    rows = state.reshape(state.shape[0], -1) if state.ndim > 1 else state[:, np.newaxis]
+    rows = rows.T.astype(np.int8)
+    edges = np.diff(rows, axis=1, prepend=0, append=0)
+    channel, starts = np.nonzero(edges == 1)
+    _, stops = np.nonzero(edges == -1)
+    return starts, stops - 1, channel
+
+
+def hysteresis_segments(
+    data: np.ndarray,
+    high: Union[float, np.ndarray],
+    low: Union[float, np.ndarray]
+) -> HysteresisSegments:
+    """
+    Hysteresis thresholding of (n_frames,) or (n_frames, n_channels) data,
+    returning the state together with every ON segment.
+
+    Args:
+        data: Signal(s), frames along axis 0
+        high: Threshold to switch ON (scalar or per channel)
+        low: Threshold to switch OFF (scalar or per channel)
+    """
+    state = _hysteresis_state(data, high, low)
+    starts, ends, channel = _state_segments(state)
+    return HysteresisSegments(state=state, starts=starts, ends=ends, channel=channel)
+
+
+@dataclass
+class ThresholdStatistics:
+    """Per-channel statistics shared by every threshold method"""
+    sorted_rows: np.ndarray  # (n_channels, n_samples) each channel sorted
+    mean: np.ndarray  # (n_channels,)
+    std: np.ndarray
+    median: np.ndarray
+    hist: np.ndarray  # (n_channels, bins) counts
+    bin_centers: np.ndarray  # (n_channels, bins)
+
+    def quantile(self, q: float) -> np.ndarray:
+        """Linear-interpolated quantile of every channel (as np.quantile)"""
+        n = self.sorted_rows.shape[1]
+        virtual = (n - 1) * q
+        lo = int(np.floor(virtual))
+        hi = min(lo + 1, n - 1)
+        t = virtual - lo
+        a, b = self.sorted_rows[:, lo], self.sorted_rows[:, hi]
+        diff = b - a
+        return b - diff * (1 - t) if t >= 0.5 else a + diff * t
+
+
+@dataclass
+class ConsensusThresholdResult:
+    """Thresholds of several methods for many channels, and their consensus"""
+    consensus: np.ndarray  # (n_channels,) median over methods
+    thresholds: Dict[str, np.ndarray]  # method -> (n_channels,)
+    metadata: Dict[str, Dict]  # method -> per-channel arrays or scalars
+
+    def results(self, channel: int = 0) -> List[ThresholdResult]:
+        """Per-method ThresholdResult list of one channel"""
+        out = []
+        for method, thresholds in self.thresholds.items():
+            metadata = {
+                key: (value[channel].item() if isinstance(value, np.ndarray) else value)
+                for key, value in self.metadata[method].items()
+            }
+            out.append(ThresholdResult(
+                threshold=float(thresholds[channel]), method=method, metadata=metadata
+            ))
+        return out
+
+
+class ThresholdEngine:
+    """
+    Multi-method threshold engine over shared per-channel statistics.
+
+    Features:
+    - Sorts each channel once; median, MAD, quartiles and quantiles are read
+      from the sorted rows
+    - One histogram per channel shared by the Otsu, triangle and moment methods
+    - Every method evaluated for all channels at once, without Python loops
+      over bins or samples
+    - Same thresholds as the individual AdaptiveThresholder methods
+    """
+
+    METHODS = ('mad', 'iqr', 'zscore', 'quantile', 'otsu', 'triangle', 'moment')
+    HISTOGRAM_METHODS = ('otsu', 'triangle', 'moment')
+
+    def __init__(self, config: Optional[ThresholdConfig] = None, bins: int = 256):
+        """
+        Args:
+            config: Threshold configuration (multipliers, quantile)
+            bins: Histogram bins for the histogram-based methods
+        """
+        self.config = config or ThresholdConfig()
+        self.bins = bins
+
+    def statistics(self, data: np.ndarray, histogram: bool = True) -> ThresholdStatistics:
+        """
+        Sort, moments and histogram of every channel.
+
+        Args:
+            data: (n_samples,) or (n_samples, n_channels)
+            histogram: Also build the per-channel histogram
+        """
+        rows = np.ascontiguousarray(np.asarray(data, dtype=float).reshape(len(data), -1).T)
+        sorted_rows = np.sort(rows, axis=1)
+        n = rows.shape[1]
+        median = (sorted_rows[:, (n - 1) // 2] + sorted_rows[:, n // 2]) / 2
+
+        if histogram:
+            hist, bin_centers = self._histogram(rows, sorted_rows[:, 0], sorted_rows[:, -1])
+        else:
+            hist = bin_centers = np.empty((rows.shape[0], 0))
+
+        return ThresholdStatistics(
+            sorted_rows=sorted_rows,
+            mean=np.mean(rows, axis=1),
+            std=np.std(rows, axis=1),
+            median=median,
+            hist=hist,
+            bin_centers=bin_centers
+        )
+
+    def _histogram(
+        self, rows: np.ndarray, first: np.ndarray, last: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """np.histogram(row, bins) of every row in one bincount (same binning rules)"""
+        bins = self.bins
+        n_rows = rows.shape[0]
+        first, last = first.copy(), last.copy()
+        flat = first == last
+        first[flat] -= 0.5
+        last[flat] += 0.5
+        finite = np.isfinite(first) & np.isfinite(last)
+        first[~finite], last[~finite] = 0.0, 1.0
+
+        edges = np.linspace(first, last, bins + 1, axis=1)
+        with np.errstate(invalid='ignore'):
+            idx = ((rows - first[:, np.newaxis]) / (last - first)[:, np.newaxis] * bins)
+            idx = np.nan_to_num(idx, nan=0.0).astype(np.intp)
+        np.clip(idx, 0, bins - 1, out=idx)
+
+        # Correct float rounding against the actual edges, as np.histogram does
+        idx[rows < np.take_along_axis(edges, idx, axis=1)] -= 1
+        np.clip(idx, 0, bins - 1, out=idx)
+        idx[(rows >= np.take_along_axis(edges, idx + 1, axis=1)) & (idx != bins - 1)] += 1
+
+        offsets = (np.arange(n_rows) * bins)[:, np.newaxis]
+        hist = np.bincount((idx + offsets).ravel(), minlength=n_rows * bins).reshape(n_rows, bins)
+        hist[~finite] = 0
+
+        return hist, (edges[:, :-1] + edges[:, 1:]) / 2
+
+    def compute(
+        self,
+        data: np.ndarray,
+        methods: Optional[List[str]] = None
+    ) -> ConsensusThresholdResult:
+        """
+        Thresholds of every requested method and their median consensus.
+
+        Args:
+            data: (n_samples,) or (n_samples, n_channels)
+            methods: Subset of METHODS (default: mad, iqr, zscore, otsu)
+
+        Returns:
+            ConsensusThresholdResult with one value per channel
+
+        Raises:
+            ValueError: If a method is not in METHODS
+        """
+        if methods is None:
+            methods = ['mad', 'iqr', 'zscore', 'otsu']
+
+        for method in methods:
+            if method not in self.METHODS:
+                raise ValueError(f"Unknown method: {method}. Choose from {list(self.METHODS)}")
+
+        stats = self.statistics(data, histogram=any(m in self.HISTOGRAM_METHODS for m in methods))
+
+        thresholds, metadata = {}, {}
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for method in methods:
+                thresholds[method], metadata[method] = getattr(self, f'_{method}')(stats)
+
+        if thresholds:
+            consensus = np.median(np.stack(list(thresholds.values())), axis=0)
+        else:
+            consensus = stats.mean
+
+        return ConsensusThresholdResult(consensus=consensus, thresholds=thresholds, metadata=metadata)
+
+    # -------------------------------------------------------------------------
+    # Methods (per-channel arrays from shared statistics)
+    # -------------------------------------------------------------------------
+
+    def _mad(self, stats: ThresholdStatistics) -> Tuple[np.ndarray, Dict]:
+        scale = self.config.mad_scale
+        multiplier = self.config.mad_multiplier
+        mad = np.median(np.abs(stats.sorted_rows - stats.median[:, np.newaxis]), axis=1)
+        mad_scaled = mad * scale
+        return stats.median + multiplier * mad_scaled, {
+            'median': stats.median, 'mad': mad, 'mad_scaled': mad_scaled, 'multiplier': multiplier
+        }
+
+    def _iqr(self, stats: ThresholdStatistics) -> Tuple[np.ndarray, Dict]:
+        multiplier = self.config.iqr_multiplier
+        q1, q3 = stats.quantile(0.25), stats.quantile(0.75)
+        iqr = q3 - q1
+        return q3 + multiplier * iqr, {
+            'q1': q1, 'q3': q3, 'iqr': iqr, 'multiplier': multiplier, 'fence': 'upper'
+        }
+
+    def _zscore(self, stats: ThresholdStatistics) -> Tuple[np.ndarray, Dict]:
+        z = self.config.zscore_threshold
+        return stats.mean + z * stats.std, {'mean': stats.mean, 'std': stats.std, 'z_threshold': z}
+
+    def _quantile(self, stats: ThresholdStatistics) -> Tuple[np.ndarray, Dict]:
+        quantile = self.config.upper_quantile
+        return stats.quantile(quantile), {'quantile': quantile}
+
+    def _otsu(self, stats: ThresholdStatistics) -> Tuple[np.ndarray, Dict]:
+        hist = stats.hist / stats.hist.sum(axis=1, keepdims=True)
+        w0 = np.cumsum(hist, axis=1)
+        cumsum_mean = np.cumsum(hist * stats.bin_centers, axis=1)
+        w1 = 1.0 - w0
+        m0 = cumsum_mean / w0
+        m1 = (cumsum_mean[:, -1:] - cumsum_mean) / w1
+        variance_between = np.where((w0 != 0) & (w1 != 0), w0 * w1 * (m0 - m1) ** 2, 0.0)
+
+        rows = np.arange(len(hist))
+        optimal_idx = np.argmax(variance_between, axis=1)
+        return stats.bin_centers[rows, optimal_idx], {
+            'optimal_idx': optimal_idx, 'max_variance': variance_between[rows, optimal_idx]
+        }
+
+    def _triangle(self, stats: ThresholdStatistics) -> Tuple[np.ndarray, Dict]:
+        hist = stats.hist.astype(float)
+        rows = np.arange(len(hist))
+        bins = hist.shape[1]
+        peak_idx = np.argmax(hist, axis=1)
+        left_sum = np.cumsum(hist, axis=1)[rows, peak_idx] - hist[rows, peak_idx]
+        right_sum = hist.sum(axis=1) - left_sum
+
+        # Right side: line from the peak to the last bin. The left side's
+        # line degenerates to a point (first bin to itself), so every
+        # distance is 0 and the first bin is chosen.
+        x2 = (bins - 1 - peak_idx)[:, np.newaxis]
+        y1 = hist[rows, peak_idx][:, np.newaxis]
+        y2 = hist[:, -1:]
+        x0 = np.arange(bins) - peak_idx[:, np.newaxis]
+        distances = np.abs((y2 - y1) * x0 - x2 * hist + x2 * y1)
+        distances /= np.sqrt((y2 - y1) ** 2 + x2 ** 2) + 1e-10
+        distances[x0 < 0] = -np.inf
+
+        use_right = right_sum > left_sum
+        optimal_idx = np.where(use_right, np.argmax(distances, axis=1), 0)
+        optimal_distance = np.where(use_right, distances[rows, optimal_idx], 0.0)
+        return stats.bin_centers[rows, optimal_idx], {
+            'peak_idx': peak_idx, 'optimal_distance': optimal_distance
+        }
+
+    def _moment(self, stats: ThresholdStatistics) -> Tuple[np.ndarray, Dict]:
+        hist = stats.hist / stats.hist.sum(axis=1, keepdims=True)
+        centers = stats.bin_centers
+        m0 = np.sum(hist, axis=1)
+        m1 = np.sum(centers * hist, axis=1)
+        m2 = np.sum(centers**2 * hist, axis=1)
+        m3 = np.sum(centers**3 * hist, axis=1)
+
+        cd = m2 - m1**2
+        c0 = (-m1 * m3 + m2 * m2) / cd
+        c1 = (m1 * m2 - m3) / cd
+        z = m0 / (1 - c1 - np.sqrt(c1**2 - 4 * c0))
+        return m1 + z, {'m0': m0, 'm1': m1, 'm2': m2, 'm3': m3}
+
+
 class AdaptiveThresholder:
     """
     Adaptive threshold detection using multiple statistical methods.
@@ -3695,25 +6209,17 @@ class AdaptiveThresholder:
         h = h or self.config.cusum_h
         k = k or self.config.cusum_k
 
-        n = len(data)
         mean = np.mean(data)
 
-        # Upper CUSUM
-        s_high = np.zeros(n)
-        # Lower CUSUM
-        s_low = np.zeros(n)
-
-        change_points = []
-
-        for i in range(1, n):
-            s_high[i] = max(0, s_high[i-1] + data[i] - mean - k)
-            s_low[i] = max(0, s_low[i-1] - data[i] + mean - k)
-
-            if s_high[i] > h or s_low[i] > h:
-                change_points.append(i)
+        # Upper and lower CUSUM (no reset), closed form over the whole signal
+        _, _, detected = _cusum_engine(
+            (np.asarray(data, dtype=float) - mean).reshape(-1, 1),
+            drift=k, threshold=h, reset_after_detection=False
+        )
+        change_points = np.flatnonzero(detected[:, 0])
 
         return (
-            np.array(change_points),
+            change_points,
             ThresholdResult(
                 threshold=h,
                 method='cusum',
@@ -3738,6 +6244,9 @@ class AdaptiveThresholder:
         - high_threshold: Start event
         - low_threshold: Continue event
 
+        Works on (n_frames,) or (n_frames, n_channels) data; each channel
+        is rescaled to [0, 1] separately.
+
         Returns:
             Boolean array indicating event regions
         """
@@ -3745,23 +6254,10 @@ class AdaptiveThresholder:
         low = low_threshold or self.config.hysteresis_low
 
         # Rescale data to [0, 1] for default thresholds
-        data_norm = (data - np.min(data)) / (np.max(data) - np.min(data) + 1e-10)
-
-        result = np.zeros(len(data), dtype=bool)
-        active = False
-
-        for i in range(len(data)):
-            if not active:
-                if data_norm[i] > high:
-                    active = True
-                    result[i] = True
-            else:
-                if data_norm[i] < low:
-                    active = False
-                else:
-                    result[i] = True
+        data_min = np.min(data, axis=0)
+        data_norm = (data - data_min) / (np.max(data, axis=0) - data_min + 1e-10)
 
-        return result
+        return _hysteresis_state(data_norm, high, low)
 
     def adaptive_threshold(
         self,
@@ -3801,29 +6297,41 @@ class AdaptiveThresholder:
         """
         Compute threshold using multiple methods and return consensus.
 
+        All methods share one sort and one histogram (ThresholdEngine).
+
         Returns:
             Tuple of (consensus_threshold, list of all results)
         """
-        if methods is None:
-            methods = ['mad', 'iqr', 'zscore', 'otsu']
-
-        results = []
-        for method in methods:
-            try:
-                result = self.adaptive_threshold(data, method=method)
-                results.append(result)
-            except Exception as e:
-                print(f"Warning: {method} failed: {e}")
-
-        if not results:
+        data = np.asarray(data, dtype=float).ravel()
+        if methods is not None:
+            unknown = [m for m in methods if m not in ThresholdEngine.METHODS]
+            for method in unknown:
+                warnings.warn(f"{method} failed: Unknown method: {method}. "
+                              f"Choose from {list(ThresholdEngine.METHODS)}")
+            methods = [m for m in methods if m in ThresholdEngine.METHODS]
+        result = ThresholdEngine(self.config).compute(data, methods) if data.size else None
+
+        if result is None or not result.thresholds:
             # Fallback
             return float(np.mean(data)), []
 
         # Consensus: median of all thresholds
-        thresholds = [r.threshold for r in results]
-        consensus = np.median(thresholds)
+        return float(result.consensus[0]), result.results(0)
 
-        return float(consensus), results
+    def multi_method_threshold_batch(
+        self,
+        data: np.ndarray,
+        methods: List[str] = None
+    ) -> ConsensusThresholdResult:
+        """
+        Consensus threshold of every channel of (n_samples, n_channels) data
+        in one call.
+
+        Returns:
+            ConsensusThresholdResult with per-channel consensus, per-method
+            thresholds and metadata
+        """
+        return ThresholdEngine(self.config).compute(data, methods)
 
 
 class PeakDetector:
@@ -3930,6 +6438,75 @@ class PeakDetector:
         return valid_peaks, properties
 
 
+class PeakIndex:
+    """
+    Memoized peak/valley lookup shared by the outputs of one analysis.
+
+    Features:
+    - Keyed by signal content (digest of the samples) and detector parameters,
+      so the same signal rebuilt by different generators hits the cache
+    - Peaks and valleys of a signal are each computed once
+    - Any other detector call can be memoized with cached()
+    - Cached index arrays are read-only
+    """
+
+    def __init__(self, peak_detector: Optional[PeakDetector] = None):
+        """
+        Args:
+            peak_detector: Detector used for peaks()/valleys() (default: PeakDetector())
+        """
+        self.peak_detector = peak_detector or PeakDetector()
+        self._entries: Dict[tuple, object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def signal_key(data: np.ndarray) -> str:
+        """Identity of a signal: digest of its dtype, shape and samples"""
+        return _signal_digest(data)
+
+    def cached(self, name: str, data: np.ndarray, compute: Callable[[], object], **params) -> object:
+        """
+        Result of compute() for (name, signal, params), computed on first use.
+
+        Args:
+            name: Detector/method name
+            data: Signal the detector runs on
+            compute: Zero-argument callable producing the result
+            **params: Detector parameters that affect the result
+        """
+        key = (name, self.signal_key(data), tuple(sorted(params.items())))
+        if key in self._entries:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._entries[key] = compute()
+        return self._entries[key]
+
+    def peaks(self, data: np.ndarray, **params) -> np.ndarray:
+        """Peak indices from PeakDetector.find_peaks_adaptive(data, **params)"""
+        return self._extrema('peaks', data, params)
+
+    def valleys(self, data: np.ndarray, **params) -> np.ndarray:
+        """Valley indices (peaks of -data)"""
+        return self._extrema('valleys', data, params)
+
+    def _extrema(self, kind: str, data: np.ndarray, params: Dict) -> np.ndarray:
+        def compute():
+            signal_in = data if kind == 'peaks' else -np.asarray(data)
+            indices, _ = self.peak_detector.find_peaks_adaptive(signal_in, **params)
+            indices.flags.writeable = False
+            return indices
+
+        return self.cached(kind, data, compute, **params)
+
+    def clear(self):
+        """Drop every cached entry (start of a new analysis)"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 class EventBoundaryDetector:
     """
     Detect boundaries of events using adaptive methods.
@@ -3958,26 +6535,12 @@ class EventBoundaryDetector:
         # Apply hysteresis
         high_thresh = threshold * threshold_factor
         low_thresh = threshold * 0.5
+        result = hysteresis_segments(data, high_thresh, low_thresh)
 
-        active = False
-        events = []
-        start = None
-
-        for i in range(len(data)):
-            if not active:
-                if data[i] > high_thresh:
-                    active = True
-                    start = i
-            else:
-                if data[i] < low_thresh:
-                    active = False
-                    events.append((start, i))
-
-        # Close final event if still active
-        if active and start is not None:
-            events.append((start, len(data) - 1))
-
-        return events
+        # An event ends at the first sample below the low threshold,
+        # or at the last sample if it is still active
+        ends = np.minimum(result.ends + 1, len(data) - 1)
+        return list(zip(result.starts.tolist(), ends.tolist()))
 
     def detect_zero_crossings(
         self,
@@ -4091,7 +6654,7 @@ class AdaptivePeakDistanceDetector:
     Adaptive peak distance - enforces minimum spacing based on estimated cadence.
 
     Features:
-    - Estimates period/cadence from signal
+    - Estimates period/cadence from signal (spectral peak or autocorrelation)
     - Sets minimum distance = fraction of period
     - Prevents detecting multiple peaks in single cycle
     """
@@ -4100,22 +6663,37 @@ class AdaptivePeakDistanceDetector:
         self,
         fs: float = 30.0,
         period_fraction: float = 0.5,
-        prominence_factor: float = 0.5
+        prominence_factor: float = 0.5,
+        period_method: str = 'spectral'
     ):
         """
         Args:
             fs: Sampling frequency
             period_fraction: min_distance = period * fraction
             prominence_factor: Dynamic prominence factor
+            period_method: 'spectral' or 'autocorrelation' (see PeriodEstimator)
         """
+        if period_method not in PeriodEstimator.METHODS:
+            raise ValueError(
+                f"Unknown method: {period_method}. Choose from {list(PeriodEstimator.METHODS)}"
+            )
+
         self.fs = fs
         self.period_fraction = period_fraction
         self.prominence_factor = prominence_factor
+        self.period_method = period_method
 
-    def detect_peaks(self, sig: np.ndarray) -> PeakDetectionResult:
-        """Detect peaks with adaptive distance"""
+    def detect_peaks(self, sig: np.ndarray, period: Optional[float] = None) -> PeakDetectionResult:
+        """
+        Detect peaks with adaptive distance.
+
+        Args:
+            sig: Input signal
+            period: Precomputed period in frames (see estimate_periods)
+        """
         # Estimate period from dominant frequency
-        period = self._estimate_period(sig)
+        if period is None:
+            period = self._estimate_period(sig)
 
         # Adaptive minimum distance
         min_distance = int(period * self.period_fraction)
@@ -4141,28 +6719,19 @@ class AdaptivePeakDistanceDetector:
 
         return result
 
+    def estimate_periods(self, signals: np.ndarray) -> np.ndarray:
+        """
+        Period in frames of every channel of (n_frames, n_channels), from
+        the dominant frequency above 0.5 Hz (10.0 where undefined).
+        """
+        return PERIOD_ESTIMATOR.periods(
+            np.asarray(signals).reshape(len(signals), -1), self.fs, default=10.0,
+            method=self.period_method, min_freq=0.5
+        )
+
     def _estimate_period(self, sig: np.ndarray) -> float:
         """Estimate period from dominant frequency"""
-        if len(sig) < 10:
-            return 10.0  # Default
-
-        # FFT to find dominant frequency
-        freqs = np.fft.rfftfreq(len(sig), 1/self.fs)
-        fft = np.fft.rfft(sig)
-        power = np.abs(fft) ** 2
-
-        # Find peak (exclude DC and very low frequencies)
-        start_idx = int(0.5 * len(freqs) / (self.fs / 2))
-        dominant_idx = start_idx + np.argmax(power[start_idx:])
-        dominant_freq = freqs[dominant_idx]
-
-        # Period in frames
-        if dominant_freq > 0:
-            period = self.fs / dominant_freq
-        else:
-            period = 10.0
-
-        return period
+        return float(self.estimate_periods(sig)[0])
 
 
 class QuantileThreshold:
@@ -4186,6 +6755,10 @@ class QuantileThreshold:
         """Compute quantile-based threshold"""
         return np.quantile(sig, self.quantile)
 
+    def compute_threshold_batch(self, signals: np.ndarray) -> np.ndarray:
+        """Quantile threshold of every channel of (n_frames, n_channels)"""
+        return np.quantile(signals, self.quantile, axis=0)
+
     def apply_threshold(self, sig: np.ndarray) -> Tuple[np.ndarray, float]:
         """
         Apply quantile threshold.
@@ -4231,43 +6804,45 @@ class HysteresisThreshold:
         """
         Apply hysteresis thresholding.
 
+        Args:
+            sig: Signal (n_frames,) or (n_frames, n_channels); adaptive
+                thresholds are computed per channel
+
         Returns:
             Binary state sequence and thresholds used
         """
-        # Determine thresholds
+        thresholds = self.compute_thresholds(sig)
+        state = _hysteresis_state(sig, thresholds['high_threshold'], thresholds['low_threshold'])
+        return state, thresholds
+
+    def segment(self, sig: np.ndarray) -> Tuple[HysteresisSegments, Dict]:
+        """
+        Apply hysteresis thresholding and extract the ON segments.
+
+        Returns:
+            State with start/end arrays of every ON segment, and thresholds used
+        """
+        thresholds = self.compute_thresholds(sig)
+        result = hysteresis_segments(sig, thresholds['high_threshold'], thresholds['low_threshold'])
+        return result, thresholds
+
+    def compute_thresholds(self, sig: np.ndarray) -> Dict:
+        """High/low thresholds: fixed, or quantiles of sig along axis 0"""
         if self.high_threshold is None:
-            high_thresh = np.quantile(sig, self.quantile_high)
+            high_thresh = np.quantile(sig, self.quantile_high, axis=0)
         else:
             high_thresh = self.high_threshold
 
         if self.low_threshold is None:
-            low_thresh = np.quantile(sig, self.quantile_low)
+            low_thresh = np.quantile(sig, self.quantile_low, axis=0)
         else:
             low_thresh = self.low_threshold
 
-        # Apply hysteresis
-        state = np.zeros(len(sig), dtype=bool)
-        current_state = False
-
-        for i in range(len(sig)):
-            if current_state:
-                # Currently ON - check if drop below low threshold
-                if sig[i] < low_thresh:
-                    current_state = False
-            else:
-                # Currently OFF - check if exceed high threshold
-                if sig[i] > high_thresh:
-                    current_state = True
-
-            state[i] = current_state
-
-        thresholds = {
+        return {
             'high_threshold': high_thresh,
             'low_threshold': low_thresh
         }
 
-        return state, thresholds
-
 
 class CUSUMDetector:
     """
@@ -4302,6 +6877,44 @@ class CUSUMDetector:
         Returns:
             Indices of detected changes and CUSUM values
         """
+        result = self.detect_changes_batch(np.asarray(sig).reshape(-1, 1))
+        return result.change_points, result.cusum[:, 0]
+
+    def detect_changes_batch(self, signals: np.ndarray) -> CUSUMBatchResult:
+        """
+        Detect change points in many signals at once.
+
+        Each column (e.g. every landmark axis, or one recording per column)
+        is normalized by its own mean/std and tracked independently.
+
+        Args:
+            signals: (n_frames, n_signals)
+
+        Returns:
+            CUSUMBatchResult with compact change point arrays
+        """
+        signals = np.asarray(signals, dtype=float)
+        mean = np.mean(signals, axis=0)
+        std = np.std(signals, axis=0)
+        sig_norm = (signals - mean) / (std + 1e-10)
+
+        s_pos, s_neg, detected = _cusum_engine(
+            sig_norm, self.drift, self.threshold, self.reset_after_detection
+        )
+
+        signal_index, change_points = np.nonzero(detected.T)
+        offsets = np.zeros(signals.shape[1] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(signal_index, minlength=signals.shape[1]), out=offsets[1:])
+
+        return CUSUMBatchResult(
+            change_points=change_points,
+            signal_index=signal_index,
+            offsets=offsets,
+            cusum=s_pos + s_neg
+        )
+
+    def _detect_changes_1d(self, sig: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-sample reference loop for one signal"""
         n = len(sig)
 
         # Compute mean and std for normalization
@@ -4372,22 +6985,30 @@ class BaselineDriftCorrection:
         """
         Apply baseline correction.
 
+        Args:
+            sig: Signal (n_frames,) or (n_frames, n_channels); channels are
+                corrected together
+
         Returns:
             Corrected signal and estimated baseline
         """
         if self.method == 'highpass':
             # High-pass filter
-            sos = signal.butter(2, self.cutoff, 'high', fs=self.fs, output='sos')
-            corrected = signal.sosfiltfilt(sos, sig)
+            sos = FILTER_DESIGN_CACHE.get_sos('butter', self.cutoff, self.fs, 2, btype='high')
+            corrected = signal.sosfiltfilt(sos, sig, axis=0)
 
             # Baseline = original - corrected
             baseline = sig - corrected
 
         elif self.method == 'detrend':
-            # Polynomial detrending
+            # Polynomial detrending (polyfit fits every column at once)
             x = np.arange(len(sig))
             coeffs = np.polyfit(x, sig, self.polyorder)
-            baseline = np.polyval(coeffs, x)
+            if np.ndim(sig) > 1:
+                x = x[:, np.newaxis]
+            baseline = np.zeros(np.shape(sig))
+            for c in coeffs:  # Horner, as np.polyval
+                baseline = baseline * x + c
             corrected = sig - baseline
 
         else:
@@ -4398,6 +7019,24 @@ class BaselineDriftCorrection:
         return corrected, baseline
 
 
+@dataclass
+class DynamicThresholdBatchResult:
+    """
+    Peaks, ON segments and change points of every channel, from one
+    drift-corrected pass over (n_frames, n_channels) signals.
+    """
+    corrected: np.ndarray  # Drift-corrected signals
+    baseline: np.ndarray  # Removed baseline
+    peaks: List[PeakDetectionResult]  # One per channel
+    segments: Optional[HysteresisSegments]  # ON segments of all channels
+    thresholds: Dict  # Segmentation thresholds, one value per channel
+    change_points: Optional[CUSUMBatchResult]
+
+    def channel_segments(self, channel: int) -> List[Tuple[int, int]]:
+        """(start, end) ON segments of one channel"""
+        return self.segments.segments(channel) if self.segments is not None else []
+
+
 class DynamicThresholdEngine:
     """
     Complete dynamic thresholding system.
@@ -4472,17 +7111,15 @@ class DynamicThresholdEngine:
             sig_corrected = sig
             baseline = np.zeros_like(sig)
 
-        # Apply hysteresis
+        # Apply hysteresis (segments come back with the state)
         if self.enable_hysteresis:
-            state, thresholds = self.hysteresis.apply(sig_corrected)
+            result, thresholds = self.hysteresis.segment(sig_corrected)
+            segments = result.segments()
         else:
             # Simple threshold
-            threshold, _ = self.quantile_threshold.apply_threshold(sig_corrected)
-            state = threshold
-            thresholds = {'threshold': self.quantile_threshold.compute_threshold(sig_corrected)}
-
-        # Extract segments
-        segments = self._extract_segments(state)
+            state, threshold = self.quantile_threshold.apply_threshold(sig_corrected)
+            thresholds = {'threshold': threshold}
+            segments = self._extract_segments(state)
 
         metadata = {
             'thresholds': thresholds,
@@ -4505,7 +7142,7 @@ class DynamicThresholdEngine:
         else:
             sig_corrected = sig
 
-        # CUSUM detection
+        # CUSUM detection (batched engine, single column)
         change_points, cusum_values = self.cusum.detect_changes(sig_corrected)
 
         metadata = {
@@ -4515,24 +7152,81 @@ class DynamicThresholdEngine:
 
         return change_points, metadata
 
+    def analyze_batch(
+        self,
+        signals: np.ndarray,
+        method: str = 'dynamic_prominence',
+        detect_changes: bool = True
+    ) -> DynamicThresholdBatchResult:
+        """
+        Peaks, hysteresis segments and change points of every channel in one call.
+
+        Drift correction runs once over all channels with the cached
+        high-pass design; segmentation and CUSUM are batched across
+        channels, peak picking runs per channel on the corrected signals.
+        Per channel, the results match detect_peaks_comprehensive,
+        segment_with_hysteresis and detect_phase_transitions.
+
+        Args:
+            signals: (n_frames, n_channels), e.g. all fingertip axes
+            method: Peak method, 'dynamic_prominence' or 'adaptive_distance'
+            detect_changes: Also run CUSUM change detection
+
+        Returns:
+            DynamicThresholdBatchResult
+        """
+        detectors = {
+            'dynamic_prominence': self.prominence_detector,
+            'adaptive_distance': self.adaptive_distance_detector,
+        }
+        if method not in detectors:
+            raise ValueError(f"Unknown method: {method}")
+
+        signals = np.asarray(signals, dtype=float)
+        if signals.ndim == 1:
+            signals = signals[:, np.newaxis]
+
+        # Baseline correction (all channels at once)
+        if self.enable_drift_correction:
+            corrected, baseline = self.drift_corrector.apply(signals)
+        else:
+            corrected = signals
+            baseline = np.zeros_like(signals)
+
+        # Peaks per channel (periods for adaptive distance from one batched FFT)
+        rows = np.ascontiguousarray(corrected.T)
+        if method == 'adaptive_distance':
+            periods = self.adaptive_distance_detector.estimate_periods(corrected)
+            peaks = [
+                self.adaptive_distance_detector.detect_peaks(row, period=period)
+                for row, period in zip(rows, periods)
+            ]
+        else:
+            peaks = [detectors[method].detect_peaks(row) for row in rows]
+
+        # ON segments of every channel
+        if self.enable_hysteresis:
+            segments, thresholds = self.hysteresis.segment(corrected)
+        else:
+            threshold = self.quantile_threshold.compute_threshold_batch(corrected)
+            state = corrected > threshold
+            starts, ends, channel = _state_segments(state)
+            segments = HysteresisSegments(state=state, starts=starts, ends=ends, channel=channel)
+            thresholds = {'threshold': threshold}
+
+        change_points = self.cusum.detect_changes_batch(corrected) if detect_changes else None
+
+        return DynamicThresholdBatchResult(
+            corrected=corrected,
+            baseline=baseline,
+            peaks=peaks,
+            segments=segments,
+            thresholds=thresholds,
+            change_points=change_points
+        )
+
     def _extract_segments(self, state: np.ndarray) -> List[Tuple[int, int]]:
         """Extract continuous ON segments from binary state"""
-        segments = []
-        in_segment = False
-        start = 0
-
-        for i in range(len(state)):
-            if state[i] and not in_segment:
-                # Start of segment
-                start = i
-                in_segment = True
-            elif not state[i] and in_segment:
-                # End of segment
-                segments.append((start, i - 1))
-                in_segment = False
-
-        # Close final segment if needed
-        if in_segment:
-            segments.append((start, len(state) - 1))
-
-        return segments
+        state = np.asarray(state, dtype=bool)
+        segments = run_length_segments(state, valid=state)
+        return list(zip(segments.starts.tolist(), segments.ends.tolist()))
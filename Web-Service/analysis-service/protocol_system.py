@@ -31,7 +31,7 @@ import pickle
 
 # Local imports
 from config import DEFAULT_FPS, EVENT_CATEGORIES, FINGERTIP_INDICES, ProtocolAnalysisConfig, AnalysisOutputConfig, MODEL_PATH, LABEL_ENCODERS_PATH, TRAINING_CONFIG_PATH
-from data_handling import DataNormalizer, FilterFactory, AdaptiveNormalizer
+from data_handling import DataNormalizer, FilterFactory, AdaptiveNormalizer, PeakDetector, PeakIndex, run_length_segments, LandmarkSchema, LANDMARK_SCHEMA_CACHE
 
 
 # =============================================================================
@@ -89,6 +89,7 @@ class ProtocolAnalyzer:
         self.filter_chain = FilterFactory.create_default_chain(fs=fps)
         self.event_detector = EventDetector()
         self.peak_detector = PeakDetector()
+        self.peak_index = PeakIndex(self.peak_detector)
         self.thresholder = AdaptiveThresholder()
 
         # Storage for intermediate results
@@ -96,6 +97,7 @@ class ProtocolAnalyzer:
         self.filtered_data: Optional[np.ndarray] = None
         self.events: Optional[Dict[str, List[DetectedEvent]]] = None
         self.analysis_results: List[AnalysisResult] = []
+        self._landmark_cache: Optional[Tuple[pd.DataFrame, np.ndarray, LandmarkSchema]] = None
 
     def _parse_analysis_outputs(self, outputs_dict: Dict) -> Dict[str, AnalysisOutputConfig]:
         """Parse analysis outputs configuration"""
@@ -152,6 +154,8 @@ class ProtocolAnalyzer:
         # Step 4: Generate analysis outputs based on protocol
         print("\nStep 4: Generating analysis outputs...")
         self.analysis_results = []
+        self.peak_index.clear()
+        self._landmark_cache = None
 
         for output_name, config in self.analysis_outputs.items():
             if config.enabled:
@@ -217,23 +221,11 @@ class ProtocolAnalyzer:
             finger2_idx = FINGERTIP_INDICES['middle_tip']
 
         # Get positions from normalized data
-        finger1_cols = [f"L{finger1_idx}_X", f"L{finger1_idx}_Y", f"L{finger1_idx}_Z"]
-        finger2_cols = [f"L{finger2_idx}_X", f"L{finger2_idx}_Y", f"L{finger2_idx}_Z"]
-
-        # Try alternative column naming
-        if not all(col in self.normalized_data.columns for col in finger1_cols):
-            # Use landmark name based columns
-            landmarks = ['THUMB_TIP', 'INDEX_TIP', 'MIDDLE_TIP']
-            finger1_name = landmarks[0] if 'thumb' in finger_pair else landmarks[finger1_idx]
-            finger2_name = landmarks[1] if 'index' in finger_pair else landmarks[2]
-            finger1_cols = [f"{finger1_name}_X", f"{finger1_name}_Y", f"{finger1_name}_Z"]
-            finger2_cols = [f"{finger2_name}_X", f"{finger2_name}_Y", f"{finger2_name}_Z"]
-
-        pos1 = self.normalized_data[[c for c in finger1_cols if c in self.normalized_data.columns]].values
-        pos2 = self.normalized_data[[c for c in finger2_cols if c in self.normalized_data.columns]].values
+        pos1 = self._get_landmark_position(finger1_idx)
+        pos2 = self._get_landmark_position(finger2_idx)
 
         # Compute aperture distance
-        if pos1.shape[1] == 3 and pos2.shape[1] == 3:
+        if len(pos1) > 0 and len(pos2) > 0:
             aperture = np.linalg.norm(pos1 - pos2, axis=1)
         else:
             # Fallback: use precomputed column
@@ -249,8 +241,8 @@ class ProtocolAnalyzer:
         std_aperture = float(np.std(aperture))
 
         # Detect aperture/closure cycles
-        peaks, _ = self.peak_detector.find_peaks_adaptive(aperture)
-        valleys, _ = self.peak_detector.find_peaks_adaptive(-aperture)
+        peaks = self.peak_index.peaks(aperture)
+        valleys = self.peak_index.valleys(aperture)
 
         n_cycles = min(len(peaks), len(valleys))
 
@@ -282,14 +274,9 @@ class ProtocolAnalyzer:
         tip_idx = FINGERTIP_INDICES[fingertip]
 
         # Extract position
-        pos_cols = [f"L{tip_idx}_X", f"L{tip_idx}_Y", f"L{tip_idx}_Z"]
-
-        # Try alternative naming
-        if not all(col in self.normalized_data.columns for col in pos_cols):
-            tip_name = fingertip.upper().replace('_', '')
-            pos_cols = [f"{tip_name}_X", f"{tip_name}_Y", f"{tip_name}_Z"]
-
-        position = self.normalized_data[[c for c in pos_cols if c in self.normalized_data.columns]].values
+        position = self._get_landmark_position(tip_idx)
+        if len(position) == 0:
+            position = np.empty((len(self.normalized_data), 0))
 
         # Compute velocity
         velocity = np.diff(position, axis=0, prepend=position[0:1])
@@ -317,9 +304,9 @@ class ProtocolAnalyzer:
         hand = params.get('hand', 'right')
 
         tip_idx = FINGERTIP_INDICES[fingertip]
-        pos_cols = [f"L{tip_idx}_X", f"L{tip_idx}_Y", f"L{tip_idx}_Z"]
-
-        position = self.normalized_data[[c for c in pos_cols if c in self.normalized_data.columns]].values
+        position = self._get_landmark_position(tip_idx)
+        if len(position) == 0:
+            position = np.empty((len(self.normalized_data), 0))
 
         # Compute path length
         if position.shape[1] == 3:
@@ -388,25 +375,17 @@ class ProtocolAnalyzer:
         if len(landmark_indices) < 3:
             return np.array([])
 
+        landmarks, schema = self._landmark_array()
         angles = []
 
         for idx in range(len(landmark_indices) - 2):
-            p1_idx = landmark_indices[idx]
-            p2_idx = landmark_indices[idx + 1]
-            p3_idx = landmark_indices[idx + 2]
+            joint = landmark_indices[idx:idx + 3]
 
-            # Get positions
-            p1_cols = [f"L{p1_idx}_X", f"L{p1_idx}_Y", f"L{p1_idx}_Z"]
-            p2_cols = [f"L{p2_idx}_X", f"L{p2_idx}_Y", f"L{p2_idx}_Z"]
-            p3_cols = [f"L{p3_idx}_X", f"L{p3_idx}_Y", f"L{p3_idx}_Z"]
-
-            # Check if columns exist
-            if not all(c in self.normalized_data.columns for c in p1_cols + p2_cols + p3_cols):
+            # Skip joints with missing landmark columns
+            if not all(0 <= i < len(schema.complete) and schema.complete[i] for i in joint):
                 continue
 
-            p1 = self.normalized_data[p1_cols].values
-            p2 = self.normalized_data[p2_cols].values
-            p3 = self.normalized_data[p3_cols].values
+            p1, p2, p3 = (landmarks[:, i, :] for i in joint)
 
             # Compute angle at p2
             v1 = p1 - p2
@@ -429,14 +408,12 @@ class ProtocolAnalyzer:
 
         # Use INDEX_TIP for tremor analysis (wrist is always 0,0,0 after wrist-centering)
         # INDEX_TIP (landmark 8) captures hand tremor more accurately
-        tip_cols = ['INDEX_TIP_X', 'INDEX_TIP_Y', 'INDEX_TIP_Z']
-        if not all(c in self.normalized_data.columns for c in tip_cols):
-            tip_cols = ['L8_X', 'L8_Y', 'L8_Z']
-            if not all(c in self.normalized_data.columns for c in tip_cols):
-                # Fallback to wrist if available (non-wrist-centered data)
-                tip_cols = ['WRIST_X', 'WRIST_Y', 'WRIST_Z']
-
-        position = self.normalized_data[[c for c in tip_cols if c in self.normalized_data.columns]].values
+        position = self._get_landmark_position(FINGERTIP_INDICES['index_tip'])
+        if len(position) == 0:
+            # Fallback to wrist if available (non-wrist-centered data)
+            position = self._get_landmark_position(0)
+        if len(position) == 0:
+            position = np.empty((len(self.normalized_data), 0))
 
         # Compute tremor magnitude
         if position.shape[1] == 3:
@@ -522,7 +499,7 @@ class ProtocolAnalyzer:
             aperture = np.zeros(len(self.normalized_data))
 
         # Detect peaks (cycles)
-        peaks, _ = self.peak_detector.find_peaks_adaptive(aperture)
+        peaks = self.peak_index.peaks(aperture)
 
         if len(peaks) > 1:
             # Compute inter-peak intervals
@@ -556,7 +533,7 @@ class ProtocolAnalyzer:
         else:
             aperture = np.zeros(len(self.normalized_data))
 
-        peaks, _ = self.peak_detector.find_peaks_adaptive(aperture)
+        peaks = self.peak_index.peaks(aperture)
 
         if len(peaks) > 2:
             intervals = np.diff(peaks) / self.fps
@@ -642,33 +619,20 @@ class ProtocolAnalyzer:
             metadata={'hand': hand}
         )
 
+    def _landmark_array(self) -> Tuple[np.ndarray, LandmarkSchema]:
+        """(frames, 21, 3) landmark array of normalized_data, read once per DataFrame"""
+        cached = self._landmark_cache
+        if cached is None or cached[0] is not self.normalized_data:
+            schema = LANDMARK_SCHEMA_CACHE.resolve(self.normalized_data)
+            landmarks = schema.extract(self.normalized_data)
+            landmarks.flags.writeable = False
+            cached = self._landmark_cache = (self.normalized_data, landmarks, schema)
+        return cached[1], cached[2]
+
     def _get_landmark_position(self, landmark_idx: int) -> np.ndarray:
-        """Helper to get landmark position by index or name"""
-        # Mapping from landmark index to name
-        LANDMARK_NAMES_MAP = {
-            0: 'WRIST',
-            1: 'THUMB_CMC', 2: 'THUMB_MCP', 3: 'THUMB_IP', 4: 'THUMB_TIP',
-            5: 'INDEX_MCP', 6: 'INDEX_PIP', 7: 'INDEX_DIP', 8: 'INDEX_TIP',
-            9: 'MIDDLE_MCP', 10: 'MIDDLE_PIP', 11: 'MIDDLE_DIP', 12: 'MIDDLE_TIP',
-            13: 'RING_MCP', 14: 'RING_PIP', 15: 'RING_DIP', 16: 'RING_TIP',
-            17: 'PINKY_MCP', 18: 'PINKY_PIP', 19: 'PINKY_DIP', 20: 'PINKY_TIP',
-        }
-        
-        # Try L-prefixed columns first
-        cols = [f"L{landmark_idx}_X", f"L{landmark_idx}_Y", f"L{landmark_idx}_Z"]
-        available_cols = [c for c in cols if c in self.normalized_data.columns]
-        if len(available_cols) == 3:
-            return self.normalized_data[available_cols].values
-        
-        # Try named columns
-        if landmark_idx in LANDMARK_NAMES_MAP:
-            name = LANDMARK_NAMES_MAP[landmark_idx]
-            cols = [f"{name}_X", f"{name}_Y", f"{name}_Z"]
-            available_cols = [c for c in cols if c in self.normalized_data.columns]
-            if len(available_cols) == 3:
-                return self.normalized_data[available_cols].values
-        
-        return np.array([])
+        """Helper to get landmark position by index (read-only (frames, 3) view, empty if missing)"""
+        landmarks, schema = self._landmark_array()
+        return schema.landmark(landmarks, landmark_idx)
 
     def _compile_results(self) -> Dict[str, Any]:
         """Compile all results into final output dictionary"""
@@ -1290,10 +1254,14 @@ class AdaptiveProtocolAnalyzer(ProtocolAnalyzer):
             # Step 2b: Remove outliers
             print("\nStep 2b: Removing outliers...")
             clean_data, outlier_report = self.outlier_pipeline.apply(landmark_data)
+            stage_totals = {
+                stage: f" ({info['total']} samples)"
+                for stage, info in outlier_report.get('stages', {}).items()
+            }
             print(f"  ✓ Outlier removal applied:")
-            print(f"    - Hampel filter: {'✓' if outlier_report.get('hampel_applied') else '✗'}")
-            print(f"    - MAD gating: {'✓' if outlier_report.get('mad_gating_applied') else '✗'}")
-            print(f"    - Velocity clamping: {'✓' if outlier_report.get('velocity_clamp_applied') else '✗'}")
+            print(f"    - Hampel filter: {'✓' if outlier_report.get('hampel_applied') else '✗'}{stage_totals.get('hampel', '')}")
+            print(f"    - MAD gating: {'✓' if outlier_report.get('mad_gating_applied') else '✗'}{stage_totals.get('mad_gating', '')}")
+            print(f"    - Velocity clamping: {'✓' if outlier_report.get('velocity_clamp_applied') else '✗'}{stage_totals.get('velocity_clamp', '')}")
 
             self.outlier_report = outlier_report
 
@@ -1326,6 +1294,8 @@ class AdaptiveProtocolAnalyzer(ProtocolAnalyzer):
         # Step 4: Generate analysis outputs with adaptive peak detection
         print("\nStep 4: Generating analysis outputs...")
         self.analysis_results = []
+        self.peak_index.clear()
+        self._landmark_cache = None
 
         for output_name, config in self.analysis_outputs.items():
             if config.enabled:
@@ -1382,9 +1352,7 @@ class AdaptiveProtocolAnalyzer(ProtocolAnalyzer):
         aperture = np.linalg.norm(tip1 - tip2, axis=1)
 
         # Adaptive peak detection
-        peak_result = self.dynamic_threshold_engine.detect_peaks_comprehensive(
-            aperture, method='dynamic_prominence'
-        )
+        peak_result = self._adaptive_peaks(aperture, 'dynamic_prominence')
 
         # Compute metrics
         metrics = {
@@ -1429,9 +1397,7 @@ class AdaptiveProtocolAnalyzer(ProtocolAnalyzer):
         aperture = np.linalg.norm(tip1 - tip2, axis=1)
 
         # Adaptive peak detection with period-based minimum distance
-        peak_result = self.dynamic_threshold_engine.detect_peaks_comprehensive(
-            aperture, method='adaptive_distance'
-        )
+        peak_result = self._adaptive_peaks(aperture, 'adaptive_distance')
 
         peaks = peak_result.peak_indices
 
@@ -1467,6 +1433,14 @@ class AdaptiveProtocolAnalyzer(ProtocolAnalyzer):
             metadata={'adaptive_peak_spacing': True}
         )
 
+    def _adaptive_peaks(self, sig: np.ndarray, method: str):
+        """Dynamic-threshold peak detection, memoized in the analysis peak index"""
+        return self.peak_index.cached(
+            'dynamic_threshold', sig,
+            lambda: self.dynamic_threshold_engine.detect_peaks_comprehensive(sig, method=method),
+            method=method
+        )
+
     def _compile_results_adaptive(self) -> Dict[str, Any]:
         """Compile results with adaptive filtering reports"""
         # Get base results
@@ -3702,77 +3676,35 @@ class EventDetector:
         3. Merge events with small gaps
         4. Filter by minimum duration
         """
-        events = []
-        n = len(labels)
-
-        if n == 0:
-            return events
-
-        # Track current event
-        current_label = None
-        current_start = None
-        current_confidences = []
-
-        for i in range(n):
-            label = labels[i]
-            conf = confidences[i]
-            frame = frame_indices[i]
-
-            # Skip "None" labels or low confidence
-            if label in ['None', 'none', 'NONE'] or conf < self.confidence_threshold:
-                # End current event if exists
-                if current_label is not None:
-                    # Check if gap is small enough to continue
-                    if i - current_start <= self.merge_gap:
-                        continue  # Keep event open
-                    else:
-                        # Close event
-                        events.append(self._create_event(
-                            category,
-                            current_label,
-                            frame_indices[current_start],
-                            frame_indices[i - 1],
-                            current_confidences
-                        ))
-                        current_label = None
-                        current_confidences = []
-                continue
+        labels = np.asarray(labels)
+        confidences = np.asarray(confidences)
+        valid = (confidences >= self.confidence_threshold) & ~np.isin(labels, ['None', 'none', 'NONE'])
+
+        # Skipped frames are bridged whatever their label: give each the
+        # label of the last valid frame so only the gap from the event
+        # start can close the event
+        last_valid = np.maximum.accumulate(np.where(valid, np.arange(len(labels)), 0))
+
+        segments = run_length_segments(
+            labels[last_valid],
+            valid=valid,
+            merge_gap=self.merge_gap,
+            min_duration=self.min_event_duration,
+            positions=frame_indices,
+            gap_from_start=True
+        )
 
-            # Start new event or continue current
-            if current_label is None:
-                # Start new event
-                current_label = label
-                current_start = i
-                current_confidences = [conf]
-            elif label == current_label:
-                # Continue event
-                current_confidences.append(conf)
-            else:
-                # Different label - end current, start new
-                events.append(self._create_event(
-                    category,
-                    current_label,
-                    frame_indices[current_start],
-                    frame_indices[i - 1],
-                    current_confidences
-                ))
-                current_label = label
-                current_start = i
-                current_confidences = [conf]
-
-        # Close final event
-        if current_label is not None:
+        events = []
+        for start, end, label in zip(segments.starts, segments.ends, segments.labels):
+            window = slice(start, end + 1)
             events.append(self._create_event(
                 category,
-                current_label,
-                frame_indices[current_start],
-                frame_indices[n - 1],
-                current_confidences
+                str(label),
+                frame_indices[start],
+                frame_indices[end],
+                confidences[window][valid[window]]
             ))
 
-        # Filter by minimum duration
-        events = [e for e in events if e.duration_frames >= self.min_event_duration]
-
         return events
 
     def _create_event(
@@ -0,0 +1,149 @@
+"""
+Segment Decoding
+Run-length decoding of per-frame label and boolean state sequences
+Depends on numpy only, so it can be shared by data_handling, protocol_system
+and the standalone LSTM engine
+"""
+
+# Standard library imports
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# Third-party imports
+import numpy as np
+
+
+@dataclass
+class LabelSegments:
+    """
+    Segments of a per-frame label sequence.
+
+    Segment k spans frames starts[k]..ends[k] (inclusive) with label
+    labels[k]; mean_confidence[k] averages its valid frames.
+    """
+    starts: np.ndarray
+    ends: np.ndarray
+    labels: np.ndarray
+    mean_confidence: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
+def run_length_segments(
+    labels: np.ndarray,
+    valid: Optional[np.ndarray] = None,
+    confidences: Optional[np.ndarray] = None,
+    merge_gap: int = 0,
+    min_duration: float = 1,
+    positions: Optional[np.ndarray] = None,
+    gap_from_start: bool = False
+) -> LabelSegments:
+    """
+    Decode a per-frame label (or boolean state) sequence into segments.
+
+    A segment is a run of valid frames sharing one label. Runs of the same
+    label separated by at most merge_gap invalid frames are merged; a valid
+    frame with a different label always ends the segment. Everything is
+    found from the valid frames' label changes and index gaps, with no
+    per-frame loop.
+
+    With gap_from_start the merge gap is instead counted from the segment
+    start, as in the original frame-by-frame event loops: a segment starts
+    at a valid frame and takes every following frame that carries its
+    label and is either valid or at most merge_gap frames after the start.
+    Invalid frames are compared by label too, and bridged ones count
+    towards the segment end. Next-valid/next-invalid lookups are
+    precomputed, so the loop runs once per segment rather than per frame.
+
+    Args:
+        labels: Label per frame (any comparable dtype)
+        valid: Frames that may belong to a segment (default: all); pass the
+            state itself to extract the ON runs of a boolean array
+        confidences: Confidence per frame (default: 1.0)
+        merge_gap: Largest run of invalid frames bridged inside a segment
+            (with gap_from_start: furthest offset from the segment start at
+            which an invalid frame is still bridged)
+        min_duration: Shortest segment kept, end - start + 1 in position units
+        positions: Frame number of each sample used for durations
+            (default: sample index)
+        gap_from_start: Measure merge_gap from the segment start
+
+    Returns:
+        LabelSegments in frame order
+    """
+    labels = np.asarray(labels)
+    n = len(labels)
+    valid = np.ones(n, dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+
+    frames = np.flatnonzero(valid)
+    if frames.size == 0:
+        empty = np.array([], dtype=np.intp)
+        return LabelSegments(starts=empty, ends=empty, labels=labels[empty],
+                             mean_confidence=np.array([]))
+
+    if gap_from_start:
+        starts, ends = _segments_from_start(labels, valid, merge_gap)
+        segment_labels = labels[starts]
+
+        # Mean over the valid frames of each segment (the start is always valid)
+        frame_conf = (np.ones(n) if confidences is None
+                      else np.where(valid, np.asarray(confidences, dtype=float), 0.0))
+        conf_sum = np.concatenate(([0.0], np.cumsum(frame_conf)))
+        valid_count = np.concatenate(([0], np.cumsum(valid)))
+        mean_confidence = ((conf_sum[ends + 1] - conf_sum[starts])
+                           / (valid_count[ends + 1] - valid_count[starts]))
+    else:
+        frame_labels = labels[frames]
+        first = np.flatnonzero(np.concatenate((
+            [True],
+            (np.diff(frames) - 1 > merge_gap) | (frame_labels[1:] != frame_labels[:-1])
+        )))
+        last = np.append(first[1:] - 1, frames.size - 1)
+        starts, ends = frames[first], frames[last]
+        segment_labels = frame_labels[first]
+
+        if confidences is None:
+            mean_confidence = np.ones(len(first))
+        else:
+            frame_conf = np.asarray(confidences, dtype=float)[frames]
+            mean_confidence = np.add.reduceat(frame_conf, first) / (last - first + 1)
+
+    pos = np.arange(n) if positions is None else np.asarray(positions)
+    keep = pos[ends] - pos[starts] + 1 >= min_duration
+
+    return LabelSegments(
+        starts=starts[keep],
+        ends=ends[keep],
+        labels=segment_labels[keep],
+        mean_confidence=mean_confidence[keep]
+    )
+
+
+def _segments_from_start(
+    labels: np.ndarray,
+    valid: np.ndarray,
+    merge_gap: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Start and end (inclusive) indices for run_length_segments(gap_from_start=True)"""
+    n = len(labels)
+    idx = np.arange(n)
+
+    # Smallest index >= k that is valid / invalid (n = none)
+    next_valid = np.append(np.minimum.accumulate(np.where(valid, idx, n)[::-1])[::-1], n)
+    next_invalid = np.append(np.minimum.accumulate(np.where(valid, n, idx)[::-1])[::-1], n)
+
+    # Last index of the run of identical labels containing each frame
+    run_starts = np.flatnonzero(np.concatenate(([True], labels[1:] != labels[:-1])))
+    run_end = np.repeat(np.append(run_starts[1:], n) - 1, np.diff(np.append(run_starts, n)))
+
+    starts, ends = [], []
+    i = next_valid[0]
+    while i < n:
+        stop = next_invalid[min(i + max(merge_gap, 0) + 1, n)]
+        end = min(stop - 1, run_end[i])
+        starts.append(i)
+        ends.append(end)
+        i = next_valid[end + 1]
+
+    return np.array(starts, dtype=np.intp), np.array(ends, dtype=np.intp)
@@ -0,0 +1,182 @@
+"""
+Tests for segments.run_length_segments
+
+The gap_from_start decoder replaces the frame-by-frame loops of
+EventDetector._extract_events (protocol_system.py) and
+LSTMEngine._extract_events (lstm_engine.py); both loops are kept here
+verbatim as references and compared on random label sequences.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from segments import run_length_segments  # noqa: E402
+
+NONE_LABELS = ['None', 'none', 'NONE']
+
+
+def event_detector_loop(labels, confidences, confidence_threshold, merge_gap, min_duration):
+    """Original EventDetector._extract_events loop: (start, end, label, valid confidences)"""
+    events = []
+    n = len(labels)
+    current_label = None
+    current_start = None
+    current_confidences = []
+
+    for i in range(n):
+        label = labels[i]
+        conf = confidences[i]
+
+        if label in NONE_LABELS or conf < confidence_threshold:
+            if current_label is not None:
+                if i - current_start <= merge_gap:
+                    continue
+                else:
+                    events.append((current_start, i - 1, current_label, current_confidences))
+                    current_label = None
+                    current_confidences = []
+            continue
+
+        if current_label is None:
+            current_label = label
+            current_start = i
+            current_confidences = [conf]
+        elif label == current_label:
+            current_confidences.append(conf)
+        else:
+            events.append((current_start, i - 1, current_label, current_confidences))
+            current_label = label
+            current_start = i
+            current_confidences = [conf]
+
+    if current_label is not None:
+        events.append((current_start, n - 1, current_label, current_confidences))
+
+    return [e for e in events if e[1] - e[0] + 1 >= min_duration]
+
+
+def event_detector_segments(labels, confidences, confidence_threshold, merge_gap, min_duration):
+    """run_length_segments called as EventDetector._extract_events calls it"""
+    labels = np.asarray(labels)
+    valid = (confidences >= confidence_threshold) & ~np.isin(labels, NONE_LABELS)
+    last_valid = np.maximum.accumulate(np.where(valid, np.arange(len(labels)), 0))
+
+    segments = run_length_segments(
+        labels[last_valid],
+        valid=valid,
+        merge_gap=merge_gap,
+        min_duration=min_duration,
+        gap_from_start=True
+    )
+    return [
+        (start, end, label, list(confidences[start:end + 1][valid[start:end + 1]]))
+        for start, end, label in zip(segments.starts, segments.ends, segments.labels)
+    ]
+
+
+def lstm_loop(event_names, confidences, confidence_threshold, merge_gap, min_duration):
+    """Original LSTMEngine._extract_events loop: (start, end, label, confidences)"""
+    events = []
+    high_conf_mask = confidences >= confidence_threshold
+
+    i = 0
+    while i < len(event_names):
+        if not high_conf_mask[i]:
+            i += 1
+            continue
+
+        event_name = event_names[i]
+        start_idx = i
+        confidences_segment = [confidences[i]]
+
+        j = i + 1
+        while j < len(event_names):
+            if event_names[j] == event_name and high_conf_mask[j]:
+                confidences_segment.append(confidences[j])
+                j += 1
+            elif event_names[j] == event_name and (j - start_idx) <= merge_gap:
+                confidences_segment.append(confidences[j])
+                j += 1
+            else:
+                break
+
+        end_idx = j - 1
+        if end_idx - start_idx + 1 >= min_duration:
+            events.append((start_idx, end_idx, event_name, confidences_segment))
+        i = j
+
+    return events
+
+
+def lstm_segments(event_names, confidences, confidence_threshold, merge_gap, min_duration):
+    """run_length_segments called as LSTMEngine._extract_events calls it"""
+    segments = run_length_segments(
+        np.asarray(event_names),
+        valid=confidences >= confidence_threshold,
+        merge_gap=merge_gap,
+        min_duration=min_duration,
+        gap_from_start=True
+    )
+    return [
+        (start, end, event_names[start], list(confidences[start:end + 1]))
+        for start, end in zip(segments.starts, segments.ends)
+    ]
+
+
+def random_labels(rng, vocabulary):
+    n = int(rng.integers(0, 60))
+    labels = rng.choice(vocabulary, size=n)
+    if rng.random() < 0.5:
+        # Longer runs, closer to real per-frame predictions
+        labels = np.repeat(labels[:max(1, n // 4)], 4)[:n]
+    return labels, rng.random(len(labels))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_event_detector_matches_original_loop(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(400):
+        labels, confidences = random_labels(rng, ['A', 'B', 'None', 'none'])
+        args = (confidences, 0.4, int(rng.integers(0, 6)), int(rng.integers(1, 6)))
+        assert event_detector_segments(labels, *args) == event_detector_loop(list(labels), *args)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_lstm_matches_original_loop(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(400):
+        labels, confidences = random_labels(rng, ['A', 'B', 'C'])
+        args = (confidences, 0.5, int(rng.integers(0, 6)), int(rng.integers(1, 6)))
+        assert lstm_segments(labels, *args) == lstm_loop(labels, *args)
+
+
+def test_gap_counted_from_segment_start():
+    labels = np.array(['A'] * 8 + ['None'] + ['A'] * 8)
+    valid = labels != 'None'
+
+    from_start = run_length_segments(labels, valid=valid, merge_gap=3, min_duration=5,
+                                     gap_from_start=True)
+    assert list(zip(from_start.starts, from_start.ends)) == [(0, 7), (9, 16)]
+
+    between_runs = run_length_segments(labels, valid=valid, merge_gap=3, min_duration=5)
+    assert list(zip(between_runs.starts, between_runs.ends)) == [(0, 16)]
+
+
+def test_mean_confidence_uses_valid_frames():
+    labels = np.array(['A', 'A', 'A', 'A'])
+    confidences = np.array([0.9, 0.1, 0.7, 0.2])
+    segments = run_length_segments(labels, valid=confidences >= 0.5, confidences=confidences,
+                                   merge_gap=2, gap_from_start=True)
+    assert list(zip(segments.starts, segments.ends)) == [(0, 2)]
+    assert segments.mean_confidence[0] == pytest.approx(0.8)
+
+
+def test_boolean_runs():
+    state = np.array([False, True, True, False, True, False, False, True])
+    runs = run_length_segments(state, valid=state)
+    assert list(zip(runs.starts, runs.ends)) == [(1, 2), (4, 4), (7, 7)]
@@ -14,6 +14,7 @@ from config import (
     LSTM_MODEL_PATH, LABEL_ENCODER_DIR, EVENT_CATEGORIES,
     SEQUENCE_LENGTH, DEFAULT_FPS
 )
+from segments import run_length_segments
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -385,51 +386,32 @@ class LSTMEngine:
         if not np.any(high_conf_mask):
             return events
         
-        # Find continuous segments
-        i = 0
-        while i < len(event_names):
-            if not high_conf_mask[i]:
-                i += 1
-                continue
-            
-            # Start of event
-            event_name = event_names[i]
-            start_idx = i
-            start_frame = frame_indices[i]
-            confidences_segment = [confidences[i]]
-            
-            # Continue while same event and high confidence
-            j = i + 1
-            while j < len(event_names):
-                if event_names[j] == event_name and high_conf_mask[j]:
-                    confidences_segment.append(confidences[j])
-                    j += 1
-                elif event_names[j] == event_name and (j - start_idx) <= merge_gap_frames:
-                    # Merge if within gap threshold
-                    confidences_segment.append(confidences[j])
-                    j += 1
-                else:
-                    break
-            
-            end_idx = j - 1
+        # Continuous segments, low-confidence frames bridged within the merge gap
+        segments = run_length_segments(
+            np.asarray(event_names),
+            valid=high_conf_mask,
+            merge_gap=merge_gap_frames,
+            min_duration=min_duration_frames,
+            positions=frame_indices,
+            gap_from_start=True
+        )
+        
+        for start_idx, end_idx in zip(segments.starts, segments.ends):
+            start_frame = frame_indices[start_idx]
             end_frame = frame_indices[end_idx]
             
-            # Check minimum duration
-            duration_frames = end_frame - start_frame + 1
-            if duration_frames >= min_duration_frames:
-                avg_confidence = np.mean(confidences_segment)
-                duration_seconds = duration_frames / self.fps
-                
-                events.append(EventPrediction(
-                    category=category,
-                    event_type=event_name,
-                    confidence=float(avg_confidence),
-                    frame_start=int(start_frame),
-                    frame_end=int(end_frame),
-                    duration_seconds=float(duration_seconds)
-                ))
+            # Bridged frames count towards the average confidence
+            avg_confidence = np.mean(confidences[start_idx:end_idx + 1])
+            duration_seconds = (end_frame - start_frame + 1) / self.fps
             
-            i = j
+            events.append(EventPrediction(
+                category=category,
+                event_type=event_names[start_idx],
+                confidence=float(avg_confidence),
+                frame_start=int(start_frame),
+                frame_end=int(end_frame),
+                duration_seconds=float(duration_seconds)
+            ))
         
         return events
     
@@ -460,18 +442,8 @@ class LSTMEngine:
             frame_indices = np.arange(len(sequences)) + SEQUENCE_LENGTH // 2
         
         # Create simple events for high motion segments
-        i = 0
-        while i < len(high_motion):
-            if not high_motion[i]:
-                i += 1
-                continue
-            
-            start_frame = frame_indices[i]
-            j = i
-            while j < len(high_motion) and high_motion[j]:
-                j += 1
-            
-            end_frame = frame_indices[j - 1]
+        runs = run_length_segments(high_motion, valid=high_motion)
+        for start_frame, end_frame in zip(frame_indices[runs.starts], frame_indices[runs.ends]):
             duration_seconds = (end_frame - start_frame + 1) / self.fps
             
             if duration_seconds >= 0.1:  # Minimum 100ms
@@ -483,8 +455,6 @@ class LSTMEngine:
                     frame_end=int(end_frame),
                     duration_seconds=float(duration_seconds)
                 ))
-            
-            i = j
         
         return events
     